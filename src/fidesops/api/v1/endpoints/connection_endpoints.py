@@ -27,6 +27,7 @@ from fidesops.schemas.connection_configuration.connection_secrets import (
 )
 
 from fidesops.service.connectors import get_connector
+from fidesops.service.connectors.client_registry import client_registry
 from fidesops.schemas.api import BulkUpdateFailed
 from fidesops.schemas.connection_configuration.connection_config import (
     ConnectionConfigurationResponse,
@@ -217,6 +218,8 @@ def connection_status(
             test_status=ConnectionTestStatus.failed,
             failure_reason=str(exc),
         )
+    finally:
+        connector.close()
 
     logger.info(f"Connection test {status.value} on {connection_config.key}")
     connection_config.update_test_status(test_status=status, db=db)
@@ -254,6 +257,8 @@ async def put_connection_config_secrets(
     # Save validated secrets, regardless of whether they've been verified.
     logger.info(f"Updating connection config secrets for '{connection_key}'")
     connection_config.save(db=db)
+    # Close any client still connected with the old secrets
+    client_registry.invalidate(connection_config.id)
 
     msg = f"Secrets updated for ConnectionConfig with key: {connection_key}."
     if verify:
@@ -31,6 +31,7 @@ from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
 from fidesops.models.datasetconfig import (
     DatasetConfig,
     convert_dataset_to_graph,
+    invalidate_dataset_graph_cache,
     to_graph_field,
 )
 from fidesops.schemas.api import (
@@ -189,6 +190,8 @@ def patch_datasets(
                 )
             )
 
+    if created_or_updated:
+        invalidate_dataset_graph_cache()
     return BulkPutDataset(
         succeeded=created_or_updated,
         failed=failed,
@@ -315,3 +318,4 @@ def delete_dataset(
         f"Deleting dataset '{fides_key}' for connection '{connection_config.key}'"
     )
     dataset_config.delete(db)
+    invalidate_dataset_graph_cache()
@@ -4,7 +4,7 @@ import csv
 import logging
 from collections import defaultdict
 from datetime import date, datetime
-from starlette.responses import StreamingResponse
+from starlette.responses import JSONResponse, StreamingResponse
 from typing import List, Optional, Union, DefaultDict, Dict, Set, Callable, Any
 
 from fastapi import APIRouter, Body, Depends, Security, HTTPException
@@ -32,6 +32,8 @@ from fidesops.api.v1.urn_registry import (
     PRIVACY_REQUEST_RESUME,
     PRIVACY_REQUEST_APPROVE,
     PRIVACY_REQUEST_DENY,
+    PRIVACY_REQUEST_CANCEL,
+    PRIVACY_REQUEST_TRACE,
 )
 from fidesops.common_exceptions import (
     TraversalError,
@@ -43,7 +45,7 @@ from fidesops.graph.graph import DatasetGraph
 from fidesops.graph.traversal import Traversal
 from fidesops.models.client import ClientDetail
 from fidesops.models.connectionconfig import ConnectionConfig
-from fidesops.models.datasetconfig import DatasetConfig
+from fidesops.models.datasetconfig import DatasetConfig, get_dataset_graph
 from fidesops.models.policy import Policy, ActionType, PolicyPreWebhook
 from fidesops.models.privacy_request import (
     ExecutionLog,
@@ -66,13 +68,15 @@ from fidesops.schemas.privacy_request import (
     BulkReviewResponse,
     ReviewPrivacyRequestIds,
 )
+from fidesops.schemas.shared_schemas import FidesOpsKey
 from fidesops.service.masking.strategy.masking_strategy_factory import (
     get_strategy,
 )
 from fidesops.service.privacy_request.request_runner_service import PrivacyRequestRunner
-from fidesops.task.graph_task import collect_queries, EMPTY_REQUEST
+from fidesops.task.graph_task import collect_queries, policy_targets, EMPTY_REQUEST
 from fidesops.task.task_resources import TaskResources
 from fidesops.util.cache import FidesopsRedis
+from fidesops.util.tracing import get_trace
 from fidesops.util.oauth_util import verify_oauth_client, verify_callback_oauth
 
 logger = logging.getLogger(__name__)
@@ -414,6 +418,27 @@ def get_request_status_logs(
     )
 
 
+@router.get(
+    PRIVACY_REQUEST_TRACE,
+    dependencies=[Security(verify_oauth_client, scopes=[scopes.PRIVACY_REQUEST_READ])],
+)
+def get_request_trace(
+    privacy_request_id: str,
+    *,
+    db: Session = Depends(deps.get_db),
+) -> JSONResponse:
+    """Download the timing spans recorded for each collection as the privacy request ran, in Chrome trace
+    format. The file can be opened in chrome://tracing, Perfetto or speedscope."""
+    get_privacy_request_or_error(db, privacy_request_id)
+
+    logger.info(f"Exporting trace for privacy request {privacy_request_id}")
+    response = JSONResponse(get_trace(privacy_request_id))
+    response.headers[
+        "Content-Disposition"
+    ] = f"attachment; filename=privacy_request_{privacy_request_id}_trace.json"
+    return response
+
+
 @router.put(
     REQUEST_PREVIEW,
     status_code=200,
@@ -424,9 +449,21 @@ def get_request_preview_queries(
     *,
     db: Session = Depends(deps.get_db),
     dataset_keys: Optional[List[str]] = Body(None),
+    policy_key: Optional[FidesOpsKey] = None,
 ) -> List[DryRunDatasetResponse]:
     """Returns dry run queries given a list of dataset ids.  If a dataset references another dataset, both dataset
-    keys must be in the request body."""
+    keys must be in the request body.
+
+    If a policy_key is given, the collections that the policy does not need are marked as pruned. These are
+    left out of privacy requests when PRUNE_UNTARGETED_COLLECTIONS is set."""
+    policy: Optional[Policy] = None
+    if policy_key:
+        policy = Policy.get_by(db=db, field="key", value=policy_key)
+        if not policy:
+            raise HTTPException(
+                status_code=HTTP_404_NOT_FOUND,
+                detail=f"No policy with key '{policy_key}'",
+            )
     dataset_configs: List[DatasetConfig] = []
     if not dataset_keys:
         dataset_configs = DatasetConfig.all(db=db)
@@ -453,9 +490,7 @@ def get_request_preview_queries(
         ]
 
         try:
-            dataset_graph: DatasetGraph = DatasetGraph(
-                *[dataset.get_graph() for dataset in dataset_configs]
-            )
+            dataset_graph: DatasetGraph = get_dataset_graph(db, dataset_configs)
         except ValidationError as exc:
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST,
@@ -470,12 +505,16 @@ def get_request_preview_queries(
             traversal,
             TaskResources(EMPTY_REQUEST, Policy(), connection_configs),
         )
+        pruned: Set[CollectionAddress] = (
+            traversal.pruned_addresses(policy_targets(policy)) if policy else set()
+        )
         return [
             DryRunDatasetResponse(
                 collectionAddress=CollectionAddressResponse(
                     dataset=key.dataset, collection=key.collection
                 ),
                 query=value,
+                pruned=key in pruned,
             )
             for key, value in queries.items()
         ]
@@ -526,9 +565,15 @@ def resume_privacy_request(
 
 
 def review_privacy_request(
-    db: Session, cache: FidesopsRedis, request_ids: List[str], process_request: Callable
+    db: Session,
+    cache: FidesopsRedis,
+    request_ids: List[str],
+    process_request: Callable,
+    from_statuses: Optional[Set[PrivacyRequestStatus]] = None,
 ) -> BulkReviewResponse:
-    """Helper method shared between the approve and deny privacy request endpoints"""
+    """Helper method shared between the approve, deny and cancel privacy request endpoints.
+    By default, only pending privacy requests can be reviewed."""
+    from_statuses = from_statuses or {PrivacyRequestStatus.pending}
     succeeded: List[PrivacyRequest] = []
     failed: List[Dict[str, Any]] = []
 
@@ -543,7 +588,7 @@ def review_privacy_request(
             )
             continue
 
-        if privacy_request.status != PrivacyRequestStatus.pending:
+        if privacy_request.status not in from_statuses:
             failed.append(
                 {
                     "message": f"Cannot transition status",
@@ -632,3 +677,37 @@ def deny_privacy_request(
     return review_privacy_request(
         db, cache, privacy_requests.request_ids, _process_request
     )
+
+
+@router.patch(
+    PRIVACY_REQUEST_CANCEL,
+    status_code=200,
+    response_model=BulkReviewResponse,
+    dependencies=[Security(verify_oauth_client, scopes=[PRIVACY_REQUEST_REVIEW])],
+)
+def cancel_privacy_request(
+    *,
+    db: Session = Depends(deps.get_db),
+    cache: FidesopsRedis = Depends(deps.get_cache),
+    privacy_requests: ReviewPrivacyRequestIds,
+) -> BulkReviewResponse:
+    """Cancel a list of privacy requests that have not yet finished and/or report failure.
+
+    Privacy requests that are running stop before starting any more of their collections."""
+
+    def _process_request(privacy_request: PrivacyRequest, _: FidesopsRedis) -> None:
+        """Method for how to process requests - canceled"""
+        privacy_request.cancel_processing(db)
+
+    return review_privacy_request(
+        db,
+        cache,
+        privacy_requests.request_ids,
+        _process_request,
+        {
+            PrivacyRequestStatus.pending,
+            PrivacyRequestStatus.approved,
+            PrivacyRequestStatus.in_processing,
+            PrivacyRequestStatus.paused,
+        },
+    )
@@ -4,7 +4,10 @@ from fastapi.params import Security
 from starlette.status import HTTP_404_NOT_FOUND, HTTP_400_BAD_REQUEST
 from sqlalchemy.orm import Session
 
-from fidesops.models.datasetconfig import DatasetConfig
+from fidesops.models.datasetconfig import (
+    DatasetConfig,
+    invalidate_dataset_graph_cache,
+)
 from fidesops.schemas.shared_schemas import FidesOpsKey
 
 from fidesops.api import deps
@@ -96,6 +99,7 @@ def patch_saas_config(
         f"Updating SaaS config '{saas_config.fides_key}' on connection config '{connection_config.key}'"
     )
     connection_config.update(db, data={"saas_config": saas_config.dict()})
+    invalidate_dataset_graph_cache()
     return connection_config.saas_config
 
 
@@ -170,3 +174,4 @@ def delete_saas_config(
 
     logger.info(f"Deleting SaaS config for connection '{connection_config.key}'")
     connection_config.update(db, data={"saas_config": None})
+    invalidate_dataset_graph_cache()
@@ -34,8 +34,10 @@ POLICY_DETAIL = "/policy/{policy_key}"
 PRIVACY_REQUESTS = "/privacy-request"
 PRIVACY_REQUEST_APPROVE = "/privacy-request/administrate/approve"
 PRIVACY_REQUEST_DENY = "/privacy-request/administrate/deny"
+PRIVACY_REQUEST_CANCEL = "/privacy-request/administrate/cancel"
 REQUEST_STATUS_LOGS = "/privacy-request/{privacy_request_id}/log"
 PRIVACY_REQUEST_RESUME = "/privacy-request/{privacy_request_id}/resume"
+PRIVACY_REQUEST_TRACE = "/privacy-request/{privacy_request_id}/trace"
 REQUEST_PREVIEW = "/privacy-request/preview"
 
 # Rule URLs
@@ -2,6 +2,7 @@
 import click
 
 from fidesops.main import start_webserver
+from fidesops.tasks.worker import start_worker
 
 
 @click.group()
@@ -18,3 +19,18 @@ def webserver(ctx: click.Context) -> None:
     Runs any pending DB migrations and starts the webserver.
     """
     start_webserver()
+
+
+@cli.command()
+@click.option(
+    "--concurrency",
+    type=int,
+    default=None,
+    help="The number of privacy requests to run at once. Defaults to WORKER_CONCURRENCY.",
+)
+@click.pass_context
+def worker(ctx: click.Context, concurrency: int) -> None:
+    """
+    Runs any pending DB migrations and starts running queued privacy requests.
+    """
+    start_worker(concurrency)
@@ -107,6 +107,18 @@ class PrivacyRequestPaused(BaseException):
     """Halt Instruction Received on Privacy Request"""
 
 
+class PrivacyRequestCanceled(BaseException):
+    """The Privacy Request was canceled while it was running"""
+
+
+class PrivacyRequestTimeout(BaseException):
+    """The Privacy Request ran past its deadline"""
+
+
+class PrivacyRequestLeaseLost(BaseException):
+    """The worker running the Privacy Request lost its lease, so it may be run by another worker"""
+
+
 class SaaSConfigNotFoundException(FidesopsException):
     """Custom Exception - SaaS Config Not Found"""
 
@@ -145,11 +157,25 @@ class ClientUnsuccessfulException(FidesopsException):
 
     def __init__(self, status_code: int):
         super().__init__(message=f"Client call failed with status code '{status_code}'")
+        self.status_code = status_code
 
 
 class NoSuchStrategyException(ValueError):
     """Exception for when a masking strategy does not exist"""
 
 
+class RetryTask(Exception):
+    """Raised by a task of a task graph to be run again, with the same inputs, once `delay`
+    seconds have passed. Other tasks of the graph keep running in the meantime."""
+
+    def __init__(self, delay: float):
+        super().__init__(f"Retrying in {delay} seconds")
+        self.delay = delay
+
+
+class NoSuchExecutorException(ValueError):
+    """Exception for when a graph executor does not exist"""
+
+
 class MissingConfig(Exception):
     """Custom exception for when no valid configuration file is provided."""
@@ -92,6 +92,24 @@ class ExecutionSettings(FidesSettings):
     TASK_RETRY_COUNT: int
     TASK_RETRY_DELAY: int  # In seconds
     TASK_RETRY_BACKOFF: int
+    TASK_EXECUTOR: str = "thread"
+    TASK_MAX_PARALLELISM: int = 4
+    TASK_MAX_COROUTINES: int = 1000
+    TASK_CHUNK_SIZE: int = 1000
+    TASK_TIMEOUT_SECONDS: int = 0
+    QUERY_TIMEOUT_SECONDS: int = 0
+    REQUEST_TIMEOUT_SECONDS: int = 0
+    EXECUTION_LOG_BATCH_SIZE: int = 100
+    EXECUTION_LOG_FLUSH_SECONDS: int = 2
+    PRUNE_UNTARGETED_COLLECTIONS: bool = False
+    MASKING_BATCH_SIZE: int = 500
+    MASKING_COMMIT_SIZE: int = 5000
+    MAX_IN_LIST_SIZE: int = 1000
+    SQL_STREAM_RESULTS: bool = False
+    WORKER_ENABLED: bool = False
+    WORKER_CONCURRENCY: int = 2
+    WORKER_LEASE_SECONDS: int = 60
+    WORKER_BATCH_SIZE: int = 1
     REQUIRE_MANUAL_REQUEST_APPROVAL: bool = False
     MASKING_STRICT: bool = True
 
@@ -280,6 +298,24 @@ CONFIG_KEY_ALLOWLIST = {
         "TASK_RETRY_COUNT",
         "TASK_RETRY_DELAY",
         "TASK_RETRY_BACKOFF",
+        "TASK_EXECUTOR",
+        "TASK_MAX_PARALLELISM",
+        "TASK_MAX_COROUTINES",
+        "TASK_CHUNK_SIZE",
+        "TASK_TIMEOUT_SECONDS",
+        "QUERY_TIMEOUT_SECONDS",
+        "REQUEST_TIMEOUT_SECONDS",
+        "EXECUTION_LOG_BATCH_SIZE",
+        "EXECUTION_LOG_FLUSH_SECONDS",
+        "PRUNE_UNTARGETED_COLLECTIONS",
+        "MASKING_BATCH_SIZE",
+        "MASKING_COMMIT_SIZE",
+        "MAX_IN_LIST_SIZE",
+        "SQL_STREAM_RESULTS",
+        "WORKER_ENABLED",
+        "WORKER_CONCURRENCY",
+        "WORKER_LEASE_SECONDS",
+        "WORKER_BATCH_SIZE",
         "REQUIRE_MANUAL_REQUEST_APPROVAL",
     ],
 }
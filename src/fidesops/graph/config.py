@@ -90,7 +90,7 @@ from fidesops.graph.data_type import (
     DataType,
 )
 from fidesops.schemas.shared_schemas import FidesOpsKey
-from fidesops.util.collection_util import merge_dicts
+from fidesops.util.collection_util import merge_dicts, Row
 from fidesops.util.querytoken import QueryToken
 
 DatasetAddress = str
@@ -187,6 +187,41 @@ class FieldPath:
         return FieldPath(*path_str.split("."))
 
 
+QueryMatcher = Callable[[Row], List[Any]]
+"""Consolidates the values along a compiled target_path from a row"""
+
+
+def compile_query_matcher(target_path: FieldPath) -> QueryMatcher:
+    """
+    Compiles a target_path into a function that consolidates the values along it from a row, as
+    consolidate_query_matches does, without building a new FieldPath at each level it descends.
+
+    :param target_path: FieldPath to applicable field
+    :return: A function of a row that returns the consolidated flattened list of matched values.
+    """
+    levels = target_path.levels
+    depth = len(levels)
+
+    def collect(value: Any, level: int, flattened_matches: List) -> None:
+        if isinstance(value, list):
+            for elem in value:
+                collect(elem, level, flattened_matches)
+
+        elif isinstance(value, dict):
+            if level < depth and levels[level] in value:
+                collect(value[levels[level]], level + 1, flattened_matches)
+
+        else:
+            flattened_matches.append(value)
+
+    def query_matcher(row: Row) -> List[Any]:
+        flattened_matches: List = []
+        collect(row, 0, flattened_matches)
+        return flattened_matches
+
+    return query_matcher
+
+
 class FieldAddress:
     """The representation of a field location in the graph, specified by
     (data dataset name, collection name, field name, subfield name, ... )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 from collections import defaultdict
 from typing import Tuple, Set, Dict, Optional, List, Callable
@@ -225,6 +226,28 @@ class DatasetGraph:
             for node in nodes
             for field_path, seed_address in node.collection.identities().items()
         }
+        self._fingerprint: Optional[str] = None
+
+    @property
+    def fingerprint(self) -> str:
+        """A digest of everything that determines how this graph is traversed: its collections, their
+        ordering constraints, its edges and its identity fields. Graphs with the same fingerprint produce
+        the same traversal for the same identity keys."""
+        if self._fingerprint is None:
+            parts: List[str] = []
+            for address in sorted(self.nodes, key=str):
+                node = self.nodes[address]
+                parts.append(
+                    f"{address} after {sorted(map(str, node.collection.after))} {sorted(node.dataset.after)}"
+                )
+            parts.extend(sorted(repr(edge) for edge in self.edges))
+            parts.extend(
+                sorted(
+                    f"{address}={seed}" for address, seed in self.identity_keys.items()
+                )
+            )
+            self._fingerprint = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+        return self._fingerprint
 
     @property
     def data_category_field_mapping(
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Any, Tuple, Set, Dict, Callable, cast
-
-import pydash.collections
+import threading
+from dataclasses import dataclass
+from collections import Counter, OrderedDict, defaultdict
+from types import MappingProxyType
+from typing import (
+    List,
+    Any,
+    Tuple,
+    Set,
+    Dict,
+    Callable,
+    FrozenSet,
+    Mapping,
+    Optional,
+    Hashable,
+    Sequence,
+)
 
 from fidesops.common_exceptions import TraversalError
 from fidesops.graph.config import (
@@ -14,11 +28,13 @@ from fidesops.graph.config import (
     ROOT_COLLECTION_ADDRESS,
     FieldPath,
     Field,
+    QueryMatcher,
+    compile_query_matcher,
 )
 from fidesops.graph.graph import Node, Edge, DatasetGraph
 from fidesops.util.logger import NotPii
-from fidesops.util.matching_queue import MatchingQueue
-from fidesops.util.collection_util import append, Row
+from fidesops.util.collection_util import append, append_unique, partition, Row
+from fidesops.util.tracing import count, QUERY_GENERATION
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +42,10 @@ logger = logging.getLogger(__name__)
 """A type expressing a single row of data from (any) collection"""
 Datastore = Dict[CollectionAddress, List[Row]]
 """A type expressing retrieved rows of data from a specified collection"""
+COLLECTION_FIELD_PATH_MAP = Mapping[
+    CollectionAddress, Sequence[Tuple[FieldPath, FieldPath]]
+]
+"""(foreign field path, local field path) pairs for each collection with edges into a node"""
 
 
 class TraversalNode:
@@ -43,11 +63,22 @@ class TraversalNode:
             CollectionAddress, List[Tuple[TraversalNode, FieldPath, FieldPath]]
         ] = {}
         self.is_terminal_node = False
+        self._plan: Optional[NodePlan] = None
+
+    @property
+    def plan(self) -> NodePlan:
+        """This traversal_node's compiled NodePlan, built on first use"""
+        if self._plan is None:
+            self._plan = NodePlan.compile(self)
+        return self._plan
 
     def add_child(self, child_node: TraversalNode, edge: Edge) -> None:
         """Add other as a child to this traversal_node along the provided edge."""
         addresses = edge.split_by_address(self.address)  # (traversal_node -> other)
         if addresses:
+            # the edges of both nodes have changed
+            self._plan = None
+            child_node._plan = None  # pylint: disable=protected-access
             self_field_address, other_field_address = addresses
             append(
                 self.children,
@@ -87,39 +118,55 @@ class TraversalNode:
         }
 
     @property
-    def query_field_paths(self) -> Set[FieldPath]:
+    def query_field_paths(self) -> FrozenSet[FieldPath]:
         """
         All of the possible field paths that we can query for possible filter values.
         These are field paths that are the ends of incoming edges.
         """
-        return {edge.f2.field_path for edge in self.incoming_edges()}
+        return self.plan.query_field_paths
 
     def typed_filtered_values(self, input_data: Dict[str, List[Any]]) -> Dict[str, Any]:
         """
         Return a filtered list of key/value sets of data items that are both in
         the list of incoming edge fields, and contain data in the input data set.
 
-        The values are cast based on field types, if those types are specified.
+        The values are cast based on field types, if those types are specified. Values that become
+        duplicates once cast, such as "1" and 1 for an integer field, are only returned once, and
+        are counted with the other duplicate inputs.
         """
-        out = {}
+        out: Dict[str, List[Any]] = {}
+        seen: Dict[str, Set[Hashable]] = {}
+        duplicates = 0
+        query_fields = self.plan.query_fields
         for key, values in input_data.items():
-            path: FieldPath = FieldPath.parse(key)
-            field: Field = self.node.collection.field(path)
-            if field and path in self.query_field_paths and isinstance(values, list):
+            if key in query_fields and isinstance(values, list):
+                _, field = query_fields[key]
                 cast_values = [field.cast(v) for v in values]
-                filtered = list(filter(lambda x: x is not None, cast_values))
-                if filtered:
-                    out[key] = filtered
+                duplicates += append_unique(
+                    out, seen, key, [v for v in cast_values if v is not None]
+                )
+        if duplicates:
+            logger.info(
+                f"Skipped {duplicates} input values into {self.address} that were duplicates once cast."
+            )
+            count("duplicate_inputs", QUERY_GENERATION, cast=duplicates)
         return out
 
-    def can_run_given(self, remaining_node_keys: Set[CollectionAddress]) -> bool:
+    def can_run_given(
+        self,
+        remaining_node_keys: Set[CollectionAddress],
+        remaining_datasets: Optional[Dict[str, int]] = None,
+    ) -> bool:
         """True if finished_node_keys covers all the nodes that this traversal_node is waiting for.  If
         all nodes this traversal_node is waiting for have finished, it's ok for this traversal_node to run.
+
+        remaining_datasets, the number of remaining nodes in each dataset, can be passed in by callers that
+        keep count, rather than being worked out from remaining_node_keys on each call.
         """
-        if self.node.collection.after.intersection(
-            remaining_node_keys
-        ) or self.node.dataset.after.intersection(
-            {k.dataset for k in remaining_node_keys}
+        if remaining_datasets is None:
+            remaining_datasets = Counter(k.dataset for k in remaining_node_keys)
+        if self.node.collection.after.intersection(remaining_node_keys) or any(
+            remaining_datasets.get(dataset) for dataset in self.node.dataset.after
         ):
             return False
         return True
@@ -154,6 +201,123 @@ class TraversalNode:
         }
 
 
+@dataclass(frozen=True)
+class NodePlan:  # pylint: disable=too-many-instance-attributes
+    """What the tasks and query configs of a traversal_node need to know about its collection and its edges.
+
+    A plan is compiled once per traversal_node and shared, rather than flattening the collection's fields
+    and rebuilding its edges on every call. As it is shared, its mappings are read-only views and its
+    sequences are tuples."""
+
+    # every field of the collection, nested fields included
+    field_dict: Mapping[FieldPath, Field]
+    top_level_field_dict: Mapping[FieldPath, Field]
+    primary_key_field_paths: Mapping[FieldPath, Field]
+    field_paths_by_category: Mapping[str, Tuple[FieldPath, ...]]
+    incoming_edges: FrozenSet[Edge]
+    outgoing_edges: FrozenSet[Edge]
+    incoming_edges_by_collection: Mapping[CollectionAddress, Tuple[Edge, ...]]
+    # the collections this node reads its input from
+    input_keys: Tuple[CollectionAddress, ...]
+    # the top-level fields of this collection that its children read
+    output_keys: FrozenSet[str]
+    # the fields at the ends of incoming edges, that input values can be queried against
+    query_field_paths: FrozenSet[FieldPath]
+    # the same (path, field) pairs, keyed by their string path as used in node input. Each field casts
+    # its input values.
+    query_fields: Mapping[str, Tuple[FieldPath, Field]]
+    # incoming (foreign, local) field paths, all together and split into independent and grouped fields
+    incoming_field_path_maps: Tuple[
+        COLLECTION_FIELD_PATH_MAP, COLLECTION_FIELD_PATH_MAP
+    ]
+    grouped_incoming_field_path_maps: Tuple[
+        COLLECTION_FIELD_PATH_MAP, COLLECTION_FIELD_PATH_MAP
+    ]
+    # for each collection with edges into the node, a (matcher, local string path, grouped) triple per edge.
+    # The matcher is compiled from the foreign field path, and consolidates its values from a row.
+    input_matchers: Mapping[
+        CollectionAddress, Tuple[Tuple[QueryMatcher, str, bool], ...]
+    ]
+
+    @staticmethod
+    def compile(traversal_node: TraversalNode) -> NodePlan:
+        """Build the plan for a traversal_node, once it has been linked to its parents and children"""
+        collection: Collection = traversal_node.node.collection
+        field_dict = collection.field_dict
+        incoming_edges = frozenset(traversal_node.incoming_edges())
+        incoming_edges_by_collection: Dict[CollectionAddress, Tuple[Edge, ...]] = {
+            col_addr: tuple(edge_list)
+            for col_addr, edge_list in partition(
+                incoming_edges, lambda e: e.f1.collection_address()
+            ).items()
+        }
+        query_field_paths = frozenset(edge.f2.field_path for edge in incoming_edges)
+        grouped_fields = collection.grouped_inputs or set()
+
+        def field_path_map(keep: Callable[[str], bool]) -> COLLECTION_FIELD_PATH_MAP:
+            return MappingProxyType(
+                {
+                    col_addr: tuple(
+                        (edge.f1.field_path, edge.f2.field_path)
+                        for edge in edge_list
+                        if keep(edge.f2.field_path.string_path)
+                    )
+                    for col_addr, edge_list in incoming_edges_by_collection.items()
+                }
+            )
+
+        outgoing_edges = frozenset(traversal_node.outgoing_edges())
+        return NodePlan(
+            field_dict=MappingProxyType(field_dict),
+            top_level_field_dict=MappingProxyType(collection.top_level_field_dict),
+            primary_key_field_paths=MappingProxyType(
+                {path: field for path, field in field_dict.items() if field.primary_key}
+            ),
+            field_paths_by_category=MappingProxyType(
+                {
+                    category: tuple(field_paths)
+                    for category, field_paths in collection.field_paths_by_category.items()
+                }
+            ),
+            incoming_edges=incoming_edges,
+            outgoing_edges=outgoing_edges,
+            incoming_edges_by_collection=MappingProxyType(incoming_edges_by_collection),
+            input_keys=tuple(sorted(incoming_edges_by_collection.keys())),
+            output_keys=frozenset(
+                edge.f1.field_path.levels[0] for edge in outgoing_edges
+            ),
+            query_field_paths=query_field_paths,
+            query_fields=MappingProxyType(
+                {
+                    path.string_path: (path, field_dict[path])
+                    for path in query_field_paths
+                    if path in field_dict
+                }
+            ),
+            incoming_field_path_maps=(
+                field_path_map(lambda string_path: True),
+                field_path_map(lambda string_path: False),
+            ),
+            grouped_incoming_field_path_maps=(
+                field_path_map(lambda string_path: string_path not in grouped_fields),
+                field_path_map(lambda string_path: string_path in grouped_fields),
+            ),
+            input_matchers=MappingProxyType(
+                {
+                    col_addr: tuple(
+                        (
+                            compile_query_matcher(edge.f1.field_path),
+                            edge.f2.field_path.string_path,
+                            edge.f2.field_path.string_path in grouped_fields,
+                        )
+                        for edge in edge_list
+                    )
+                    for col_addr, edge_list in incoming_edges_by_collection.items()
+                }
+            ),
+        )
+
+
 def artificial_traversal_node(address: CollectionAddress) -> TraversalNode:
     """generate an 'artificial' traversal_node pointing to the given address. This is used to
     generate artificial root and termination nodes that correspond to just an address, but
@@ -165,6 +329,32 @@ def artificial_traversal_node(address: CollectionAddress) -> TraversalNode:
     return TraversalNode(node)
 
 
+@dataclass(frozen=True)
+class TraversalPlan:
+    """The order in which a traversal visits its nodes, the parent/child links it makes between them and
+    its terminal nodes.
+
+    A plan depends only on the shape of the graph and on which identity keys are seeded, not on the
+    identity values, so it is compiled once and shared by every Traversal of the same graph and keys."""
+
+    order: Tuple[CollectionAddress, ...]
+    # (parent address, child address, edge) for each link, in the order they were made
+    links: Tuple[Tuple[CollectionAddress, CollectionAddress, Edge], ...]
+    end_nodes: Tuple[CollectionAddress, ...]
+
+
+MAX_CACHED_PLANS = 128
+# The least recently used plan is evicted first
+_cached_plans: OrderedDict[Tuple[str, FrozenSet[str]], TraversalPlan] = OrderedDict()
+_cached_plans_lock = threading.Lock()
+
+
+def clear_cached_plans() -> None:
+    """Forget all compiled traversal plans"""
+    with _cached_plans_lock:
+        _cached_plans.clear()
+
+
 class Traversal:
     """Handling for a single reified traversal of a graph based on input (seed) data."""
 
@@ -186,10 +376,11 @@ class Traversal:
         self.traversal_node_dict = {k: TraversalNode(v) for k, v in graph.nodes.items()}
         self.edges: Set[Edge] = graph.edges.copy()
         self.root_node = artificial_traversal_node(ROOT_COLLECTION_ADDRESS)
+        seed_field_addresses = self.extract_seed_field_addresses()
         for (
             start_field_address,
             seed_key,
-        ) in self.extract_seed_field_addresses().items():
+        ) in seed_field_addresses.items():
             self.edges.add(
                 Edge(
                     FieldAddress(
@@ -201,15 +392,53 @@ class Traversal:
                 )
             )
 
-        self.__verify_traversal()
-
-    def __verify_traversal(self) -> None:
-        """Verify that a valid traversal exists. This method simply assembles a traversal
-        and raises an error on any traversal failure conditions."""
-        self.traverse(
-            {self.root_node.address: [self.seed_data]},
-            lambda n, m: logger.info("Traverse %s", NotPii(n.address)),
-        )
+        plan_key = (graph.fingerprint, frozenset(seed_field_addresses.values()))
+        with _cached_plans_lock:
+            plan = _cached_plans.get(plan_key)
+            if plan:
+                _cached_plans.move_to_end(plan_key)
+        if plan:
+            self.__link_nodes(plan)
+        else:
+            # raises a TraversalError if no valid traversal exists
+            plan = self.__compile_plan()
+            with _cached_plans_lock:
+                _cached_plans[plan_key] = plan
+                while len(_cached_plans) > MAX_CACHED_PLANS:
+                    _cached_plans.popitem(last=False)
+        self.plan: TraversalPlan = plan
+
+    def traversal_node(self, address: CollectionAddress) -> TraversalNode:
+        """The traversal_node at the given address, including the root"""
+        if address == ROOT_COLLECTION_ADDRESS:
+            return self.root_node
+        return self.traversal_node_dict[address]
+
+    def pruned_addresses(
+        self, targeted: Callable[[TraversalNode], bool]
+    ) -> Set[CollectionAddress]:
+        """The addresses of the traversal_nodes that can be left out of the traversal: those that are not
+        targeted, and do not provide input, directly or indirectly, to any traversal_node that is."""
+        needed: Set[CollectionAddress] = set()
+        stack: List[CollectionAddress] = [
+            address for address, tn in self.traversal_node_dict.items() if targeted(tn)
+        ]
+        while stack:
+            address = stack.pop()
+            if address in needed or address == ROOT_COLLECTION_ADDRESS:
+                continue
+            needed.add(address)
+            stack.extend(self.traversal_node_dict[address].plan.input_keys)
+        return set(self.traversal_node_dict) - needed
+
+    def __link_nodes(self, plan: TraversalPlan) -> None:
+        """Link this traversal's nodes to one another as described by a previously compiled plan"""
+        for parent_address, child_address, edge in plan.links:
+            self.traversal_node(parent_address).add_child(
+                self.traversal_node(child_address), edge
+            )
+        for address in plan.end_nodes:
+            self.traversal_node(address).is_terminal_node = True
 
     def traversal_map(
         self,
@@ -235,30 +464,46 @@ class Traversal:
 
         return {str(k): v for k, v in db.items()}, traversal_ends
 
-    def traverse(  # pylint: disable=R0914
+    def traverse(
         self,
         environment: Dict[CollectionAddress, Any],
         node_run_fn: Callable[[TraversalNode, Dict[CollectionAddress, Any]], None],
     ) -> List[CollectionAddress]:
-        """Traverse and call run() on each traversal_node in turn. T represents an environment that
+        """Call node_run_fn on each traversal_node in traversal order. The environment
         can provide or collect values as each traversal_node is run.
 
         Returns a list of termination traversal_node addresses so that we can take action on completed
         traversal.
+        """
+        if environment:
+            logger.info(
+                "starting traversal",
+            )
+        for address in self.plan.order:
+            node_run_fn(self.traversal_node(address), environment)
 
+        end_nodes = list(self.plan.end_nodes)
+        if environment:
+            logger.debug(f"Found {len(end_nodes)} end nodes: {end_nodes}")
+        return end_nodes
 
+    def __compile_plan(self) -> TraversalPlan:  # pylint: disable=R0914, R0912
+        """Traverse the graph, linking each traversal_node to its children, and record the result as a plan.
 
         We define the root traversal_node as a traversal_node whose children are any nodes that have identity (seed)
         data.
         We start with
         - a queue holding only the root traversal_node.
-        - a (copied) set of all of the edges in the graph.
+        - a (copied) set of all of the edges in the graph, indexed by the collections at their ends.
 
         - Pop the first eligible traversal_node from the queue.
-        - call the passed in callable node_run_function on this traversal_node. Mark this traversal_node as "finished"
+        - Mark this traversal_node as "finished"
         - Delete all edges from any finished nodes to this traversal_node.
         - put all of this nodes children in the queue.
 
+        The queue is keyed by address and edges are looked up through the index, so that each step only
+        touches the edges of the traversal_node being run, and traversal scales with the size of the graph.
+
         Some nodes have conditions, like "don't run me until after traversal_node X". When we pop a value from
         the queue, we are taking this into account. If the queue contains nodes, but none of them are
         eligible (e.g. Node A can't run until after B, and traversal_node B that can't run until after A)
@@ -268,75 +513,95 @@ class Traversal:
         that case they are unreachable.
 
         """
-        if environment:
-            logger.info(
-                "starting traversal",
-            )
+        order: List[CollectionAddress] = []
+        links: List[Tuple[CollectionAddress, CollectionAddress, Edge]] = []
         remaining_node_keys: Set[CollectionAddress] = set(
             self.traversal_node_dict.keys()
         )
-        finished_nodes: dict[CollectionAddress, TraversalNode] = {}
-        running_node_queue: MatchingQueue[TraversalNode] = MatchingQueue(self.root_node)
+        remaining_datasets: Dict[str, int] = Counter(
+            address.dataset for address in remaining_node_keys
+        )
+        # finished nodes, and the order in which they finished
+        finished_nodes: Dict[CollectionAddress, TraversalNode] = {}
+        finished_order: Dict[CollectionAddress, int] = {}
+        # nodes waiting to run, in the order they were reached
+        ready_nodes: OrderedDict[CollectionAddress, TraversalNode] = OrderedDict(
+            [(self.root_node.address, self.root_node)]
+        )
         remaining_edges: Set[Edge] = self.edges.copy()
-        while not running_node_queue.is_empty():
+        # the remaining edges with an end in each collection
+        edges_by_address: Dict[CollectionAddress, Set[Edge]] = defaultdict(set)
+        for edge in remaining_edges:
+            edges_by_address[edge.f1.collection_address()].add(edge)
+            edges_by_address[edge.f2.collection_address()].add(edge)
 
+        while ready_nodes:
             # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
-            n = running_node_queue.pop_first_match(
-                lambda x: x.can_run_given(remaining_node_keys)
+            n: Optional[TraversalNode] = next(
+                (
+                    tn
+                    for tn in ready_nodes.values()
+                    if tn.can_run_given(remaining_node_keys, remaining_datasets)
+                ),
+                None,
             )
-
-            if n:
-                node_run_fn(n, environment)
-                # delete all edges between the traversal_node that's just run and any completed nodes
-                for finished_node_address, finished_node in finished_nodes.items():
-                    completed_edges = Edge.delete_edges(
-                        remaining_edges,
-                        finished_node_address,
-                        cast(TraversalNode, n).address,
-                    )
-                    # append edges that end in this traversal_node
-                    for edge in filter(
-                        lambda _edge: _edge.ends_with_collection(
-                            cast(TraversalNode, n).address
-                        ),
-                        completed_edges,
-                    ):
-                        # note, this will not work for self-reference
-                        finished_node.add_child(n, edge)
-                # next edges = take all edges including n that are _not_ in edges_from_completed_nodes
-                # in the form (field_address_this, field_address_foreign)
-
-                edges_to_children = pydash.collections.filter_(
-                    [
-                        e.split_by_address(cast(TraversalNode, n).address)
-                        for e in remaining_edges
-                        if e.contains(n.address)
-                    ]
-                )
-                if not edges_to_children:
-                    n.is_terminal_node = True
-
-                # child traversal_node addresses are the address portion of the above
-                child_node_addresses = {
-                    a[1].collection_address() for a in edges_to_children if a
-                }
-                for nxt_address in child_node_addresses:
-                    # only add the next traversal_node to the queue if it is not already there (no duplicates)
-                    running_node_queue.push_if_new(
-                        self.traversal_node_dict[nxt_address]
-                    )
-                finished_nodes[n.address] = n
-                remaining_node_keys.difference_update({n.address})
-            else:
-                # traversal traversal_node dict diff finished nodes
+            if not n:
                 logger.error(
-                    f"Node could not be reached given specified ordering [{','.join([str(tn.address) for tn in running_node_queue.data])}]"
+                    f"Node could not be reached given specified ordering [{','.join([str(address) for address in ready_nodes])}]"
                 )
                 raise TraversalError(
                     f"""Node could not be reached given the specified ordering:
-                    [{','.join([str(tn.address) for tn in running_node_queue.data])}]"""
+                    [{','.join([str(address) for address in ready_nodes])}]"""
                 )
 
+            del ready_nodes[n.address]
+            order.append(n.address)
+            logger.info("Traverse %s", NotPii(n.address))
+            # delete all edges between any completed nodes and the traversal_node that's just run
+            completed_edges: Dict[CollectionAddress, Set[Edge]] = defaultdict(set)
+            for edge in edges_by_address[n.address]:
+                other_address = (
+                    edge.f2.collection_address()
+                    if edge.f1.collection_address() == n.address
+                    else edge.f1.collection_address()
+                )
+                if other_address in finished_nodes and edge.spans(
+                    other_address, n.address
+                ):
+                    completed_edges[other_address].add(edge)
+            for finished_node_address in sorted(
+                completed_edges, key=finished_order.__getitem__
+            ):
+                finished_node = finished_nodes[finished_node_address]
+                for edge in completed_edges[finished_node_address]:
+                    remaining_edges.discard(edge)
+                    edges_by_address[edge.f1.collection_address()].discard(edge)
+                    edges_by_address[edge.f2.collection_address()].discard(edge)
+                    # append edges that end in this traversal_node
+                    if edge.ends_with_collection(n.address):
+                        # note, this will not work for self-reference
+                        finished_node.add_child(n, edge)
+                        links.append((finished_node_address, n.address, edge))
+
+            # child traversal_node addresses are the far ends of the remaining edges leading out of n
+            child_node_addresses: Set[CollectionAddress] = set()
+            for edge in edges_by_address[n.address]:
+                addresses = edge.split_by_address(n.address)
+                if addresses:
+                    child_node_addresses.add(addresses[1].collection_address())
+            if not child_node_addresses:
+                n.is_terminal_node = True
+
+            for nxt_address in sorted(child_node_addresses):
+                # only add the next traversal_node to the queue if it is not already there (no duplicates)
+                if nxt_address not in ready_nodes:
+                    ready_nodes[nxt_address] = self.traversal_node_dict[nxt_address]
+            finished_nodes[n.address] = n
+            finished_order[n.address] = len(order)
+            if n.address in remaining_node_keys:
+                remaining_node_keys.remove(n.address)
+                remaining_datasets[n.address.dataset] -= 1
+
         # error if there are nodes that have not been visited
         if remaining_node_keys:
             logger.error(
@@ -354,9 +619,10 @@ class Traversal:
                 f"Some edges were not reachable: {','.join([str(x) for x in remaining_edges])}"
             )
 
-        end_nodes = [
-            tn.address for tn in finished_nodes.values() if tn.is_terminal_node
-        ]
-        if environment:
-            logger.debug(f"Found {len(end_nodes)} end nodes: {end_nodes}")
-        return end_nodes
+        return TraversalPlan(
+            order=tuple(order),
+            links=tuple(links),
+            end_nodes=tuple(
+                tn.address for tn in finished_nodes.values() if tn.is_terminal_node
+            ),
+        )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import enum
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from sqlalchemy import (
     Column,
@@ -10,6 +10,7 @@ from sqlalchemy import (
     String,
     DateTime,
     Boolean,
+    Integer,
 )
 
 from sqlalchemy.dialects.postgresql import JSONB
@@ -87,12 +88,30 @@ class ConnectionConfig(Base):
     )  # Type bytea in the db
     last_test_timestamp = Column(DateTime(timezone=True))
     last_test_succeeded = Column(Boolean)
+    # The most queries a single privacy request may run against this connection at once.
+    # If unset, only the overall TASK_MAX_PARALLELISM limit applies.
+    max_concurrent_queries = Column(Integer, nullable=True)
+    # Connection pool settings of SQL connections. If unset, SQLAlchemy's defaults apply.
+    pool_size = Column(Integer, nullable=True)
+    max_overflow = Column(Integer, nullable=True)
+    pool_recycle = Column(Integer, nullable=True)  # In seconds
+    pool_pre_ping = Column(Boolean, nullable=True)
 
     # only applicable to ConnectionConfigs of connection type saas
     saas_config = Column(
         MutableDict.as_mutable(JSONB), index=False, unique=False, nullable=True
     )
 
+    def pool_options(self) -> Dict[str, Any]:
+        """Returns the pool settings that have been set, as keyword arguments to SQLAlchemy's create_engine"""
+        options = {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+        return {name: value for name, value in options.items() if value is not None}
+
     def get_saas_config(self) -> Optional[SaaSConfig]:
         """Returns a SaaSConfig object from a yaml config"""
         return SaaSConfig(**self.saas_config) if self.saas_config else None
@@ -112,8 +131,13 @@ class ConnectionConfig(Base):
         self.save(db)
 
     def delete(self, db: Session) -> Optional[Base]:
-        """Hard deletes datastores that map this ConnectionConfig."""
+        """Hard deletes datastores that map this ConnectionConfig, and closes any client held for it."""
+        from fidesops.service.connectors.client_registry import (  # pylint: disable=import-outside-toplevel
+            client_registry,
+        )
+
         for dataset in self.datasets:
             dataset.delete(db=db)
 
+        client_registry.invalidate(self.id)
         return super().delete(db=db)
@@ -1,5 +1,8 @@
 import logging
-from typing import Dict, Any, Set, Optional
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, FrozenSet, List, Set, Optional, Tuple
 
 from boto3 import Session
 from sqlalchemy import (
@@ -22,6 +25,7 @@ from fidesops.graph.config import (
     generate_field,
 )
 from fidesops.graph.data_type import parse_data_type_string
+from fidesops.graph.graph import DatasetGraph
 from fidesops.models.connectionconfig import ConnectionConfig
 from fidesops.schemas.dataset import FidesopsDataset, FidesopsDatasetField
 from fidesops.schemas.shared_schemas import FidesOpsKey
@@ -219,3 +223,77 @@ def convert_dataset_to_graph(
         connection_key=connection_key,
         after=after,
     )
+
+
+# (dataset config id, dataset config updated_at, connection config id, connection config updated_at)
+DatasetGraphSignature = FrozenSet[
+    Tuple[str, Optional[datetime], str, Optional[datetime]]
+]
+
+MAX_CACHED_DATASET_GRAPHS = 16
+# The least recently used graph is evicted first
+_dataset_graphs: OrderedDict[DatasetGraphSignature, DatasetGraph] = OrderedDict()
+_dataset_graphs_lock = threading.Lock()
+
+
+def invalidate_dataset_graph_cache() -> None:
+    """Drop this process's cached DatasetGraphs. Other processes notice the change through the
+    updated_at timestamps of the changed configs."""
+    with _dataset_graphs_lock:
+        _dataset_graphs.clear()
+
+
+def get_dataset_graph(
+    db: Session, dataset_configs: Optional[List[DatasetConfig]] = None
+) -> DatasetGraph:
+    """
+    Return the DatasetGraph built from the given DatasetConfigs, or from all DatasetConfigs if
+    none are given.
+
+    Graphs are cached per process and keyed on the ids and updated_at timestamps of the
+    DatasetConfigs and their ConnectionConfigs, so a graph is only rebuilt once one of
+    those rows changes.
+    """
+    if dataset_configs is None:
+        signature: DatasetGraphSignature = frozenset(
+            db.query(
+                DatasetConfig.id,
+                DatasetConfig.updated_at,
+                ConnectionConfig.id,
+                ConnectionConfig.updated_at,
+            )
+            .join(ConnectionConfig, DatasetConfig.connection_config)
+            .all()
+        )
+    else:
+        signature = frozenset(
+            (
+                dataset_config.id,
+                dataset_config.updated_at,
+                dataset_config.connection_config.id,
+                dataset_config.connection_config.updated_at,
+            )
+            for dataset_config in dataset_configs
+        )
+
+    with _dataset_graphs_lock:
+        graph = _dataset_graphs.get(signature)
+        if graph:
+            _dataset_graphs.move_to_end(signature)
+    if graph:
+        return graph
+
+    logger.info("Building dataset graph")
+    graph = DatasetGraph(
+        *[
+            dataset_config.get_graph()
+            for dataset_config in (
+                DatasetConfig.all(db=db) if dataset_configs is None else dataset_configs
+            )
+        ]
+    )
+    with _dataset_graphs_lock:
+        _dataset_graphs[signature] = graph
+        while len(_dataset_graphs) > MAX_CACHED_DATASET_GRAPHS:
+            _dataset_graphs.popitem(last=False)
+    return graph
@@ -44,6 +44,7 @@ from fidesops.schemas.redis_cache import PrivacyRequestIdentity
 from fidesops.util.cache import (
     get_all_cache_keys_for_privacy_request,
     get_cache,
+    get_cancel_cache_key,
     get_identity_cache_key,
     FidesopsRedis,
     get_encryption_cache_key,
@@ -63,6 +64,7 @@ class PrivacyRequestStatus(EnumType):
     in_processing = "in_processing"
     complete = "complete"
     paused = "paused"
+    canceled = "canceled"
     error = "error"
 
 
@@ -266,6 +268,41 @@ class PrivacyRequest(Base):
             self.started_processing_at = datetime.utcnow()
             self.save(db=db)
 
+    def cancel_processing(self, db: Session) -> None:
+        """Mark privacy request as canceled, and signal any run of it in progress to stop"""
+        self.update(
+            db,
+            data={
+                "status": PrivacyRequestStatus.canceled,
+                "finished_processing_at": datetime.utcnow(),
+            },
+        )
+        get_cache().set_with_autoexpire(get_cancel_cache_key(self.id), "true")
+
+    def cancel_requested(self) -> bool:
+        """Whether this privacy request has been canceled since it started running"""
+        return bool(get_cache().exists(get_cancel_cache_key(self.id)))
+
+    def finish_processing(self, db: Session, status: PrivacyRequestStatus) -> bool:
+        """Mark privacy request as finished with the given status, unless it has been canceled since
+        it was loaded. The check and update are made in one statement, so a cancel made while the
+        privacy request was running is never overwritten. Returns whether it was updated."""
+        # Discard any unsaved changes, so that they are not written over a cancel
+        db.expire(self)
+        updated = (
+            db.query(PrivacyRequest)
+            .filter(
+                PrivacyRequest.id == self.id,
+                PrivacyRequest.status != PrivacyRequestStatus.canceled,
+            )
+            .update(
+                {"status": status, "finished_processing_at": datetime.utcnow()},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        return bool(updated)
+
     def error_processing(self, db: Session) -> None:
         """Mark privacy request as errored, and note time processing was finished"""
         self.update(
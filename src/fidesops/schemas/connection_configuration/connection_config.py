@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import Extra, BaseModel
+from pydantic import Extra, BaseModel, conint
 
 from fidesops.schemas.api import BulkResponse, BulkUpdateFailed
 from fidesops.schemas.shared_schemas import FidesOpsKey
@@ -19,6 +19,11 @@ class CreateConnectionConfiguration(BaseModel):
     key: Optional[FidesOpsKey]
     connection_type: ConnectionType
     access: AccessLevel
+    max_concurrent_queries: Optional[conint(ge=1)]  # type: ignore
+    pool_size: Optional[conint(ge=1)]  # type: ignore
+    max_overflow: Optional[conint(ge=0)]  # type: ignore
+    pool_recycle: Optional[conint(ge=1)]  # type: ignore
+    pool_pre_ping: Optional[bool]
 
     class Config:
         """Restrict adding other fields through this schema and set orm_mode to support mapping to ConnectionConfig"""
@@ -43,6 +48,11 @@ class ConnectionConfigurationResponse(BaseModel):
     updated_at: Optional[datetime]
     last_test_timestamp: Optional[datetime]
     last_test_succeeded: Optional[bool]
+    max_concurrent_queries: Optional[int]
+    pool_size: Optional[int]
+    max_overflow: Optional[int]
+    pool_recycle: Optional[int]
+    pool_pre_ping: Optional[bool]
 
     class Config:
         """Set orm_mode to support mapping to ConnectionConfig"""
@@ -254,3 +254,5 @@ class DryRunDatasetResponse(BaseSchema):
 
     collectionAddress: CollectionAddressResponse
     query: Optional[str]
+    # Whether the policy given to the dry run does not need this collection
+    pruned: bool = False
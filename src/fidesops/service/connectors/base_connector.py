@@ -1,13 +1,15 @@
 import logging
 from abc import abstractmethod, ABC
-from typing import Any, Dict, List, Optional, TypeVar, Generic
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TypeVar, Generic
 
 from fidesops.core.config import config
 from fidesops.graph.traversal import TraversalNode
 from fidesops.models.connectionconfig import ConnectionConfig, ConnectionTestStatus
 from fidesops.models.policy import Policy
 from fidesops.models.privacy_request import PrivacyRequest
+from fidesops.service.connectors.client_registry import client_registry
 from fidesops.service.connectors.query_config import QueryConfig
+from fidesops.util.async_util import to_thread
 from fidesops.util.collection_util import Row
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,11 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
     connector.test_connection()
     """
 
+    # Whether this connector's client is held in the process-wide client registry, and shared with
+    # every other connector for the same ConnectionConfig, rather than created for each connector
+    shared_client = False
+    db_client: Optional[DB_CONNECTOR_TYPE]
+
     def __init__(self, configuration: ConnectionConfig):
         self.configuration = configuration
         # If Fidesops is running in test mode, it's OK to show
@@ -58,9 +65,29 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
     def client(self) -> DB_CONNECTOR_TYPE:
         """Return connector appropriate to this resource"""
         if not self.db_client:
-            self.db_client = self.create_client()
+            self.db_client = (
+                client_registry.get(
+                    self.configuration, self.create_client, self.dispose_client
+                )
+                if self.shared_client
+                else self.create_client()
+            )
         return self.db_client
 
+    def dispose_client(self, client: DB_CONNECTOR_TYPE) -> None:
+        """Close a client created by create_client. Shared clients are disposed of by the client
+        registry once they are replaced and no connector is using them."""
+
+    def release_client(self) -> None:
+        """Let go of this connector's client. A shared client is released to the client registry,
+        which leaves it open for the next privacy request; any other client is disposed of."""
+        if self.db_client:
+            if self.shared_client:
+                client_registry.release(self.db_client)
+            else:
+                self.dispose_client(self.db_client)
+        self.db_client = None
+
     @abstractmethod
     def retrieve_data(
         self,
@@ -74,6 +101,24 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
         The input data is expected to include a key and list of values for
         each input key that may be queried on."""
 
+    def retrieve_data_chunks(  # pylint: disable=too-many-arguments
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[List[Row]]:
+        """Retrieve data as retrieve_data does, in lists of at most chunk_size rows.
+
+        By default, all rows are retrieved at once and then split up. Connectors that can
+        read their results incrementally override this so that only a chunk of rows is held
+        in memory at a time."""
+        chunk_size = chunk_size or config.execution.TASK_CHUNK_SIZE
+        rows = self.retrieve_data(node, policy, privacy_request, input_data)
+        for i in range(0, len(rows), chunk_size):
+            yield rows[i : i + chunk_size]
+
     @abstractmethod
     def mask_data(
         self,
@@ -84,6 +129,46 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
     ) -> int:
         """Execute a masking request. Return the number of rows that have been updated"""
 
+    async def retrieve_data_async(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+    ) -> List[Row]:
+        """Retrieve data as retrieve_data does, without blocking the event loop.
+
+        By default retrieve_data is run on the loop's thread pool. Connectors that can
+        issue their requests concurrently override this."""
+        return await to_thread(
+            self.retrieve_data, node, policy, privacy_request, input_data
+        )
+
+    async def retrieve_data_chunks_async(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+    ) -> Iterable[List[Row]]:
+        """Retrieve data as retrieve_data_chunks does, for a caller on the event loop.
+
+        By default this returns retrieve_data_chunks unstarted, so the rows are read a chunk at a
+        time by whichever thread the caller iterates on, and must not be iterated on the loop itself.
+        Connectors that override retrieve_data_async return its rows as a single chunk, timing the
+        retrieval as they do."""
+        return self.retrieve_data_chunks(node, policy, privacy_request, input_data)
+
+    async def mask_data_async(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> int:
+        """Execute a masking request as mask_data does, without blocking the event loop."""
+        return await to_thread(self.mask_data, node, policy, privacy_request, rows)
+
     def dry_run_query(self, node: TraversalNode) -> str:
         """Generate a dry-run query to display action that will be taken"""
         return self.query_config(node).dry_run_query()
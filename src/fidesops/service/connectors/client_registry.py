@@ -0,0 +1,127 @@
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from fidesops.models.connectionconfig import ConnectionConfig
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+def client_fingerprint(connection_config: ConnectionConfig) -> str:
+    """A hash of everything a client is built from that may change over the life of a ConnectionConfig:
+    its secrets and its pool settings"""
+    return hashlib.sha256(
+        json.dumps(
+            {
+                "secrets": connection_config.secrets,
+                "pool": connection_config.pool_options(),
+            },
+            sort_keys=True,
+            default=str,
+        ).encode()
+    ).hexdigest()
+
+
+class ClientRegistry:
+    """Holds the clients of connectors for the life of the process, so that privacy requests share
+    connection pools rather than each opening their own, and paying for the handshakes to every
+    database again.
+
+    Clients are keyed by the id of their ConnectionConfig. A client is replaced once the config's secrets
+    or pool settings change. Each connector given a client releases it once it is done with it, and a
+    replaced client is only disposed of once every connector using it has released it, so that
+    operations still running on it are not cut off.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[str, Tuple[str, Any, Callable[[Any], None]]] = {}
+        # The number of connectors using each client, by the client's id
+        self._users: Dict[int, int] = {}
+        # Clients no longer registered that are still in use, by the client's id
+        self._retired: Dict[int, Tuple[Any, Callable[[Any], None]]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        connection_config: ConnectionConfig,
+        create: Callable[[], T],
+        dispose: Callable[[T], None],
+    ) -> T:
+        """Return the client registered for this ConnectionConfig, creating it if there is none or if the
+        config has changed since it was created. `dispose` closes a client once it has been replaced and
+        released. Every client returned must be released."""
+        if connection_config.id is None:
+            # Unsaved configs cannot be told apart, so are not shared, and are disposed of once released
+            client = create()
+            with self._lock:
+                self._users[id(client)] = 1
+                self._retired[id(client)] = (client, dispose)
+            return client
+        fingerprint = client_fingerprint(connection_config)
+        to_dispose: List[Tuple[Any, Callable[[Any], None]]] = []
+        with self._lock:
+            registered = self._clients.get(connection_config.id)
+            if registered and registered[0] == fingerprint:
+                client = registered[1]
+            else:
+                client = create()
+                self._clients[connection_config.id] = (fingerprint, client, dispose)
+                if registered:
+                    logger.info(
+                        f"Replacing the client of connection config {connection_config.key}"
+                    )
+                    to_dispose = self._retire(registered)
+            self._users[id(client)] = self._users.get(id(client), 0) + 1
+        self._dispose(to_dispose)
+        return client
+
+    def release(self, client: Any) -> None:
+        """Record that a connector is done with a client it was given. A client that has been replaced
+        is disposed of once the last connector using it releases it."""
+        with self._lock:
+            users = self._users.get(id(client), 0) - 1
+            if users > 0:
+                self._users[id(client)] = users
+                return
+            self._users.pop(id(client), None)
+            retired = self._retired.pop(id(client), None)
+        self._dispose([retired] if retired else [])
+
+    def invalidate(self, connection_config_id: Optional[str]) -> None:
+        """Stop sharing the client registered for a ConnectionConfig, if any, so that the next connector for
+        it creates a new one. The old client is disposed of once it is no longer in use."""
+        with self._lock:
+            registered = self._clients.pop(connection_config_id, None)  # type: ignore
+            to_dispose = self._retire(registered) if registered else []
+        self._dispose(to_dispose)
+
+    def clear(self) -> None:
+        """Stop sharing every registered client, disposing of each once it is no longer in use"""
+        to_dispose: List[Tuple[Any, Callable[[Any], None]]] = []
+        with self._lock:
+            registered, self._clients = list(self._clients.values()), {}
+            for entry in registered:
+                to_dispose.extend(self._retire(entry))
+        self._dispose(to_dispose)
+
+    def _retire(
+        self, registered: Tuple[str, Any, Callable[[Any], None]]
+    ) -> List[Tuple[Any, Callable[[Any], None]]]:
+        """Set aside a client that is no longer registered, returning it if it can be disposed of now.
+        Called with the lock held."""
+        _, client, dispose = registered
+        if self._users.get(id(client)):
+            self._retired[id(client)] = (client, dispose)
+            return []
+        return [(client, dispose)]
+
+    @staticmethod
+    def _dispose(clients: List[Tuple[Any, Callable[[Any], None]]]) -> None:
+        for client, dispose in clients:
+            dispose(client)
+
+
+client_registry = ClientRegistry()
@@ -1,10 +1,11 @@
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from pymongo.errors import ServerSelectionTimeoutError, OperationFailure
 
 from fidesops.common_exceptions import ConnectionException
+from fidesops.core.config import config as fides_config
 from fidesops.graph.traversal import Row, TraversalNode
 from fidesops.models.connectionconfig import ConnectionTestStatus
 from fidesops.models.policy import Policy
@@ -16,7 +17,9 @@ from fidesops.service.connectors.base_connector import (
     BaseConnector,
 )
 from fidesops.service.connectors.query_config import QueryConfig, MongoQueryConfig
+from fidesops.util.async_util import to_thread
 from fidesops.util.logger import NotPii
+from fidesops.util.tracing import QUERY_GENERATION, span
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,8 @@ logger = logging.getLogger(__name__)
 class MongoDBConnector(BaseConnector[MongoClient]):
     """MongoDB Connector"""
 
+    shared_client = True
+
     def build_uri(self) -> str:
         """
         Builds URI of format mongodb://[username:password@]host1[:port1][,...hostN[:portN]][/[defaultauthdb][?options]]
@@ -48,7 +53,12 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         config = MongoDBSchema(**self.configuration.secrets or {})
         uri = config.url if config.url else self.build_uri()
         try:
-            return MongoClient(uri, serverSelectionTimeoutMS=5000)
+            timeout = fides_config.execution.QUERY_TIMEOUT_SECONDS
+            return MongoClient(
+                uri,
+                serverSelectionTimeoutMS=5000,
+                socketTimeoutMS=timeout * 1000 if timeout else None,
+            )
         except ValueError:
             raise ConnectionException("Value Error connecting to MongoDB.")
 
@@ -78,7 +88,7 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         except Exception:
             raise ConnectionException("Connection Error connecting to MongoDB.")
         finally:
-            client.close()
+            self.close()
 
         return ConnectionTestStatus.succeeded
 
@@ -90,13 +100,32 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
         """Retrieve mongo data"""
+        return [
+            row
+            for chunk in self.retrieve_data_chunks(
+                node, policy, privacy_request, input_data
+            )
+            for row in chunk
+        ]
+
+    def retrieve_data_chunks(  # pylint: disable=too-many-arguments
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[List[Row]]:
+        """Retrieve mongo data, reading chunk_size documents from the cursor at a time"""
         # pylint: disable = too-many-locals
+        chunk_size = chunk_size or fides_config.execution.TASK_CHUNK_SIZE
         query_config = self.query_config(node)
         client = self.client()
 
-        query_components = query_config.generate_query(input_data, policy)
+        with span("generate_query", QUERY_GENERATION):
+            query_components = query_config.generate_query(input_data, policy)
         if query_components is None:
-            return []
+            return
         query_data, fields = query_components
 
         db_name = node.address.dataset
@@ -105,11 +134,18 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         db = client[db_name]
         collection = db[collection_name]
         rows = []
+        row_count = 0
         logger.info(f"Starting data retrieval for {node.address}")
-        for row in collection.find(query_data, fields):
+        for row in collection.find(query_data, fields, batch_size=chunk_size):
             rows.append(row)
-        logger.info(f"Found {len(rows)} rows on {node.address}")
-        return rows
+            if len(rows) == chunk_size:
+                row_count += len(rows)
+                yield rows
+                rows = []
+        row_count += len(rows)
+        if rows:
+            yield rows
+        logger.info(f"Found {row_count} rows on {node.address}")
 
     def mask_data(
         self,
@@ -118,32 +154,81 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         privacy_request: PrivacyRequest,
         rows: List[Row],
     ) -> int:
-        # pylint: disable=too-many-locals
         """Execute a masking request"""
         query_config = self.query_config(node)
+        return sum(
+            self.mask_row(node, query_config, row, policy, privacy_request)
+            for row in rows
+        )
+
+    async def mask_data_async(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> int:
+        """Execute a masking request without blocking the event loop, sending the updates of all
+        rows to the server in a single bulk write"""
+        return await to_thread(self.bulk_mask_data, node, policy, privacy_request, rows)
+
+    def bulk_mask_data(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> int:
+        """Mask the rows with a single unordered bulk write, returning the number of documents modified"""
+        query_config = self.query_config(node)
         collection_name = node.address.collection
-        client = self.client()
-        update_ct = 0
+        updates: List[UpdateOne] = []
         for row in rows:
             update_stmt = query_config.generate_update_stmt(
                 row, policy, privacy_request
             )
             if update_stmt is not None:
                 query, update = update_stmt
-                db = client[node.address.dataset]
-                collection = db[collection_name]
-                update_result = collection.update_one(query, update, upsert=False)
-                update_ct += update_result.modified_count
+                updates.append(UpdateOne(query, update, upsert=False))
                 logger.info(
                     "db.%s.update_one(%s, %s, upsert=False)",
                     NotPii(collection_name),
                     query,
                     update,
                 )
+        if not updates:
+            return 0
+        collection = self.client()[node.address.dataset][collection_name]
+        return collection.bulk_write(updates, ordered=False).modified_count
 
-        return update_ct
+    def mask_row(  # pylint: disable=too-many-arguments
+        self,
+        node: TraversalNode,
+        query_config: QueryConfig[Any],
+        row: Row,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+    ) -> int:
+        """Mask a single row, returning the number of documents modified"""
+        update_stmt = query_config.generate_update_stmt(row, policy, privacy_request)
+        if update_stmt is None:
+            return 0
+        query, update = update_stmt
+        collection_name = node.address.collection
+        collection = self.client()[node.address.dataset][collection_name]
+        update_result = collection.update_one(query, update, upsert=False)
+        logger.info(
+            "db.%s.update_one(%s, %s, upsert=False)",
+            NotPii(collection_name),
+            query,
+            update,
+        )
+        return update_result.modified_count
+
+    def dispose_client(self, client: MongoClient) -> None:
+        """Close the client's connections"""
+        client.close()
 
     def close(self) -> None:
-        """Close any held resources"""
-        if self.db_client:
-            self.db_client.close()
+        """Close any held resources. A shared client is left open for the next privacy request."""
+        self.release_client()
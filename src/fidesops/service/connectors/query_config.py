@@ -1,7 +1,19 @@
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Generic, TypeVar, Tuple
+from typing import (
+    Dict,
+    Any,
+    Hashable,
+    Iterator,
+    Mapping,
+    List,
+    Optional,
+    Generic,
+    Set,
+    TypeVar,
+    Tuple,
+)
 
 import pydash
 from sqlalchemy import text, Table, MetaData
@@ -9,6 +21,7 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.sql import Executable, Update
 from sqlalchemy.sql.elements import TextClause, ColumnElement
 
+from fidesops.core.config import config
 from fidesops.graph.config import (
     ROOT_COLLECTION_ADDRESS,
     CollectionAddress,
@@ -28,7 +41,11 @@ from fidesops.task.refine_target_path import (
     build_refined_target_paths,
     join_detailed_path,
 )
-from fidesops.util.collection_util import append, filter_nonempty_values
+from fidesops.util.collection_util import (
+    append,
+    filter_nonempty_values,
+    unique_key,
+)
 from fidesops.util.querytoken import QueryToken
 
 logger = logging.getLogger(__name__)
@@ -42,13 +59,13 @@ class QueryConfig(Generic[T], ABC):
     def __init__(self, node: TraversalNode):
         self.node = node
 
-    def field_map(self) -> Dict[FieldPath, Field]:
+    def field_map(self) -> Mapping[FieldPath, Field]:
         """Flattened FieldPaths of interest from this traversal_node."""
-        return self.node.node.collection.field_dict
+        return self.node.plan.field_dict
 
-    def top_level_field_map(self) -> Dict[FieldPath, Field]:
+    def top_level_field_map(self) -> Mapping[FieldPath, Field]:
         """Top level FieldPaths on this traversal_node."""
-        return self.node.node.collection.top_level_field_dict
+        return self.node.plan.top_level_field_dict
 
     def build_rule_target_field_paths(
         self, policy: Policy
@@ -66,10 +83,10 @@ class QueryConfig(Generic[T], ABC):
             if not rule_categories:
                 continue
 
-            targeted_field_paths = []
-            collection_categories: Dict[
-                str, List[FieldPath]
-            ] = self.node.node.collection.field_paths_by_category
+            targeted_field_paths: List[FieldPath] = []
+            collection_categories: Mapping[
+                str, Tuple[FieldPath, ...]
+            ] = self.node.plan.field_paths_by_category
             for rule_cat in rule_categories:
                 for collection_cat, field_paths in collection_categories.items():
                     if collection_cat.startswith(rule_cat):
@@ -79,13 +96,9 @@ class QueryConfig(Generic[T], ABC):
         return rule_updates
 
     @property
-    def primary_key_field_paths(self) -> Dict[FieldPath, Field]:
+    def primary_key_field_paths(self) -> Mapping[FieldPath, Field]:
         """Mapping of FieldPaths to Fields that are marked as PK's"""
-        return {
-            field_path: field
-            for field_path, field in self.field_map().items()
-            if field.primary_key
-        }
+        return self.node.plan.primary_key_field_paths
 
     def query_sources(self) -> Dict[str, List[CollectionAddress]]:
         """Display the input collection(s) for each query key for display purposes.
@@ -95,7 +108,7 @@ class QueryConfig(Generic[T], ABC):
         Translate keys from field paths to string values
         """
         data: Dict[str, List[CollectionAddress]] = {}
-        for edge in self.node.incoming_edges():
+        for edge in self.node.plan.incoming_edges:
             append(data, edge.f2.field_path.string_path, edge.f1.collection_address())
         return data
 
@@ -250,6 +263,73 @@ class QueryConfig(Generic[T], ABC):
 class SQLQueryConfig(QueryConfig[Executable]):
     """Query config that translates parameters into SQL statements."""
 
+    # The most input values the dialect allows in a single query, if it has a limit of its own
+    max_in_list_size: Optional[int] = None
+
+    def in_list_size(self) -> int:
+        """The most input values a single query is generated with"""
+        size = config.execution.MAX_IN_LIST_SIZE
+        if self.max_in_list_size:
+            size = min(size, self.max_in_list_size)
+        return max(1, size)
+
+    def generate_queries(
+        self,
+        input_data: Dict[str, List[Any]],
+        policy: Optional[Policy] = None,
+    ) -> List[Executable]:
+        """Generate the retrieval queries for the input data, splitting its values between as many queries
+        as needed to keep each within in_list_size values. As the clauses of a query are OR'ed together,
+        the queries between them return the same rows as a single query for all the values would."""
+        filtered_data: Dict[str, List[Any]] = self.node.typed_filtered_values(
+            input_data
+        )
+        values: List[Tuple[str, Any]] = [
+            (string_path, value)
+            for string_path, data in filtered_data.items()
+            for value in data
+        ]
+        size = self.in_list_size()
+        if len(values) <= size:
+            query = self.generate_query(input_data, policy)
+            return [query] if query is not None else []
+
+        queries: List[Executable] = []
+        for i in range(0, len(values), size):
+            chunk: Dict[str, List[Any]] = {}
+            for string_path, value in values[i : i + size]:
+                append(chunk, string_path, value)
+            query = self.generate_query(chunk, policy)
+            if query is not None:
+                queries.append(query)
+        logger.info(
+            f"Split {len(values)} input values to {self.node.address} between {len(queries)} queries"
+        )
+        return queries
+
+    def deduplicate_rows(
+        self, rows: List[Row], seen: Optional[Set[Hashable]] = None
+    ) -> List[Row]:
+        """Drop rows returned more than once by the queries of a node, telling them apart by their
+        primary keys, or by their values if the collection has no primary key. Rows whose keys are
+        already in `seen` are dropped too, so that rows read a chunk at a time can be deduplicated
+        across chunks."""
+        primary_keys = [
+            field_path.string_path for field_path in self.primary_key_field_paths
+        ]
+        seen = set() if seen is None else seen
+        unique_rows: List[Row] = []
+        for row in rows:
+            key = (
+                tuple(unique_key(row.get(pk)) for pk in primary_keys)
+                if primary_keys
+                else unique_key(row)
+            )
+            if key not in seen:
+                seen.add(key)
+                unique_rows.append(row)
+        return unique_rows
+
     def format_fields_for_query(
         self,
         field_paths: List[FieldPath],
@@ -329,6 +409,40 @@ class SQLQueryConfig(QueryConfig[Executable]):
         self, row: Row, policy: Policy, request: PrivacyRequest
     ) -> Optional[TextClause]:
         """Returns an update statement in generic SQL dialect."""
+        update = self.generate_update_params(row, policy, request)
+        if update is None:
+            return None
+        query_str, update_value_map = update
+        logger.info("query = %s, params = %s", query_str, update_value_map)
+        return text(query_str).params(update_value_map)
+
+    def generate_update_batches(
+        self,
+        rows: List[Row],
+        policy: Policy,
+        request: PrivacyRequest,
+        batch_size: int,
+    ) -> Iterator[Tuple[TextClause, List[Dict[str, Any]]]]:
+        """Returns the update statements for the given rows, batched for executemany. Rows whose updates
+        set the same columns and match on the same primary keys share a statement, which is yielded with
+        the parameters of up to batch_size of those rows at a time."""
+        batches: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            update = self.generate_update_params(row, policy, request)
+            if update is not None:
+                append(batches, update[0], update[1])
+
+        for query_str, params in batches.items():
+            logger.info("query = %s, rows = %s", query_str, len(params))
+            stmt = text(query_str)
+            for i in range(0, len(params), max(1, batch_size)):
+                yield stmt, params[i : i + max(1, batch_size)]
+
+    def generate_update_params(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Returns the update statement string for a row in generic SQL dialect, along with its parameters:
+        the masked values and the row's primary keys."""
         update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
         update_clauses: list[str] = self.format_key_map_for_update_stmt(
             list(update_value_map.keys())
@@ -358,8 +472,7 @@ class SQLQueryConfig(QueryConfig[Executable]):
             update_clauses,
             pk_clauses,
         )
-        logger.info("query = %s, params = %s", query_str, update_value_map)
-        return text(query_str).params(update_value_map)
+        return query_str, update_value_map
 
     def query_to_str(self, t: TextClause, input_data: Dict[str, List[Any]]) -> str:
         """string representation of a query for logging/dry-run"""
@@ -470,10 +583,16 @@ class MicrosoftSQLServerQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig)
     Generates SQL valid for SQLServer.
     """
 
+    # SQL Server allows at most 2100 parameters in a query, and each input value is a parameter
+    max_in_list_size = 2000
+
 
 class SnowflakeQueryConfig(SQLQueryConfig):
     """Generates SQL in Snowflake's custom dialect."""
 
+    # Snowflake allows at most 16384 values in an IN list
+    max_in_list_size = 16384
+
     def format_fields_for_query(
         self,
         field_paths: List[FieldPath],
@@ -533,6 +652,9 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
     Generates SQL valid for BigQuery
     """
 
+    # BigQuery allows at most 10000 parameters in a query
+    max_in_list_size = 10000
+
     def get_formatted_query_string(
         self,
         field_list: str,
@@ -1,6 +1,7 @@
+import asyncio
 from json import JSONDecodeError
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union, Literal
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, Literal
 import pydash
 from requests import Session, Request, PreparedRequest, Response
 from fidesops.common_exceptions import FidesopsException
@@ -29,7 +30,9 @@ from fidesops.service.pagination.pagination_strategy_factory import (
 from fidesops.service.processors.post_processor_strategy.post_processor_strategy import (
     PostProcessorStrategy,
 )
+from fidesops.util.async_util import to_thread
 from fidesops.util.url_util import set_query_parameter
+from fidesops.util.tracing import CONNECTOR, QUERY_GENERATION, span
 
 logger = logging.getLogger(__name__)
 
@@ -92,7 +95,10 @@ class AuthenticatedClient:
         """
         try:
             prepared_request = self.get_authenticated_request(request_params)
-            response = self.session.send(prepared_request)
+            response = self.session.send(
+                prepared_request,
+                timeout=config.execution.QUERY_TIMEOUT_SECONDS or None,
+            )
         except Exception:
             raise ConnectionException(f"Operational Error connecting to '{self.key}'.")
         if not response.ok:
@@ -173,39 +179,99 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
 
         return self._build_client_with_config(self.saas_config.client_config)
 
-    def retrieve_data(
+    def prepare_read_requests(
         self,
         node: TraversalNode,
         policy: Policy,
-        privacy_request: PrivacyRequest,
         input_data: Dict[str, List[Any]],
-    ) -> List[Row]:
-        """Retrieve data from SaaS APIs"""
-
+    ) -> Tuple[SaaSRequest, List[SaaSRequestParams]]:
+        """Returns the configured read request for the node's collection, and the initial
+        set of requests generated from the input data"""
         # get the corresponding read request for the given collection
         self.collection_name = node.address.collection
         read_request: SaaSRequest = self.endpoints[self.collection_name].requests[
             "read"
         ]
-
-        # generate initial set of requests
         query_config: SaaSQueryConfig = self.query_config(node)
-        prepared_requests: List[SaaSRequestParams] = query_config.generate_requests(
-            input_data, policy
-        )
+        with span("generate_requests", QUERY_GENERATION):
+            return read_request, query_config.generate_requests(input_data, policy)
 
-        # Iterates through initial list of prepared requests and through subsequent
-        # requests generated by pagination. The results are added to the output
-        # list of rows after each request.
+    def retrieve_data(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+    ) -> List[Row]:
+        """Retrieve data from SaaS APIs"""
+        read_request, prepared_requests = self.prepare_read_requests(
+            node, policy, input_data
+        )
         rows: List[Row] = []
-        for next_request in prepared_requests:
-            while next_request:
-                processed_rows, next_request = self.execute_prepared_request(
-                    next_request,
+        for prepared_request in prepared_requests:
+            rows.extend(
+                self.retrieve_pages(
+                    prepared_request,
                     privacy_request.get_cached_identity_data(),
                     read_request,
                 )
-                rows.extend(processed_rows)
+            )
+        return rows
+
+    async def retrieve_data_async(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+    ) -> List[Row]:
+        """Retrieve data from SaaS APIs, sending the initial requests concurrently.
+
+        The pages of each request are still fetched in order, as each page says where the next one is."""
+        read_request, prepared_requests = await to_thread(
+            self.prepare_read_requests, node, policy, input_data
+        )
+        identity_data = await to_thread(privacy_request.get_cached_identity_data)
+        pages: List[List[Row]] = await asyncio.gather(
+            *[
+                to_thread(
+                    self.retrieve_pages, prepared_request, identity_data, read_request
+                )
+                for prepared_request in prepared_requests
+            ]
+        )
+        return [row for rows in pages for row in rows]
+
+    async def retrieve_data_chunks_async(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+    ) -> Iterable[List[Row]]:
+        """Retrieve data from SaaS APIs with retrieve_data_async, as a single chunk. The requests
+        are sent here rather than as the chunk is read, so they are timed here."""
+        with span("retrieve_data", CONNECTOR):
+            rows = await self.retrieve_data_async(
+                node, policy, privacy_request, input_data
+            )
+        return [rows]
+
+    def retrieve_pages(
+        self,
+        prepared_request: SaaSRequestParams,
+        identity_data: Dict[str, Any],
+        read_request: SaaSRequest,
+    ) -> List[Row]:
+        """Executes a prepared request and any subsequent requests generated by pagination,
+        returning the processed rows of every page"""
+        rows: List[Row] = []
+        next_request: Optional[SaaSRequestParams] = prepared_request
+        while next_request:
+            processed_rows, next_request = self.execute_prepared_request(
+                next_request, identity_data, read_request
+            )
+            rows.extend(processed_rows)
         return rows
 
     def execute_prepared_request(
@@ -346,30 +412,63 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         except StopIteration:
             return None
 
-    def mask_data(
+    def prepare_masking_requests(
         self,
         node: TraversalNode,
         policy: Policy,
         privacy_request: PrivacyRequest,
         rows: List[Row],
-    ) -> int:
-        """Execute a masking request. Return the number of rows that have been updated"""
+    ) -> Tuple[SaaSRequest, List[SaaSRequestParams]]:
+        """Returns the masking request configured for the node's collection, and a request to mask each row"""
         query_config = self.query_config(node)
         if not query_config.masking_request:
             raise Exception(
                 f"Either no masking request configured or no valid masking request for {node.address.collection}. "
                 f"Check that MASKING_STRICT env var is appropriately set"
             )
-        prepared_requests = [
-            query_config.generate_update_stmt(row, policy, privacy_request)
-            for row in rows
-        ]
+        with span("generate_update_stmts", QUERY_GENERATION):
+            return query_config.masking_request, [
+                query_config.generate_update_stmt(row, policy, privacy_request)
+                for row in rows
+            ]
+
+    def mask_data(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> int:
+        """Execute a masking request. Return the number of rows that have been updated"""
+        masking_request, prepared_requests = self.prepare_masking_requests(
+            node, policy, privacy_request, rows
+        )
         rows_updated = 0
-        client = self.create_client_from_request(query_config.masking_request)
+        client = self.create_client_from_request(masking_request)
         for prepared_request in prepared_requests:
-            client.send(prepared_request, query_config.masking_request.ignore_errors)
+            client.send(prepared_request, masking_request.ignore_errors)
             rows_updated += 1
         return rows_updated
 
+    async def mask_data_async(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> int:
+        """Execute a masking request, sending the request for each row concurrently"""
+        masking_request, prepared_requests = await to_thread(
+            self.prepare_masking_requests, node, policy, privacy_request, rows
+        )
+        client = self.create_client_from_request(masking_request)
+        await asyncio.gather(
+            *[
+                to_thread(client.send, prepared_request, masking_request.ignore_errors)
+                for prepared_request in prepared_requests
+            ]
+        )
+        return len(prepared_requests)
+
     def close(self) -> None:
         """Not required for this type"""
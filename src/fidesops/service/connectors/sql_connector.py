@@ -1,8 +1,9 @@
+import json
 import logging
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, Tuple
 
-from sqlalchemy import Column, text
+from sqlalchemy import Column, event, text
 from sqlalchemy.engine import (
     URL,
     Engine,
@@ -10,13 +11,14 @@ from sqlalchemy.engine import (
     CursorResult,
     LegacyCursorResult,
     Connection,
+    make_url,
 )
 from sqlalchemy.exc import OperationalError, InternalError
 from sqlalchemy.sql import Executable
-from sqlalchemy.sql.elements import TextClause
 from snowflake.sqlalchemy import URL as Snowflake_URL
 
 from fidesops.common_exceptions import ConnectionException
+from fidesops.core.config import config as fides_config
 from fidesops.graph.traversal import Row, TraversalNode
 from fidesops.models.connectionconfig import ConnectionTestStatus
 from fidesops.models.policy import Policy
@@ -37,6 +39,12 @@ from fidesops.schemas.connection_configuration.connection_secrets_mysql import (
     MySQLSchema,
 )
 from fidesops.service.connectors.base_connector import BaseConnector
+from fidesops.util.cache import (
+    FidesopsRedis,
+    get_cache,
+    get_masking_progress_cache_key,
+)
+from fidesops.util.tracing import QUERY_GENERATION, span
 from fidesops.service.connectors.query_config import (
     SnowflakeQueryConfig,
     SQLQueryConfig,
@@ -48,10 +56,26 @@ from fidesops.service.connectors.query_config import (
 logger = logging.getLogger(__name__)
 
 
+def psycopg2_batch_options(uri: str) -> Dict[str, Any]:
+    """Engine options that have psycopg2 send the updates of a masking batch to the database in one
+    round trip, with execute_batch, rather than one round trip for each row. Engines using other
+    drivers are left as they are."""
+    if make_url(uri).get_driver_name() != "psycopg2":
+        return {}
+    return {
+        "executemany_mode": "values_plus_batch",
+        "executemany_batch_page_size": max(
+            1, fides_config.execution.MASKING_BATCH_SIZE
+        ),
+    }
+
+
 class SQLConnector(BaseConnector[Engine]):
     """A SQL connector represents an abstract connector to any datastore that can be
     interacted with via standard SQL via SQLAlchemy"""
 
+    shared_client = True
+
     @staticmethod
     def cursor_result_to_rows(results: CursorResult) -> List[Row]:
         """Convert SQLAlchemy results to a list of dictionaries"""
@@ -111,43 +135,197 @@ class SQLConnector(BaseConnector[Engine]):
         privacy_request: PrivacyRequest,
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
-        """Retrieve sql data"""
+        """Retrieve sql data
+
+        If the input values are split between several queries, they are run one after another on a
+        single connection, so that a node never holds more than one of the connection's
+        max_concurrent_queries. Rows returned by more than one of them are only kept once.
+        """
         query_config = self.query_config(node)
-        client = self.client()
-        stmt: Optional[TextClause] = query_config.generate_query(input_data, policy)
-        if stmt is None:
+        with span("generate_query", QUERY_GENERATION):
+            stmts: List[Executable] = query_config.generate_queries(input_data, policy)
+        if not stmts:
             return []
         logger.info(f"Starting data retrieval for {node.address}")
+        with self.client().connect() as connection:
+            self.prepare_connection(connection)
+            results = [self.execute_query(connection, stmt) for stmt in stmts]
+        if len(results) == 1:
+            return results[0]
+        return query_config.deduplicate_rows([row for rows in results for row in rows])
+
+    def execute_query(self, connection: Connection, stmt: Executable) -> List[Row]:
+        """Run a retrieval query"""
+        return self.cursor_result_to_rows(connection.execute(stmt))
+
+    def retrieve_data_chunks(  # pylint: disable=too-many-arguments
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[List[Row]]:
+        """Retrieve sql data in lists of at most chunk_size rows.
+
+        If SQL_STREAM_RESULTS is set, rows are read from a server-side cursor a chunk at a time, so
+        that only one chunk of rows is buffered by the driver and connector at once. The caller
+        decides whether earlier chunks are kept. Otherwise rows are retrieved as retrieve_data
+        does, and then split up.
+        """
+        if not fides_config.execution.SQL_STREAM_RESULTS:
+            yield from super().retrieve_data_chunks(
+                node, policy, privacy_request, input_data, chunk_size
+            )
+            return
+
+        chunk_size = chunk_size or fides_config.execution.TASK_CHUNK_SIZE
+        query_config = self.query_config(node)
+        with span("generate_query", QUERY_GENERATION):
+            stmts: List[Executable] = query_config.generate_queries(input_data, policy)
+        if not stmts:
+            return
+        logger.info(f"Starting data retrieval for {node.address}")
+        seen: Set[Hashable] = set()
+        row_count = 0
+        for stmt in stmts:
+            for rows in self.stream_query(stmt, chunk_size):
+                if len(stmts) > 1:
+                    rows = query_config.deduplicate_rows(rows, seen)
+                row_count += len(rows)
+                if rows:
+                    yield rows
+        logger.info(f"Found {row_count} rows on {node.address}")
+
+    def stream_query(self, stmt: Executable, chunk_size: int) -> Iterator[List[Row]]:
+        """Run a retrieval query through a server-side cursor, yielding its rows chunk_size at a
+        time. Dialects without server-side cursors fetch the rows from a client-side one."""
+        with self.client().connect() as connection:
+            self.prepare_connection(connection)
+            results = connection.execution_options(
+                stream_results=True, max_row_buffer=chunk_size
+            ).execute(stmt)
+            columns = list(results.keys())
+            for partition in results.partitions(chunk_size):
+                yield [dict(zip(columns, row)) for row in partition]
+
+    def mask_data(  # pylint: disable=too-many-locals
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> int:
+        """Execute a masking request. Returns the number of records masked
+
+        Rows are masked on a single connection, in transactions of MASKING_COMMIT_SIZE rows. The primary
+        keys of the rows masked are saved after each commit, so that if masking fails partway through, a
+        retry skips the rows already masked rather than masking them again, whatever order the rows are
+        given in.
+        """
+        cache = get_cache()
+        progress_key = get_masking_progress_cache_key(
+            privacy_request.id, str(node.address)
+        )
+        primary_keys = sorted(
+            path.string_path for path in self.query_config(node).primary_key_field_paths
+        )
+
+        def row_key(row: Row) -> str:
+            return json.dumps([row.get(key) for key in primary_keys], default=str)
+
+        masked, update_ct = self.get_masking_progress(cache, progress_key)
+        if masked:
+            unmasked = [row for row in rows if row_key(row) not in masked]
+            logger.info(
+                f"Resuming masking with {len(rows) - len(unmasked)} of {len(rows)} rows already masked"
+            )
+            rows = unmasked
+        commit_size = max(1, fides_config.execution.MASKING_COMMIT_SIZE)
+        client = self.client()
         with client.connect() as connection:
-            results = connection.execute(stmt)
-            return self.cursor_result_to_rows(results)
+            self.prepare_connection(connection)
+            for start in range(0, len(rows), commit_size):
+                chunk = rows[start : start + commit_size]
+                with connection.begin():
+                    chunk_update_ct = self.mask_rows(
+                        connection, node, policy, privacy_request, chunk
+                    )
+                update_ct = update_ct + chunk_update_ct
+                if start + len(chunk) < len(rows):
+                    self.save_masking_progress(
+                        cache,
+                        progress_key,
+                        [row_key(row) for row in chunk],
+                        chunk_update_ct,
+                    )
+        cache.delete(progress_key, f"{progress_key}-updated")
+        return update_ct
 
-    def mask_data(
+    def mask_rows(  # pylint: disable=too-many-arguments
         self,
+        connection: Connection,
         node: TraversalNode,
         policy: Policy,
         privacy_request: PrivacyRequest,
         rows: List[Row],
     ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
+        """Mask the given rows on an open connection. Returns the number of records masked
+
+        Rows are masked in batches, each running one statement with the parameters of many rows.
+        Drivers that do not report the number of records a batch updated are taken to have updated
+        one record for each row, as each row's update matches on its primary keys.
+        """
         query_config = self.query_config(node)
         update_ct = 0
-        client = self.client()
-        for row in rows:
-            update_stmt: Optional[TextClause] = query_config.generate_update_stmt(
-                row, policy, privacy_request
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
+        for stmt, params in query_config.generate_update_batches(
+            rows, policy, privacy_request, fides_config.execution.MASKING_BATCH_SIZE
+        ):
+            results: LegacyCursorResult = connection.execute(stmt, params)
+            if len(params) > 1 and not connection.dialect.supports_sane_multi_rowcount:
+                update_ct = update_ct + len(params)
+            else:
+                update_ct = update_ct + results.rowcount
         return update_ct
 
+    @staticmethod
+    def get_masking_progress(
+        cache: FidesopsRedis, progress_key: str
+    ) -> Tuple[Set[str], int]:
+        """Returns the primary keys of the rows already masked by an earlier attempt at masking a
+        collection, and the number of records they updated"""
+        masked: Set[str] = {
+            key.decode() if isinstance(key, bytes) else key
+            for key in cache.smembers(progress_key)
+        }
+        if not masked:
+            return set(), 0
+        return masked, int(cache.get(f"{progress_key}-updated") or 0)
+
+    @staticmethod
+    def save_masking_progress(
+        cache: FidesopsRedis, progress_key: str, row_keys: List[str], update_ct: int
+    ) -> None:
+        """Add committed rows, identified by their primary keys, to those already masked, along with
+        the number of records they updated"""
+        with cache.pipeline() as pipe:
+            pipe.sadd(progress_key, *row_keys)
+            pipe.incrby(f"{progress_key}-updated", update_ct)
+            for key in [progress_key, f"{progress_key}-updated"]:
+                pipe.expire(key, fides_config.redis.DEFAULT_TTL_SECONDS)
+            pipe.execute()
+
+    def prepare_connection(self, connection: Connection) -> None:
+        """Prepare a connection for the statements of a node. By default, this does nothing."""
+
+    def dispose_client(self, client: Engine) -> None:
+        """Close all the connections held by the engine's pool"""
+        logger.debug(f" disposing of {self.__class__}")
+        client.dispose()
+
     def close(self) -> None:
-        """Close any held resources"""
-        if self.db_client:
-            logger.debug(f" disposing of {self.__class__}")
-            self.db_client.dispose()
+        """Close any held resources. A shared engine is left open for the next privacy request."""
+        self.release_client()
 
 
 class PostgreSQLConnector(SQLConnector):
@@ -172,10 +350,16 @@ class PostgreSQLConnector(SQLConnector):
         """Returns a SQLAlchemy Engine that can be used to interact with a PostgreSQL database"""
         config = PostgreSQLSchema(**self.configuration.secrets or {})
         uri = config.url or self.build_uri()
+        timeout = fides_config.execution.QUERY_TIMEOUT_SECONDS
         return create_engine(
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            connect_args={"options": f"-c statement_timeout={timeout * 1000}"}
+            if timeout
+            else {},
+            **psycopg2_batch_options(uri),
+            **self.configuration.pool_options(),
         )
 
 
@@ -202,10 +386,15 @@ class MySQLConnector(SQLConnector):
         """Returns a SQLAlchemy Engine that can be used to interact with a MySQL database"""
         config = MySQLSchema(**self.configuration.secrets or {})
         uri = config.url or self.build_uri()
+        timeout = fides_config.execution.QUERY_TIMEOUT_SECONDS
         return create_engine(
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            connect_args={"read_timeout": timeout, "write_timeout": timeout}
+            if timeout
+            else {},
+            **self.configuration.pool_options(),
         )
 
     @staticmethod
@@ -239,10 +428,15 @@ class MariaDBConnector(SQLConnector):
         """Returns a SQLAlchemy Engine that can be used to interact with a MariaDB database"""
         config = MariaDBSchema(**self.configuration.secrets or {})
         uri = config.url or self.build_uri()
+        timeout = fides_config.execution.QUERY_TIMEOUT_SECONDS
         return create_engine(
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            connect_args={"read_timeout": timeout, "write_timeout": timeout}
+            if timeout
+            else {},
+            **self.configuration.pool_options(),
         )
 
     @staticmethod
@@ -275,6 +469,8 @@ class RedshiftConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **psycopg2_batch_options(uri),
+            **self.configuration.pool_options(),
         )
 
     def set_schema(self, connection: Connection) -> None:
@@ -286,57 +482,21 @@ class RedshiftConnector(SQLConnector):
             stmt = stmt.bindparams(search_path=config.db_schema)
             connection.execute(stmt)
 
-    # Overrides SQLConnector.retrieve_data
-    def retrieve_data(
-        self,
-        node: TraversalNode,
-        policy: Policy,
-        privacy_request: PrivacyRequest,
-        input_data: Dict[str, List[Any]],
-    ) -> List[Row]:
-        """Retrieve data from Amazon Redshift
-
-        For redshift, we also set the search_path to be the schema defined on the ConnectionConfig if
-        applicable - persists for the current session.
-        """
-        query_config = self.query_config(node)
-        client = self.client()
-        stmt = query_config.generate_query(input_data, policy)
-        if stmt is None:
-            return []
-
-        logger.info(f"Starting data retrieval for {node.address}")
-        with client.connect() as connection:
-            self.set_schema(connection)
-            results = connection.execute(stmt)
-            return SQLConnector.cursor_result_to_rows(results)
-
-    # Overrides SQLConnector.mask_data
-    def mask_data(
-        self,
-        node: TraversalNode,
-        policy: Policy,
-        privacy_request: PrivacyRequest,
-        rows: List[Row],
-    ) -> int:
-        """Execute a masking request. Returns the number of records masked
-
-        For redshift, we also set the search_path to be the schema defined on the ConnectionConfig if
-        applicable - persists for the current session.
-        """
-        query_config = self.query_config(node)
-        update_ct = 0
-        client = self.client()
-        for row in rows:
-            update_stmt = query_config.generate_update_stmt(
-                row, policy, privacy_request
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    self.set_schema(connection)
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
-        return update_ct
+    @staticmethod
+    def set_statement_timeout(connection: Connection) -> None:
+        """Sets the statement_timeout for the duration of the session, as Redshift does not accept it
+        as a connection option"""
+        timeout = fides_config.execution.QUERY_TIMEOUT_SECONDS
+        if timeout:
+            connection.execute(text(f"SET statement_timeout TO {timeout * 1000}"))
+
+    # Overrides SQLConnector.prepare_connection
+    def prepare_connection(self, connection: Connection) -> None:
+        """For redshift, set the search_path to be the schema defined on the ConnectionConfig if
+        applicable, and the statement_timeout, before retrieving or masking data - persists for the
+        current session."""
+        self.set_schema(connection)
+        self.set_statement_timeout(connection)
 
     # Overrides SQLConnector.query_config
     def query_config(self, node: TraversalNode) -> RedshiftQueryConfig:
@@ -367,6 +527,7 @@ class BigQueryConnector(SQLConnector):
             credentials_info=config.keyfile_creds.dict(),
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.configuration.pool_options(),
         )
 
     # Overrides SQLConnector.query_config
@@ -374,14 +535,17 @@ class BigQueryConnector(SQLConnector):
         """Query wrapper corresponding to the input traversal_node."""
         return BigQueryQueryConfig(node)
 
-    def mask_data(
+    # Overrides SQLConnector.mask_rows
+    def mask_rows(  # pylint: disable=too-many-arguments
         self,
+        connection: Connection,
         node: TraversalNode,
         policy: Policy,
         privacy_request: PrivacyRequest,
         rows: List[Row],
     ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
+        """Mask the given rows on an open connection, with an update for each row. Returns the number
+        of records masked"""
         query_config = self.query_config(node)
         update_ct = 0
         client = self.client()
@@ -390,9 +554,8 @@ class BigQueryConnector(SQLConnector):
                 row, policy, privacy_request, client
             )
             if update_stmt is not None:
-                with client.connect() as connection:
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
+                results: LegacyCursorResult = connection.execute(update_stmt)
+                update_ct = update_ct + results.rowcount
         return update_ct
 
 
@@ -429,10 +592,17 @@ class SnowflakeConnector(SQLConnector):
         """Returns a SQLAlchemy Engine that can be used to interact with Snowflake"""
         config = SnowflakeSchema(**self.configuration.secrets or {})
         uri: str = config.url or self.build_uri()
+        timeout = fides_config.execution.QUERY_TIMEOUT_SECONDS
         return create_engine(
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            connect_args={
+                "session_parameters": {"STATEMENT_TIMEOUT_IN_SECONDS": timeout}
+            }
+            if timeout
+            else {},
+            **self.configuration.pool_options(),
         )
 
     def query_config(self, node: TraversalNode) -> SQLQueryConfig:
@@ -470,11 +640,22 @@ class MicrosoftSQLServerConnector(SQLConnector):
         """Returns a SQLAlchemy Engine that can be used to interact with a MicrosoftSQLServer database"""
         config = MicrosoftSQLServerSchema(**self.configuration.secrets or {})
         uri = config.url or self.build_uri()
-        return create_engine(
+        engine = create_engine(
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.configuration.pool_options(),
         )
+        timeout = fides_config.execution.QUERY_TIMEOUT_SECONDS
+        if timeout:
+            # pyodbc takes its query timeout as an attribute of each connection
+            # rather than as a connection argument
+            def set_query_timeout(dbapi_connection: Any, _: Any) -> None:
+                dbapi_connection.timeout = timeout
+
+            event.listen(engine, "connect", set_query_timeout)
+
+        return engine
 
     def query_config(self, node: TraversalNode) -> SQLQueryConfig:
         """Query wrapper corresponding to the input traversal_node."""
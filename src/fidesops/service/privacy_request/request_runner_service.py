@@ -1,6 +1,7 @@
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import Set, Optional, Awaitable
+from typing import Any, Dict, FrozenSet, List, Set, Optional, Awaitable, Tuple
 
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
@@ -8,10 +9,15 @@ from sqlalchemy.orm import Session
 from fidesops import common_exceptions
 from fidesops.core.config import config
 from fidesops.db.session import get_db_session
-from fidesops.common_exceptions import PrivacyRequestPaused, ClientUnsuccessfulException
+from fidesops.common_exceptions import (
+    PrivacyRequestPaused,
+    PrivacyRequestCanceled,
+    PrivacyRequestLeaseLost,
+    ClientUnsuccessfulException,
+)
 from fidesops.graph.graph import DatasetGraph
 from fidesops.models.connectionconfig import ConnectionConfig
-from fidesops.models.datasetconfig import DatasetConfig
+from fidesops.models.datasetconfig import get_dataset_graph
 from fidesops.models.policy import (
     ActionType,
     WebhookTypes,
@@ -20,15 +26,18 @@ from fidesops.models.policy import (
 )
 from fidesops.models.privacy_request import PrivacyRequest, PrivacyRequestStatus
 from fidesops.service.storage.storage_uploader_service import upload
+from fidesops.task.filter_element_match import drop_placeholders
 from fidesops.task.filter_results import filter_data_categories
 from fidesops.task.graph_task import (
     run_access_request,
+    run_batch_access_request,
     run_erasure,
-    get_cached_data_for_erasures,
 )
 from fidesops.tasks.scheduled.scheduler import scheduler
+from fidesops.tasks.worker import enqueue_privacy_request
 from fidesops.util.async_util import run_async
 from fidesops.util.cache import FidesopsRedis
+from fidesops.util.collection_util import Row
 
 logger = logging.getLogger(__name__)
 
@@ -92,38 +101,76 @@ class PrivacyRequestRunner:
 
         return True
 
+    def start(
+        self,
+        db: Session,
+        privacy_request: PrivacyRequest,
+        from_webhook_id: Optional[str] = None,
+    ) -> bool:
+        """Mark a privacy request as started and run its pre-execution webhooks. Returns False if it is
+        not to be run: it was canceled, or a webhook paused or halted it."""
+        if privacy_request.status == PrivacyRequestStatus.canceled:
+            logging.info(
+                f"Privacy request {privacy_request.id} was canceled before it ran"
+            )
+            return False
+        logging.info(f"Dispatching privacy request {privacy_request.id}")
+        privacy_request.start_processing(db)
+        return self.run_webhooks_and_report_status(
+            db,
+            privacy_request=privacy_request,
+            webhook_cls=PolicyPreWebhook,
+            after_webhook_id=from_webhook_id,
+        )
+
     def submit(
         self, from_webhook: Optional[PolicyPreWebhook] = None
-    ) -> Awaitable[None]:
-        """Run this privacy request in a separate thread."""
+    ) -> Optional[Awaitable[None]]:
+        """Run this privacy request in a separate thread.
+
+        If workers are enabled, the privacy request is instead queued to be run by a `fidesops worker` process.
+        """
         from_webhook_id = from_webhook.id if from_webhook else None
+        if config.execution.WORKER_ENABLED:
+            enqueue_privacy_request(self.privacy_request.id, from_webhook_id)
+            return None
         return run_async(self.run, self.privacy_request.id, from_webhook_id)
 
     def run(
-        self, privacy_request_id: str, from_webhook_id: Optional[str] = None
+        self,
+        privacy_request_id: str,
+        from_webhook_id: Optional[str] = None,
+        lease_lost: Optional[threading.Event] = None,
+        started: bool = False,
     ) -> None:
-        # pylint: disable=too-many-locals
+        # pylint: disable=too-many-locals, too-many-statements, too-many-branches
         """
         Dispatch a privacy_request into the execution layer by:
             1. Generate a graph from all the currently configured datasets
             2. Take the provided identity data
             3. Start the access request / erasure request execution
             4. When finished, upload the results to the configured storage destination if applicable
+
+        If run by a worker, `lease_lost` is set once the worker's lease on the privacy request lapses. The
+        run then stops, without updating the privacy request, as another worker may be running it.
+
+        If the privacy request has already been `started`, its pre-execution webhooks are not run again.
         """
         SessionLocal = get_db_session()
         with SessionLocal() as session:
 
             privacy_request = PrivacyRequest.get(db=session, id=privacy_request_id)
-            logging.info(f"Dispatching privacy request {privacy_request.id}")
-            privacy_request.start_processing(session)
-
-            # Run pre-execution webhooks
-            proceed = self.run_webhooks_and_report_status(
-                session,
-                privacy_request=privacy_request,
-                webhook_cls=PolicyPreWebhook,
-                after_webhook_id=from_webhook_id,
+            deadline: Optional[datetime] = (
+                datetime.utcnow()
+                + timedelta(seconds=config.execution.REQUEST_TIMEOUT_SECONDS)
+                if config.execution.REQUEST_TIMEOUT_SECONDS
+                else None
             )
+            if started:
+                # It may have been canceled since it was started
+                proceed = privacy_request.status != PrivacyRequestStatus.canceled
+            else:
+                proceed = self.start(session, privacy_request, from_webhook_id)
             if not proceed:
                 session.close()
                 return
@@ -137,27 +184,36 @@ class PrivacyRequestRunner:
                 )
 
             try:
-                datasets = DatasetConfig.all(db=session)
-                dataset_graphs = [
-                    dataset_config.get_graph() for dataset_config in datasets
-                ]
-                dataset_graph = DatasetGraph(*dataset_graphs)
+                dataset_graph: DatasetGraph = get_dataset_graph(session)
                 identity_data = privacy_request.get_cached_identity_data()
                 connection_configs = ConnectionConfig.all(db=session)
 
-                access_result = run_access_request(
+                # Results are returned as the erasure needs them, and the access results are
+                # derived from them, so neither is read back from the cache
+                results_with_placeholders = run_access_request(
                     privacy_request=privacy_request,
                     policy=policy,
                     graph=dataset_graph,
                     connection_configs=connection_configs,
                     identity=identity_data,
+                    deadline=deadline,
+                    lease_lost=lease_lost,
+                    placeholders=True,
                 )
+                access_result: Dict[str, List[Row]] = {
+                    address: [drop_placeholders(row) for row in rows]
+                    for address, rows in results_with_placeholders.items()
+                }
                 if not access_result:
                     logging.info(
                         f"No results returned for access request {privacy_request.id}"
                     )
 
                 # Once the access request is complete, process the data uploads
+                if lease_lost and lease_lost.is_set():
+                    raise PrivacyRequestLeaseLost(
+                        f"Lease on privacy request {privacy_request.id} was lost"
+                    )
                 for rule in policy.get_rules_for_action(action_type=ActionType.access):
                     if not rule.storage_destination:
                         raise common_exceptions.RuleValidationError(
@@ -195,15 +251,42 @@ class PrivacyRequestRunner:
                         graph=dataset_graph,
                         connection_configs=connection_configs,
                         identity=identity_data,
-                        access_request_data=get_cached_data_for_erasures(
-                            privacy_request.id
-                        ),
+                        access_request_data=results_with_placeholders,
+                        deadline=deadline,
+                        lease_lost=lease_lost,
                     )
 
+            except PrivacyRequestCanceled:
+                # The privacy request has already been marked as canceled
+                logging.info(
+                    f"Stopped running canceled privacy request {privacy_request.id}"
+                )
+                session.close()
+                return
+            except PrivacyRequestLeaseLost:
+                # Another worker may be running the privacy request, and owns its status
+                logging.warning(
+                    f"Stopped running privacy request {privacy_request.id} after its lease was lost"
+                )
+                session.close()
+                return
             except BaseException as exc:  # pylint: disable=broad-except
                 logging.error(exc)
                 privacy_request.status = PrivacyRequestStatus.error
 
+            if lease_lost and lease_lost.is_set():
+                logging.warning(
+                    f"Not completing privacy request {privacy_request.id} as its lease was lost"
+                )
+                session.close()
+                return
+            if privacy_request.cancel_requested():
+                logging.info(
+                    f"Not completing privacy request {privacy_request.id} as it was canceled"
+                )
+                session.close()
+                return
+
             # Run post-execution webhooks
             proceed = self.run_webhooks_and_report_status(
                 db=session,
@@ -214,11 +297,17 @@ class PrivacyRequestRunner:
                 session.close()
                 return
 
-            privacy_request.finished_processing_at = datetime.utcnow()
-            if privacy_request.status != PrivacyRequestStatus.error:
-                privacy_request.status = PrivacyRequestStatus.complete
-            privacy_request.save(db=session)
-            logging.info(f"Privacy request {privacy_request.id} run completed.")
+            status = (
+                PrivacyRequestStatus.error
+                if privacy_request.status == PrivacyRequestStatus.error
+                else PrivacyRequestStatus.complete
+            )
+            if privacy_request.finish_processing(db=session, status=status):
+                logging.info(f"Privacy request {privacy_request.id} run completed.")
+            else:
+                logging.info(
+                    f"Not completing privacy request {privacy_request.id} as it was canceled"
+                )
             session.close()
 
     def dry_run(self, privacy_request: PrivacyRequest) -> None:
@@ -254,3 +343,56 @@ def mark_paused_privacy_request_as_expired(privacy_request_id: str) -> None:
         )
         privacy_request.error_processing(db=db)
     db.close()
+
+
+def prefetch_access_results(privacy_request_ids: List[str]) -> None:
+    """Fetch the access results of several started privacy requests ahead of running them.
+
+    Requests that share a policy and identity types are batched, so each collection is queried
+    once per batch. Their results are checkpointed, so when each request is then run it skips
+    straight past the queries. Requests in a batch that fails simply run their own queries, and
+    requests canceled since they were started are left out.
+    """
+    SessionLocal = get_db_session()
+    with SessionLocal() as session:
+        batches: Dict[
+            Tuple[str, FrozenSet[str]], List[Tuple[PrivacyRequest, Dict[str, Any]]]
+        ] = {}
+        for privacy_request_id in privacy_request_ids:
+            privacy_request = PrivacyRequest.get(db=session, id=privacy_request_id)
+            if (
+                not privacy_request
+                or privacy_request.status == PrivacyRequestStatus.canceled
+            ):
+                continue
+            identity_data = privacy_request.get_cached_identity_data()
+            batches.setdefault(
+                (privacy_request.policy_id, frozenset(identity_data)), []
+            ).append((privacy_request, identity_data))
+
+        batches = {key: batch for key, batch in batches.items() if len(batch) > 1}
+        if not batches:
+            return
+
+        dataset_graph: DatasetGraph = get_dataset_graph(session)
+        connection_configs = ConnectionConfig.all(db=session)
+        for batch in batches.values():
+            privacy_requests = [privacy_request for privacy_request, _ in batch]
+            logger.info(
+                f"Fetching access results for {len(privacy_requests)} privacy requests together"
+            )
+            try:
+                run_batch_access_request(
+                    privacy_requests=privacy_requests,
+                    policy=privacy_requests[0].policy,
+                    graph=dataset_graph,
+                    connection_configs=connection_configs,
+                    identities={
+                        privacy_request.id: identity_data
+                        for privacy_request, identity_data in batch
+                    },
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error(
+                    f"Batched access request failed, privacy requests will be run individually: {exc}"
+                )
@@ -152,3 +152,33 @@ def _expand_array_paths_to_preserve(paths: List[DetailedPath]) -> Dict[str, List
     for path in expanded:
         merge_paths[join_detailed_path(path[0:-1])].append(path[-1])  # type: ignore
     return merge_paths
+
+
+def drop_placeholders(value: Any) -> Any:
+    """
+    Returns the given value with any array elements that post-processing replaced with placeholder text removed,
+    as filter_element_match would have removed them had it been called with delete_elements=True.
+
+    The value is not modified. Where nothing was replaced, the same object is returned rather than a copy, so
+    the result shares all unchanged data with the value.
+
+    :Example:
+    drop_placeholders({"A": ["FIDESOPS_DO_NOT_MASK", 2, "FIDESOPS_DO_NOT_MASK"], "B": 2})
+
+    {"A": [2], "B": 2}
+    """
+    if isinstance(value, dict):
+        dropped = {key: drop_placeholders(elem) for key, elem in value.items()}
+        if all(dropped[key] is elem for key, elem in value.items()):
+            return value
+        return dropped
+    if isinstance(value, list):
+        kept = [
+            drop_placeholders(elem)
+            for elem in value
+            if elem != FIDESOPS_DO_NOT_MASK_INDEX
+        ]
+        if len(kept) == len(value) and all(new is old for new, old in zip(kept, value)):
+            return value
+        return kept
+    return value
@@ -0,0 +1,360 @@
+import asyncio
+import heapq
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from enum import Enum
+from functools import partial
+from itertools import count
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from fidesops.common_exceptions import (
+    NoSuchExecutorException,
+    RetryTask,
+    TraversalError,
+)
+from fidesops.core.config import config
+
+logger = logging.getLogger(__name__)
+
+TaskGraph = Dict[Hashable, Tuple[Any, ...]]
+"""A graph of tasks in the form {key: (callable, *args)}. Any argument that is itself a key
+in the graph is replaced by the output of that key's task before the callable is run, so
+a task starts as soon as every key it names has finished."""
+
+
+def is_key(arg: Any, graph: TaskGraph) -> bool:
+    """True if the argument names another task in the graph"""
+    try:
+        return arg in graph
+    except TypeError:  # unhashable arguments (e.g. lists of rows) are plain data
+        return False
+
+
+class InlineExecutor(Executor):
+    """An Executor that runs each submitted callable immediately in the calling thread."""
+
+    def submit(  # type: ignore # pylint: disable=arguments-differ
+        self, fn: Callable, *args: Any, **kwargs: Any
+    ) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:  # pylint: disable=broad-except
+            future.set_exception(exc)
+        return future
+
+
+class EventLoopExecutor(Executor):
+    """An Executor that runs submitted coroutine functions on an asyncio event loop in a
+    background thread. Plain callables are run on the loop's pool of `max_workers` threads,
+    so they do not block the loop."""
+
+    def __init__(self, max_workers: int):
+        self.threads = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fidesops-graph"
+        )
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(self.threads)
+        self.loop_thread = threading.Thread(
+            target=self.loop.run_forever, name="fidesops-graph-loop", daemon=True
+        )
+        self.loop_thread.start()
+
+    def submit(  # type: ignore # pylint: disable=arguments-differ
+        self, fn: Callable, *args: Any, **kwargs: Any
+    ) -> Future:
+        if asyncio.iscoroutinefunction(fn):
+            return asyncio.run_coroutine_threadsafe(fn(*args, **kwargs), self.loop)
+
+        async def run_in_thread() -> Any:
+            return await self.loop.run_in_executor(None, partial(fn, *args, **kwargs))
+
+        return asyncio.run_coroutine_threadsafe(run_in_thread(), self.loop)
+
+    def shutdown(  # pylint: disable=redefined-outer-name
+        self, wait: bool = True, *, cancel_futures: bool = False
+    ) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join()
+        # Tasks abandoned after a failure are cancelled rather than destroyed while pending
+        pending = asyncio.all_tasks(self.loop)
+        if pending:
+            for task in pending:
+                task.cancel()
+            self.loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True)
+            )
+        self.loop.close()
+        self.threads.shutdown(wait, cancel_futures=cancel_futures)
+
+
+class GraphExecutor(ABC):
+    """Runs a task graph, starting each task as soon as all of the tasks it depends on
+    have completed. At most `max_workers` tasks are in flight at any one time.
+
+    Executors that run coroutines set `runs_coroutines`, so that the async variants of tasks
+    are submitted to them."""
+
+    runs_coroutines: bool = False
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers: int = max(
+            1, max_workers or config.execution.TASK_MAX_PARALLELISM
+        )
+
+    @abstractmethod
+    def pool(self, graph: TaskGraph) -> Executor:
+        """Return the Executor that ready tasks are submitted to"""
+
+    def submit(
+        self, pool: Executor, graph: TaskGraph, key: Hashable, args: List[Any]
+    ) -> Future:
+        """Submit a single ready task to the pool"""
+        return pool.submit(graph[key][0], *args)
+
+    def get(  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+        self,
+        graph: TaskGraph,
+        result_key: Hashable,
+        task_resources: Optional[Dict[Hashable, Hashable]] = None,
+        resource_limits: Optional[Dict[Hashable, int]] = None,
+        on_skipped: Optional[Callable[[List[Hashable]], Any]] = None,
+    ) -> Any:
+        """Run every task that `result_key` depends on, then return the output of `result_key`.
+
+        Outputs are released as soon as every task that consumes them has started, so only
+        the frontier of the graph is held in memory at once.
+
+        `task_resources` optionally maps task keys to the resource they use (e.g. a connection key),
+        and `resource_limits` caps how many tasks may use each resource at once. A ready task whose
+        resource is saturated is passed over in favour of ready tasks for other resources.
+
+        A task that raises RetryTask is run again with the same arguments once its delay has passed,
+        without holding a worker while it waits.
+
+        If `on_skipped` is given, a task (other than `result_key`) whose dependencies all output an empty
+        list is not run; its output is an empty list too. Its dependents are checked in turn, so a subtree
+        that no data reaches is skipped at once, and `on_skipped` is called once with all of its keys."""
+        resources: Dict[Hashable, Hashable] = task_resources or {}
+        limits: Dict[Hashable, int] = {
+            resource: max(1, limit)
+            for resource, limit in (resource_limits or {}).items()
+        }
+        in_use: Dict[Hashable, int] = {resource: 0 for resource in limits}
+
+        def has_capacity(key: Hashable) -> bool:
+            resource = resources.get(key)
+            return resource not in limits or in_use[resource] < limits[resource]
+
+        dependencies: Dict[Hashable, List[Hashable]] = {
+            key: [arg for arg in spec[1:] if is_key(arg, graph)]
+            for key, spec in graph.items()
+        }
+        required: List[Hashable] = self._required_keys(
+            dependencies, result_key, list(graph)
+        )
+
+        waiting_on: Dict[Hashable, Set[Hashable]] = {
+            key: set(dependencies[key]) for key in required
+        }
+        dependents: Dict[Hashable, List[Hashable]] = {key: [] for key in required}
+        for key in required:
+            for dependency in waiting_on[key]:
+                dependents[dependency].append(key)
+        unstarted_dependents: Dict[Hashable, int] = {
+            key: len(dependents[key]) for key in required
+        }
+
+        ready: List[Hashable] = [key for key in required if not waiting_on[key]]
+        results: Dict[Hashable, Any] = {}
+        running: Dict[Future, Hashable] = {}
+        # Tasks waiting to be retried, as a heap of (time they may run, tiebreak, key), and
+        # the arguments they were started with
+        delayed: List[Tuple[float, int, Hashable]] = []
+        retry_count = count()
+        started_args: Dict[Hashable, List[Any]] = {}
+        finished = 0
+
+        def release_dependencies(key: Hashable) -> None:
+            # Outputs no longer needed by any unstarted task are released
+            for dependency in set(dependencies[key]):
+                unstarted_dependents[dependency] -= 1
+                if not unstarted_dependents[dependency] and dependency != result_key:
+                    results.pop(dependency, None)
+
+        def skips(key: Hashable) -> bool:
+            return (
+                on_skipped is not None
+                and key != result_key
+                and bool(dependencies[key])
+                and all(results[dependency] == [] for dependency in dependencies[key])
+            )
+
+        def complete(key: Hashable) -> None:
+            """Make the dependents of a finished task ready, skipping those that no data reaches"""
+            nonlocal finished
+            finished += 1
+            skipped: List[Hashable] = []
+            stack = [key]
+            while stack:
+                parent = stack.pop()
+                for dependent in dependents[parent]:
+                    waiting_on[dependent].discard(parent)
+                    if waiting_on[dependent]:
+                        continue
+                    if skips(dependent):
+                        release_dependencies(dependent)
+                        results[dependent] = []
+                        finished += 1
+                        skipped.append(dependent)
+                        stack.append(dependent)
+                    else:
+                        ready.append(dependent)
+            if skipped:
+                on_skipped(skipped)  # type: ignore
+
+        with self.pool(graph) as pool:
+            try:
+                while ready or running or delayed:
+                    while delayed and delayed[0][0] <= time.monotonic():
+                        ready.append(heapq.heappop(delayed)[2])
+                    while ready and len(running) < self.max_workers:
+                        key = next(filter(has_capacity, ready), None)
+                        if key is None:
+                            break
+                        ready.remove(key)
+                        if resources.get(key) in in_use:
+                            in_use[resources[key]] += 1
+                        if key not in started_args:
+                            started_args[key] = [
+                                results[arg] if is_key(arg, graph) else arg
+                                for arg in graph[key][1:]
+                            ]
+                            release_dependencies(key)
+                        running[self.submit(pool, graph, key, started_args[key])] = key
+
+                    next_retry = (
+                        max(delayed[0][0] - time.monotonic(), 0) if delayed else None
+                    )
+                    if not running:
+                        time.sleep(next_retry or 0)
+                        continue
+                    done, _ = wait(
+                        running, timeout=next_retry, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        key = running.pop(future)
+                        if resources.get(key) in in_use:
+                            in_use[resources[key]] -= 1
+                        try:
+                            results[key] = future.result()
+                        except RetryTask as retry:
+                            heapq.heappush(
+                                delayed,
+                                (
+                                    time.monotonic() + retry.delay,
+                                    next(retry_count),
+                                    key,
+                                ),
+                            )
+                            continue
+                        started_args.pop(key)
+                        complete(key)
+            except BaseException:
+                for future in running:
+                    future.cancel()
+                raise
+
+        if finished < len(required):
+            raise TraversalError(
+                f"Unable to run {len(required) - finished} tasks of the graph; their dependencies could not be satisfied."
+            )
+        return results[result_key]
+
+    @staticmethod
+    def _required_keys(
+        dependencies: Dict[Hashable, List[Hashable]],
+        result_key: Hashable,
+        graph_order: List[Hashable],
+    ) -> List[Hashable]:
+        """All keys that result_key transitively depends on (including itself), in graph order"""
+        required: Set[Hashable] = set()
+        stack = [result_key]
+        while stack:
+            key = stack.pop()
+            if key not in required:
+                required.add(key)
+                stack.extend(dependencies[key])
+        return [key for key in graph_order if key in required]
+
+
+class SerialGraphExecutor(GraphExecutor):
+    """Runs one task at a time in the calling thread."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        super().__init__(1)
+
+    def pool(self, graph: TaskGraph) -> Executor:
+        return InlineExecutor()
+
+
+class ThreadPoolGraphExecutor(GraphExecutor):
+    """Runs tasks concurrently on a pool of threads in this process."""
+
+    def pool(self, graph: TaskGraph) -> Executor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fidesops-graph"
+        )
+
+
+class AsyncioGraphExecutor(GraphExecutor):
+    """Runs tasks as coroutines on an asyncio event loop, so that tasks waiting on I/O do not
+    each hold a thread. Up to `max_workers` coroutines (TASK_MAX_COROUTINES by default) are in
+    flight at once. Tasks that are not coroutine functions, and the blocking work of those that
+    are, are run on a pool of `max_threads` threads (TASK_MAX_PARALLELISM by default)."""
+
+    runs_coroutines = True
+
+    def __init__(
+        self, max_workers: Optional[int] = None, max_threads: Optional[int] = None
+    ):
+        super().__init__(max_workers or config.execution.TASK_MAX_COROUTINES)
+        self.max_threads: int = max(
+            1, max_threads or config.execution.TASK_MAX_PARALLELISM
+        )
+
+    def pool(self, graph: TaskGraph) -> Executor:
+        return EventLoopExecutor(self.max_threads)
+
+
+class SupportedGraphExecutors(Enum):
+    """The supported ways in which Fidesops can run the tasks of a privacy request graph"""
+
+    serial = SerialGraphExecutor
+    thread = ThreadPoolGraphExecutor
+    asyncio = AsyncioGraphExecutor
+
+
+def get_executor(
+    executor_name: Optional[str] = None, max_workers: Optional[int] = None
+) -> GraphExecutor:
+    """
+    Returns the graph executor with the given name, defaulting to the configured TASK_EXECUTOR.
+    Raises NoSuchExecutorException if the executor does not exist
+    """
+    executor_name = executor_name or config.execution.TASK_EXECUTOR
+    if executor_name not in SupportedGraphExecutors.__members__:
+        valid_executors = ", ".join([e.name for e in SupportedGraphExecutors])
+        raise NoSuchExecutorException(
+            f"Executor '{executor_name}' does not exist. Valid executors are [{valid_executors}]"
+        )
+    return SupportedGraphExecutors[executor_name].value(max_workers)
@@ -1,46 +1,120 @@
+# pylint: disable=too-many-lines
+import asyncio
 import copy
+import random
+import threading
+import time
 
 import logging
 import traceback
 from abc import ABC
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
 from functools import wraps
+from typing import (
+    List,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    Mapping,
+    Tuple,
+    Callable,
+    Optional,
+    Set,
+    Hashable,
+)
 
-from time import sleep
-from typing import List, Dict, Any, Tuple, Callable, Optional, Set
-
-import dask
-from dask.threaded import get
+from pymongo.errors import AutoReconnect, ExecutionTimeout
+from sqlalchemy.exc import DBAPIError, OperationalError
 
+from fidesops.common_exceptions import (
+    ClientUnsuccessfulException,
+    ConnectionException,
+    RetryTask,
+)
 from fidesops.core.config import config
 from fidesops.graph.config import (
     CollectionAddress,
     ROOT_COLLECTION_ADDRESS,
     TERMINATOR_ADDRESS,
     FieldPath,
-    Field,
     FieldAddress,
 )
 from fidesops.graph.graph import Edge, DatasetGraph, Node
-from fidesops.graph.traversal import TraversalNode, Traversal
+from fidesops.graph.traversal import (
+    COLLECTION_FIELD_PATH_MAP,
+    NodePlan,
+    TraversalNode,
+    Traversal,
+)
 from fidesops.models.connectionconfig import ConnectionConfig, AccessLevel
 from fidesops.models.policy import ActionType, Policy
 from fidesops.models.privacy_request import PrivacyRequest, ExecutionLogStatus
 from fidesops.service.connectors import BaseConnector
 from fidesops.task.consolidate_query_matches import consolidate_query_matches
-from fidesops.task.filter_element_match import filter_element_match
+from fidesops.task.filter_element_match import (
+    drop_placeholders,
+    filter_element_match,
+)
+from fidesops.task.graph_executor import get_executor
 from fidesops.task.refine_target_path import FieldPathNodeInput
-from fidesops.task.task_resources import TaskResources
+from fidesops.task.task_resources import BatchTaskResources, TaskResources
+from fidesops.util.async_util import to_thread
 from fidesops.util.cache import get_cache
-from fidesops.util.collection_util import partition, append, NodeInput, Row
+from fidesops.util.collection_util import append_unique, NodeInput, Row
 from fidesops.util.logger import NotPii
 from fidesops.util.saas_util import FIDESOPS_GROUPED_INPUTS
+from fidesops.util.tracing import (
+    CACHE,
+    CONNECTOR,
+    POST_PROCESSING,
+    QUERY_GENERATION,
+    count,
+    recording_spans,
+    span,
+    spanned_iterator,
+)
 
 logger = logging.getLogger(__name__)
 
-dask.config.set(scheduler="processes")
-
 EMPTY_REQUEST = PrivacyRequest()
-COLLECTION_FIELD_PATH_MAP = Dict[CollectionAddress, List[Tuple[FieldPath, FieldPath]]]
+
+
+TRANSIENT_HTTP_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether an error might not recur if the failed request is retried: a dropped connection,
+    a timeout, a rate limit, a lock timeout or deadlock, or a server error. Other errors, such as
+    invalid queries or misconfiguration, are permanent."""
+    if isinstance(exc, ClientUnsuccessfulException):
+        return exc.status_code in TRANSIENT_HTTP_STATUS_CODES
+    if isinstance(exc, DBAPIError):
+        # OperationalErrors include disconnects, lock and statement timeouts and deadlocks
+        return exc.connection_invalidated or isinstance(exc, OperationalError)
+    return isinstance(
+        exc,
+        (
+            ConnectionException,
+            AutoReconnect,
+            ExecutionTimeout,
+            ConnectionError,
+            TimeoutError,
+        ),
+    )
+
+
+def retry_delay(attempt: int) -> float:
+    """The delay before retrying a node after its `attempt`th failure, backing off exponentially.
+
+    The delay is jittered so that nodes which failed together, e.g. when a database was briefly
+    unreachable, do not all retry at the same moment."""
+    delay = config.execution.TASK_RETRY_DELAY * (
+        config.execution.TASK_RETRY_BACKOFF ** (attempt + 1)
+    )
+    return random.uniform(delay / 2, delay)
 
 
 def retry(
@@ -50,43 +124,95 @@ def retry(
     """
     Retry decorator for access and right to forget requests requests -
 
-    If an exception is raised, we retry the function `count` times with exponential backoff. After the number of
-    retries have expired, we call GraphTask.end() with the appropriate `action_type` and `default_return`.
+    If a transient error is raised, we raise RetryTask so that the graph executor runs the function again after
+    `retry_delay`, up to TASK_RETRY_COUNT times. Other nodes keep running while this one waits. If the error is
+    permanent, or the retries have run out, we call GraphTask.end() with the appropriate `action_type` and
+    `default_return`.
+
+    No attempt is made once the privacy request has been canceled or has passed its deadline, and no retry
+    is made that would start more than TASK_TIMEOUT_SECONDS after the node's first attempt.
     """
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def result(*args: Any, **kwargs: Any) -> List[Optional[Row]]:
-            func_delay = config.execution.TASK_RETRY_DELAY
-            method_name = func.__name__
-            self = args[0]
+        method_name = func.__name__
+
+        def start_attempt(self: "GraphTask") -> None:
+            self.resources.raise_if_halted()
+            self.first_attempt_at.setdefault(method_name, time.monotonic())
+            # Create ExecutionLog with status in_processing or retrying
+            if self.retry_attempts[method_name]:
+                self.log_retry(action_type)
+            else:
+                self.log_start(action_type)
+
+        @contextmanager
+        def node_span(self: "GraphTask") -> Iterator[None]:
+            # Time the attempt, and the stages within it, for the privacy request's trace
+            with recording_spans(self.resources.spans), span(
+                str(self.traversal_node.address),
+                action_type.value,
+                attempt=self.retry_attempts[method_name],
+            ):
+                yield
 
-            raised_ex = None
-            for attempt in range(config.execution.TASK_RETRY_COUNT + 1):
-                try:
-                    # Create ExecutionLog with status in_processing or retrying
-                    if attempt:
-                        self.log_retry(action_type)
-                    else:
-                        self.log_start(action_type)
-                    # Run access or erasure request
-                    return func(*args, **kwargs)
-                except BaseException as ex:  # pylint: disable=W0703
-                    func_delay *= config.execution.TASK_RETRY_BACKOFF
+        def past_deadline(self: "GraphTask", delay: float) -> bool:
+            """Whether a retry after `delay` seconds would start past the node's deadline"""
+            timeout = config.execution.TASK_TIMEOUT_SECONDS
+            return bool(timeout) and (
+                time.monotonic() + delay > self.first_attempt_at[method_name] + timeout
+            )
+
+        def handle_failure(self: "GraphTask", ex: BaseException) -> Any:
+            attempt = self.retry_attempts[method_name]
+            self.retry_attempts[method_name] += 1
+            if attempt < config.execution.TASK_RETRY_COUNT and is_transient_error(ex):
+                delay = retry_delay(attempt)
+                if not past_deadline(self, delay):
                     logger.warning(
-                        f"Retrying {method_name} {self.traversal_node.address} in {func_delay} seconds..."
+                        f"Retrying {method_name} {self.traversal_node.address} in {delay:.2f} seconds..."
                     )
-                    sleep(func_delay)
-                    raised_ex = ex
-            self.log_end(action_type, raised_ex)
+                    raise RetryTask(delay) from ex
+                logger.warning(
+                    f"Not retrying {method_name} {self.traversal_node.address}, as it would run past its deadline"
+                )
+            self.log_end(action_type, ex)
             return default_return
 
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_result(*args: Any, **kwargs: Any) -> List[Optional[Row]]:
+                # Checking for a halt and writing execution logs block on redis and the
+                # application db, so they are kept off the event loop
+                await to_thread(start_attempt, args[0])
+                try:
+                    with node_span(args[0]):
+                        return await func(*args, **kwargs)
+                except (asyncio.CancelledError, KeyboardInterrupt, SystemExit):
+                    raise
+                except BaseException as ex:  # pylint: disable=W0703
+                    return await to_thread(handle_failure, args[0], ex)
+
+            return async_result
+
+        @wraps(func)
+        def result(*args: Any, **kwargs: Any) -> List[Optional[Row]]:
+            start_attempt(args[0])
+            try:
+                # Run access or erasure request
+                with node_span(args[0]):
+                    return func(*args, **kwargs)
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except BaseException as ex:  # pylint: disable=W0703
+                return handle_failure(args[0], ex)
+
         return result
 
     return decorator
 
 
-class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
+class GraphTask(ABC):  # pylint: disable=R0902, R0904
     """A task that operates on one traversal_node of a traversal"""
 
     def __init__(
@@ -95,24 +221,30 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         super().__init__()
         self.traversal_node = traversal_node
         self.resources = resources
+        # The number of failed attempts at each retried method
+        self.retry_attempts: Dict[str, int] = defaultdict(int)
+        # When each retried method was first attempted (time.monotonic), to bound its retries
+        self.first_attempt_at: Dict[str, float] = {}
         self.connector: BaseConnector = resources.get_connector(
             self.traversal_node.node.dataset.connection_key  # ConnectionConfig.key
         )
 
+        self.plan: NodePlan = self.traversal_node.plan
+
         # build incoming edges to the form : [dataset address: [(foreign field, local field)]
-        self.incoming_edges_by_collection: Dict[
-            CollectionAddress, List[Edge]
-        ] = partition(
-            self.traversal_node.incoming_edges(), lambda e: e.f1.collection_address()
-        )
+        self.incoming_edges_by_collection: Mapping[
+            CollectionAddress, Tuple[Edge, ...]
+        ] = self.plan.incoming_edges_by_collection
 
-        # the input keys this task will read from.These will build the dask graph
-        self.input_keys: List[CollectionAddress] = sorted(
-            self.incoming_edges_by_collection.keys()
-        )
+        # the input keys this task will read from.These will build the task graph
+        self.input_keys: List[CollectionAddress] = list(self.plan.input_keys)
 
         self.key = self.traversal_node.address
 
+        # the top-level fields of this collection that its children read. Only these are
+        # handed on to the children; full results are read back from the cache.
+        self.output_keys: Set[str] = self.plan.output_keys
+
         self.execution_log_id = None
         # a local copy of the execution log record written to. If we write multiple status
         # updates, we will use this id to ensure that we're updating rather than creating
@@ -131,9 +263,9 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
     @property
     def dependent_identity_fields(self) -> bool:
         """If the current collection needs inputs from other collections, in addition to its seed data."""
-        collection = self.traversal_node.node.collection
+        field_dict = self.plan.field_dict
         for field in self.grouped_fields:
-            if collection.field(FieldPath(field)).identity:
+            if field_dict[FieldPath(field)].identity:
                 return True
         return False
 
@@ -150,23 +282,9 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         If False, all fields are returned in the first tuple, and the second tuple just maps collections to an empty list.
 
         """
-
-        def field_map(keep: Callable) -> COLLECTION_FIELD_PATH_MAP:
-            return {
-                col_addr: [
-                    (edge.f1.field_path, edge.f2.field_path)
-                    for edge in edge_list
-                    if keep(edge.f2.field_path.string_path)
-                ]
-                for col_addr, edge_list in self.incoming_edges_by_collection.items()
-            }
-
         if group_dependent_fields:
-            return field_map(
-                lambda string_path: string_path not in self.grouped_fields
-            ), field_map(lambda string_path: string_path in self.grouped_fields)
-
-        return field_map(lambda string_path: True), field_map(lambda string_path: False)
+            return self.plan.grouped_incoming_field_path_maps
+        return self.plan.incoming_field_path_maps
 
     def generate_dry_run_query(self) -> str:
         """Type-specific query generated for this traversal_node."""
@@ -177,27 +295,6 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         connection_config: ConnectionConfig = self.connector.configuration
         return connection_config.access == AccessLevel.write
 
-    def _combine_seed_data(
-        self,
-        *data: List[Row],
-        grouped_data: Dict[str, Any],
-        dependent_field_mappings: COLLECTION_FIELD_PATH_MAP,
-    ) -> Dict[str, Any]:
-        """Combine the seed data with the other dependent inputs. This is used when the seed data in a collection requires
-        inputs from another collection to generate subsequent queries."""
-        # Get the identity values from the seeds that were passed into this collection.
-        seed_index = self.input_keys.index(ROOT_COLLECTION_ADDRESS)
-        seed_data = data[seed_index]
-
-        for (foreign_field_path, local_field_path) in dependent_field_mappings[
-            ROOT_COLLECTION_ADDRESS
-        ]:
-            dependent_values: List = consolidate_query_matches(
-                row=seed_data, target_path=foreign_field_path
-            )
-            grouped_data[local_field_path.string_path] = dependent_values
-        return grouped_data
-
     def pre_process_input_data(
         self, *data: List[Row], group_dependent_fields: bool = False
     ) -> NodeInput:
@@ -221,6 +318,21 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
          If there are dependent fields from one collection into another, they are separated out as follows:
          {fidesops_grouped_inputs: [{"organization_id": 1, "project_id": "math}, {"organization_id": 5, "project_id": "science"}]
         """
+        grouped, ungrouped = self.consolidate_input_data(*data)
+        return grouped if group_dependent_fields else ungrouped
+
+    def consolidate_input_data(  # pylint: disable=R0912, R0914
+        self, *data: List[Row]
+    ) -> Tuple[NodeInput, NodeInput]:
+        """
+        Consolidates the outputs of upstream queries in a single pass, returning both the grouped and the
+        ungrouped views of them that pre_process_input_data builds. Values are deduplicated per field, as are
+        groups of dependent values, keeping the order they were first seen in. Values of different types,
+        such as 1 and "1", are kept apart.
+
+        The number of duplicates left out of the grouped view, which the queries are built from, is logged
+        and recorded as a counter in the trace.
+        """
         if not len(data) == len(self.input_keys):
             logger.warning(
                 "%s expected %s input keys, received %s",
@@ -229,59 +341,66 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 NotPii(len(data)),
             )
 
-        output: Dict[str, List[Any]] = {FIDESOPS_GROUPED_INPUTS: []}
-
-        (
-            independent_field_mappings,
-            dependent_field_mappings,
-        ) = self.build_incoming_field_path_maps(group_dependent_fields)
+        grouped: NodeInput = {FIDESOPS_GROUPED_INPUTS: []}
+        ungrouped: NodeInput = {FIDESOPS_GROUPED_INPUTS: []}
+        grouped_seen: Dict[str, Set[Hashable]] = {}
+        ungrouped_seen: Dict[str, Set[Hashable]] = {}
+        duplicates = 0
+
+        input_matchers = self.plan.input_matchers
+        dependent_identity_fields = self.dependent_identity_fields
+        # Grouped seed values are combined with each group of the other dependent inputs
+        seed_grouped_data: Dict[str, Any] = {}
+        if dependent_identity_fields:
+            seed_data = data[self.input_keys.index(ROOT_COLLECTION_ADDRESS)]
+            for matcher, local_path, is_grouped in input_matchers.get(
+                ROOT_COLLECTION_ADDRESS, []
+            ):
+                if is_grouped:
+                    seed_grouped_data[local_path] = matcher(seed_data)
 
         for i, rowset in enumerate(data):
             collection_address = self.input_keys[i]
-
-            if (
-                group_dependent_fields
-                and self.dependent_identity_fields
+            matchers = input_matchers.get(collection_address, [])
+            # Skip building grouped data for the root collection if the seed data needs to be combined
+            # with other inputs
+            skip_grouped = (
+                dependent_identity_fields
                 and collection_address == ROOT_COLLECTION_ADDRESS
-            ):
-                # Skip building data for the root collection if the seed data needs to be combined with other inputs
-                continue
+            )
+            has_grouped_fields = any(is_grouped for _, _, is_grouped in matchers)
 
             logger.info(
                 f"Consolidating incoming data into {self.traversal_node.node.address} from {collection_address}."
             )
             for row in rowset:
-                # Consolidate lists of independent field inputs
-                for foreign_field_path, local_field_path in independent_field_mappings[
-                    collection_address
-                ]:
-                    new_values: List = consolidate_query_matches(
-                        row=row, target_path=foreign_field_path
-                    )
-                    if new_values:
-                        append(output, local_field_path.string_path, new_values)
-
-                # Separately group together dependent inputs if applicable
-                if dependent_field_mappings[collection_address]:
-                    grouped_data: Dict[str, Any] = {}
-                    for (
-                        foreign_field_path,
-                        local_field_path,
-                    ) in dependent_field_mappings[collection_address]:
-                        dependent_values: List = consolidate_query_matches(
-                            row=row, target_path=foreign_field_path
+                grouped_data: Dict[str, Any] = {}
+                for matcher, local_path, is_grouped in matchers:
+                    values: List = matcher(row)
+                    append_unique(ungrouped, ungrouped_seen, local_path, values)
+                    if skip_grouped:
+                        continue
+                    if is_grouped:
+                        grouped_data[local_path] = values
+                    else:
+                        duplicates += append_unique(
+                            grouped, grouped_seen, local_path, values
                         )
-                        grouped_data[local_field_path.string_path] = dependent_values
 
-                    if self.dependent_identity_fields:
-                        grouped_data = self._combine_seed_data(
-                            *data,
-                            grouped_data=grouped_data,
-                            dependent_field_mappings=dependent_field_mappings,
-                        )
+                # Separately group together dependent inputs if applicable
+                if has_grouped_fields and not skip_grouped:
+                    if dependent_identity_fields:
+                        grouped_data.update(seed_grouped_data)
+                    duplicates += append_unique(
+                        grouped, grouped_seen, FIDESOPS_GROUPED_INPUTS, [grouped_data]
+                    )
 
-                    output[FIDESOPS_GROUPED_INPUTS].append(grouped_data)
-        return output
+        if duplicates:
+            logger.info(
+                f"Skipped {duplicates} duplicate input values into {self.traversal_node.node.address}."
+            )
+        count("duplicate_inputs", QUERY_GENERATION, skipped=duplicates)
+        return grouped, ungrouped
 
     def update_status(
         self,
@@ -334,6 +453,16 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 ExecutionLogStatus.complete,
             )
 
+    def log_skipped(self, action_type: ActionType) -> None:
+        """Record that the node was not run, as none of its inputs returned any data"""
+        logger.info(f"Skipping {self.resources.request.id}, traversal_node {self.key}")
+        self.update_status(
+            "skipped: no data was found for any input",
+            [],
+            action_type,
+            ExecutionLogStatus.complete,
+        )
+
     def post_process_input_data(
         self, pre_processed_inputs: NodeInput
     ) -> FieldPathNodeInput:
@@ -352,14 +481,10 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         {FieldPath("owner", "phone"): None, FieldPath("owner", "identifier"): [1234, 5678, 9102]}
         """
         out: FieldPathNodeInput = {}
+        query_fields = self.plan.query_fields
         for key, values in pre_processed_inputs.items():
-            path: FieldPath = FieldPath.parse(key)
-            field: Field = self.traversal_node.node.collection.field(path)
-            if (
-                field
-                and path in self.traversal_node.query_field_paths
-                and isinstance(values, list)
-            ):
+            if key in query_fields and isinstance(values, list):
+                path, field = query_fields[key]
                 if field.return_all_elements:
                     # All data will be returned
                     out[path] = None
@@ -374,67 +499,137 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         return out
 
     def access_results_post_processing(
-        self, formatted_input_data: NodeInput, output: List[Row]
+        self, formatted_input_data: NodeInput, output: Iterable[List[Row]]
     ) -> List[Row]:
         """
-        Completes post-processing filtering of access request results.
+        Completes post-processing filtering of access request results, which arrive in chunks of rows.
 
         By default, if an array field was an entry point into the node, return only array elements that *match* the
         condition.  Specifying return_all_elements = true on the field's config will instead return *all* array elements.
 
-        Caches the data in TWO separate formats: 1) erasure format, *replaces* unmatched array elements with placeholder
-        text, and 2) access request format, which *removes* unmatched array elements altogether.  If no data was filtered
-        out, both cached versions will be the same.
+        Only one form of the rows is held: the erasure format, which *replaces* unmatched array elements with
+        placeholder text. The access request format, which *removes* unmatched array elements altogether, is derived
+        from it where it is needed, sharing all data that was not filtered out.
         """
         post_processed_node_input_data: FieldPathNodeInput = (
             self.post_process_input_data(formatted_input_data)
         )
+        placeholder_output: List[Row] = []
 
-        # For erasures: cache results with non-matching array elements *replaced* with placeholder text
-        placeholder_output: List[Row] = copy.deepcopy(output)
-        for row in placeholder_output:
-            filter_element_match(
-                row, query_paths=post_processed_node_input_data, delete_elements=False
+        for chunk in spanned_iterator(output, "retrieve_data", CONNECTOR):
+            logger.info(
+                f"Filtering {len(chunk)} rows in {self.traversal_node.node.address} for matching array elements."
+            )
+            for row in chunk:
+                filter_element_match(
+                    row,
+                    query_paths=post_processed_node_input_data,
+                    delete_elements=False,
+                )
+            placeholder_output.extend(chunk)
+
+        with span("cache_results", CACHE):
+            self.resources.cache_results_with_placeholders(
+                f"access_request__{self.key}", placeholder_output
             )
-        self.resources.cache_results_with_placeholders(
-            f"access_request__{self.key}", placeholder_output
+
+        # Return filtered rows with non-matched array data removed.
+        return [drop_placeholders(row) for row in placeholder_output]
+
+    def rows_reached_by(self, rows: List[Row], *inputs: List[Row]) -> List[Row]:
+        """Of the given rows, return those that this node's query would have returned had it only
+        been given these inputs. Used to attribute the rows returned for a batch of privacy
+        requests back to each request in the batch."""
+        query_input: NodeInput = self.pre_process_input_data(
+            *inputs, group_dependent_fields=True
+        )
+        grouped_inputs: List[Dict[str, Any]] = query_input.pop(
+            FIDESOPS_GROUPED_INPUTS, []
         )
+        values_by_path: Dict[FieldPath, List[Any]] = {
+            FieldPath.parse(key): values
+            for key, values in self.traversal_node.typed_filtered_values(
+                query_input
+            ).items()
+        }
 
-        # For access request results, cache results with non-matching array elements *removed*
-        for row in output:
-            logger.info(
-                f"Filtering row in {self.traversal_node.node.address} for matching array elements."
+        def matches(row: Row, path: FieldPath, values: List[Any]) -> bool:
+            return any(
+                value in values
+                for value in consolidate_query_matches(row=row, target_path=path)
             )
-            filter_element_match(row, post_processed_node_input_data)
-        self.resources.cache_object(f"access_request__{self.key}", output)
 
-        # Return filtered rows with non-matched array data removed.
-        return output
+        def reached(row: Row) -> bool:
+            if any(
+                matches(row, path, values) for path, values in values_by_path.items()
+            ):
+                return True
+            return any(
+                all(
+                    matches(row, FieldPath.parse(key), values)
+                    for key, values in group.items()
+                )
+                for group in grouped_inputs
+            )
+
+        return [row for row in rows if reached(row)]
 
     @retry(action_type=ActionType.access, default_return=[])
     def access_request(self, *inputs: List[Row]) -> List[Row]:
         """Run an access request on a single node."""
-        formatted_input_data: NodeInput = self.pre_process_input_data(
-            *inputs, group_dependent_fields=True
+        formatted_input_data, ungrouped_input_data = self.consolidate_input_data(
+            *inputs
         )
-        output: List[Row] = self.connector.retrieve_data(
+        output: Iterable[List[Row]] = self.connector.retrieve_data_chunks(
             self.traversal_node,
             self.resources.policy,
             self.resources.request,
             formatted_input_data,
         )
-        filtered_output: List[Row] = self.access_results_post_processing(
-            self.pre_process_input_data(*inputs, group_dependent_fields=False), output
+        return self.complete_access_request(output, ungrouped_input_data)
+
+    @retry(action_type=ActionType.access, default_return=[])
+    async def access_request_async(self, *inputs: List[Row]) -> List[Row]:
+        """Run an access request on a single node without blocking the event loop. The processing
+        of the node's inputs and results is run on the loop's threads, and so is the reading of
+        any results the connector streams."""
+        formatted_input_data, ungrouped_input_data = await to_thread(
+            self.consolidate_input_data, *inputs
+        )
+        # Streamed rows are timed as their chunks are read in access_results_post_processing;
+        # connectors that retrieve their rows up front time it themselves
+        output: Iterable[List[Row]] = await self.connector.retrieve_data_chunks_async(
+            self.traversal_node,
+            self.resources.policy,
+            self.resources.request,
+            formatted_input_data,
+        )
+        return await to_thread(
+            self.complete_access_request, output, ungrouped_input_data
         )
-        self.log_end(ActionType.access)
-        return filtered_output
 
-    @retry(action_type=ActionType.erasure, default_return=0)
-    def erasure_request(self, retrieved_data: List[Row]) -> int:
-        """Run erasure request"""
+    def complete_access_request(
+        self, output: Iterable[List[Row]], input_data: NodeInput
+    ) -> List[Row]:
+        """Filter the rows retrieved by an access request against the ungrouped input data, cache them,
+        and return the fields of them that the node's children read."""
+        with span("access_results_post_processing", POST_PROCESSING):
+            filtered_output: List[Row] = self.access_results_post_processing(
+                input_data, output
+            )
+        self.log_end(ActionType.access)
+        with span("cache_checkpoint", CACHE):
+            self.resources.cache_checkpoint(f"access_request__{self.key}")
+        return [
+            {key: row[key] for key in self.output_keys if key in row}
+            for row in filtered_output
+        ]
+
+    def can_erase(self) -> bool:
+        """Whether this node can be erased. If not, the reason is noted in the execution log."""
         # if there is no primary key specified in the graph node configuration
         # note this in the execution log and perform no erasures on this node
-        if not self.traversal_node.node.contains_field(lambda f: f.primary_key):
+        if not self.plan.primary_key_field_paths:
             logger.warning(
                 f"No erasures on {self.traversal_node.node.address} as there is no primary_key defined."
             )
@@ -444,7 +639,7 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 ActionType.erasure,
                 ExecutionLogStatus.complete,
             )
-            return 0
+            return False
 
         if not self.can_write_data():
             logger.warning(
@@ -457,15 +652,42 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 ActionType.erasure,
                 ExecutionLogStatus.error,
             )
+            return False
+        return True
+
+    @retry(action_type=ActionType.erasure, default_return=0)
+    def erasure_request(self, retrieved_data: List[Row]) -> int:
+        """Run erasure request"""
+        if not self.can_erase():
+            return 0
+        with span("mask_data", CONNECTOR):
+            output = self.connector.mask_data(
+                self.traversal_node,
+                self.resources.policy,
+                self.resources.request,
+                retrieved_data,
+            )
+        return self.complete_erasure_request(output)
+
+    @retry(action_type=ActionType.erasure, default_return=0)
+    async def erasure_request_async(self, retrieved_data: List[Row]) -> int:
+        """Run erasure request without blocking the event loop"""
+        if not await to_thread(self.can_erase):
             return 0
+        with span("mask_data", CONNECTOR):
+            output = await self.connector.mask_data_async(
+                self.traversal_node,
+                self.resources.policy,
+                self.resources.request,
+                retrieved_data,
+            )
+        return await to_thread(self.complete_erasure_request, output)
 
-        output = self.connector.mask_data(
-            self.traversal_node,
-            self.resources.policy,
-            self.resources.request,
-            retrieved_data,
-        )
+    def complete_erasure_request(self, output: int) -> int:
+        """Record that the node has been erased"""
         self.log_end(ActionType.erasure)
+        with span("cache_checkpoint", CACHE):
+            self.resources.cache_checkpoint(f"erasure_request__{self.key}", output)
         return output
 
 
@@ -485,21 +707,115 @@ def collect_queries(
     return env
 
 
-def run_access_request(
+def policy_targets(
+    policy: Policy, action_type: Optional[ActionType] = None
+) -> Callable[[TraversalNode], bool]:
+    """Return whether a traversal_node holds any of the data categories targeted by the policy's rules,
+    or by its rules of `action_type` only, if given"""
+    target_categories: List[str] = [
+        category
+        for rule in policy.rules
+        if action_type is None or rule.action_type == action_type
+        for category in rule.get_target_data_categories()
+    ]
+
+    def targeted(tn: TraversalNode) -> bool:
+        return any(
+            collection_category.startswith(target_category)
+            for collection_category in tn.plan.field_paths_by_category
+            for target_category in target_categories
+        )
+
+    return targeted
+
+
+def prune_tasks(
+    env: Dict[CollectionAddress, GraphTask],
+    end_nodes: List[CollectionAddress],
+    traversal: Traversal,
+    policy: Policy,
+) -> List[CollectionAddress]:
+    """If PRUNE_UNTARGETED_COLLECTIONS is set, remove the collections the policy does not need from the
+    tasks to run. Returns the collections the run must wait for: those none of the remaining collections
+    read from."""
+    if not config.execution.PRUNE_UNTARGETED_COLLECTIONS:
+        return end_nodes
+    pruned = traversal.pruned_addresses(policy_targets(policy))
+    if not pruned:
+        return end_nodes
+    logger.info(f"Pruned {len(pruned)} collections the policy does not need")
+    for address in pruned:
+        env.pop(address, None)
+    read_from = {key for task in env.values() for key in task.input_keys}
+    return [address for address in env if address not in read_from]
+
+
+def skip_access_requests(
+    env: Dict[CollectionAddress, GraphTask], resources: TaskResources
+) -> Callable[[List[CollectionAddress]], None]:
+    """Return the executor callback for collections that no data reached. Their empty results are
+    cached together, and each logs that it was skipped rather than starting and ending."""
+
+    def on_skipped(addresses: List[CollectionAddress]) -> None:
+        logger.info(f"Skipping {len(addresses)} collections that no data reached")
+        for address in addresses:
+            env[address].log_skipped(ActionType.access)
+        resources.cache_skipped_results(
+            [f"access_request__{address}" for address in addresses]
+        )
+
+    return on_skipped
+
+
+def checkpointed_output(output: Any) -> Callable[[], Any]:
+    """Return a task function that returns the output of a node that already completed in an earlier
+    run of the privacy request"""
+
+    def load() -> Any:
+        return output
+
+    return load
+
+
+def connection_limits(
+    env: Dict[CollectionAddress, GraphTask], connection_configs: List[ConnectionConfig]
+) -> Tuple[Dict[CollectionAddress, str], Dict[str, int]]:
+    """Returns the ConnectionConfig key each task queries, along with the max_concurrent_queries
+    of every ConnectionConfig that sets one, so the executor never runs more than that many
+    tasks against a single datastore at once."""
+    task_connections: Dict[CollectionAddress, str] = {
+        address: task.traversal_node.node.dataset.connection_key
+        for address, task in env.items()
+    }
+    limits: Dict[str, int] = {
+        connection_config.key: connection_config.max_concurrent_queries
+        for connection_config in connection_configs
+        if connection_config.max_concurrent_queries
+    }
+    return task_connections, limits
+
+
+def run_access_request(  # pylint: disable = too-many-arguments, too-many-locals
     privacy_request: PrivacyRequest,
     policy: Policy,
     graph: DatasetGraph,
     connection_configs: List[ConnectionConfig],
     identity: Dict[str, Any],
+    deadline: Optional[datetime] = None,
+    lease_lost: Optional[threading.Event] = None,
+    placeholders: bool = False,
 ) -> Dict[str, List[Row]]:
-    """Run the access request"""
+    """Run the access request. With `placeholders`, the results are returned as cached for erasures,
+    with placeholders marking the array elements that did not match; `drop_placeholders` removes them."""
     traversal: Traversal = Traversal(graph, identity)
-    with TaskResources(privacy_request, policy, connection_configs) as resources:
+    with TaskResources(
+        privacy_request, policy, connection_configs, deadline, lease_lost
+    ) as resources:
 
         def start_function(seed: Dict[str, Any]) -> Callable[[], List[Dict[str, Any]]]:
-            """Return a function that returns the seed value to kick off the dask function chain.
+            """Return a function that returns the seed value to kick off the task graph.
 
-            The first traversal_node in the dask function chain is just a function that when called returns
+            The first traversal_node in the task graph is just a function that when called returns
             the graph seed value."""
 
             def g() -> List[Dict[str, Any]]:
@@ -515,22 +831,181 @@ def run_access_request(
                 data[tn.address] = GraphTask(tn, resources)
 
         def termination_fn(*dependent_values: List[Row]) -> Dict[str, List[Row]]:
-            """A termination function that just returns its inputs mapped to their source addresses.
+            """A termination function that returns the results of every node, mapped to their addresses.
 
-            This needs to wait for all dependent keys because this is how dask is informed to wait for
+            This needs to wait for all dependent keys because this is how the executor is informed to wait for
             all terminating addresses before calling this."""
 
-            return resources.get_all_cached_objects()
+            return resources.pop_results(placeholders)
 
         env: Dict[CollectionAddress, Any] = {}
-        end_nodes = traversal.traverse(env, collect_tasks_fn)
+        end_nodes = prune_tasks(
+            env, traversal.traverse(env, collect_tasks_fn), traversal, policy
+        )
 
-        dsk = {k: (t.access_request, *t.input_keys) for k, t in env.items()}
+        executor = get_executor()
+        dsk = {
+            k: (
+                t.access_request_async
+                if executor.runs_coroutines
+                else t.access_request,
+                *t.input_keys,
+            )
+            for k, t in env.items()
+        }
+        # Collections completed by an earlier run of this request return their cached results
+        # rather than being queried again
+        completed = resources.get_checkpoints(ActionType.access)
+        if completed:
+            cached_results = resources.get_cached_results_with_placeholders()
+            for k in env:
+                if str(k) in completed and str(k) in cached_results:
+                    logger.info(f"Loading completed access request results for {k}")
+                    resources.placeholder_results[
+                        f"access_request__{k}"
+                    ] = cached_results[str(k)]
+                    dsk[k] = (
+                        checkpointed_output(
+                            [drop_placeholders(row) for row in cached_results[str(k)]]
+                        ),
+                    )
         dsk[ROOT_COLLECTION_ADDRESS] = (start_function(traversal.seed_data),)
         dsk[TERMINATOR_ADDRESS] = (termination_fn, *end_nodes)
-        v = dask.delayed(get(dsk, TERMINATOR_ADDRESS))
 
-        return v.compute()
+        results: Dict[str, List[Row]] = executor.get(
+            dsk,
+            TERMINATOR_ADDRESS,
+            *connection_limits(env, connection_configs),
+            on_skipped=skip_access_requests(env, resources),
+        )
+        if not policy.get_rules_for_action(action_type=ActionType.erasure):
+            # No erasure follows, so a later run of this request queries the collections again
+            # rather than loading these results
+            resources.clear_checkpoints()
+        return results
+
+
+def run_batch_access_request(  # pylint: disable=too-many-locals
+    privacy_requests: List[PrivacyRequest],
+    policy: Policy,
+    graph: DatasetGraph,
+    connection_configs: List[ConnectionConfig],
+    identities: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, List[Row]]]:
+    """Run the access request of several privacy requests at once, so that each collection is
+    queried once for the whole batch rather than once per request.
+
+    The identities of the batch (keyed by privacy request id) are fused into a single seed, which
+    the queries receive as lists of values. Each returned row is then attributed to the requests
+    whose own traversal would have reached it, and each request's results are cached and
+    checkpointed just as if it had run alone, so running the request afterwards does not query the
+    collections again. The requests must share a policy and the same identity types.
+
+    Returns the access results of each privacy request.
+    """
+    seeds: List[Dict[str, Any]] = [identities[pr.id] for pr in privacy_requests]
+    traversal: Traversal = Traversal(
+        graph, {key: value for seed in seeds for key, value in seed.items()}
+    )
+    with BatchTaskResources(privacy_requests, policy, connection_configs) as resources:
+
+        def collect_tasks_fn(
+            tn: TraversalNode, data: Dict[CollectionAddress, GraphTask]
+        ) -> None:
+            if not tn.is_root_node():
+                data[tn.address] = GraphTask(tn, resources)
+
+        env: Dict[CollectionAddress, GraphTask] = {}
+        end_nodes = prune_tasks(
+            env, traversal.traverse(env, collect_tasks_fn), traversal, policy
+        )
+
+        executor = get_executor()
+        dsk: Dict[CollectionAddress, Any] = {
+            k: (
+                t.access_request_async
+                if executor.runs_coroutines
+                else t.access_request,
+                *t.input_keys,
+            )
+            for k, t in env.items()
+        }
+
+        def start_function() -> List[Dict[str, Any]]:
+            """The seed of the batch is one row per privacy request"""
+            return seeds
+
+        def termination_fn(*dependent_values: List[Row]) -> None:
+            """Waits for all terminating addresses; results are held by the resources"""
+
+        dsk[ROOT_COLLECTION_ADDRESS] = (start_function,)
+        dsk[TERMINATOR_ADDRESS] = (termination_fn, *end_nodes)
+        executor.get(
+            dsk,
+            TERMINATOR_ADDRESS,
+            *connection_limits(env, connection_configs),
+            on_skipped=skip_access_requests(env, resources),
+        )
+
+        completed = resources.get_checkpoints(ActionType.access)
+        fused_results = resources.pop_results(placeholders=True)
+        resources.clear()
+
+        results: Dict[str, Dict[str, List[Row]]] = {}
+        for privacy_request, seed in zip(privacy_requests, seeds):
+            with TaskResources(
+                privacy_request, policy, connection_configs
+            ) as request_resources:
+                results[privacy_request.id] = attribute_batch_results(
+                    env, request_resources, seed, fused_results, completed
+                )
+        return results
+
+
+def attribute_batch_results(
+    env: Dict[CollectionAddress, GraphTask],
+    resources: TaskResources,
+    seed: Dict[str, Any],
+    batch_results: Dict[str, List[Row]],
+    completed: Dict[str, Any],
+) -> Dict[str, List[Row]]:
+    """Pick out one privacy request's share of the results of a batched access request, starting
+    from its own seed, then cache and checkpoint them for that request.
+
+    Collections the batch did not complete, and any collections that depend on them, are left for the
+    request to query itself when it runs."""
+    reached: Dict[CollectionAddress, Optional[List[Row]]] = {
+        ROOT_COLLECTION_ADDRESS: [seed]
+    }
+
+    def attribute(address: CollectionAddress) -> Optional[List[Row]]:
+        if address not in reached:
+            task = GraphTask(env[address].traversal_node, resources)
+            inputs: List[List[Row]] = []
+            for k in task.input_keys:
+                rows = attribute(k)
+                if rows is not None:
+                    inputs.append(rows)
+            reached[address] = None
+            if str(address) in completed and len(inputs) == len(task.input_keys):
+                # Rows were filtered against the inputs of the whole batch, so they are
+                # filtered again against this request's inputs alone
+                reached[address] = task.access_results_post_processing(
+                    task.pre_process_input_data(*inputs, group_dependent_fields=False),
+                    [
+                        copy.deepcopy(
+                            task.rows_reached_by(batch_results[str(address)], *inputs)
+                        )
+                    ],
+                )
+                resources.cache_checkpoint(f"access_request__{address}")
+        return reached[address]
+
+    return {
+        str(address): rows
+        for address, rows in ((address, attribute(address)) for address in env)
+        if rows is not None
+    }
 
 
 def get_cached_data_for_erasures(
@@ -548,17 +1023,21 @@ def get_cached_data_for_erasures(
     return {k.split("__")[-1]: v for k, v in value_dict.items()}
 
 
-def run_erasure(  # pylint: disable = too-many-arguments
+def run_erasure(  # pylint: disable = too-many-arguments, too-many-locals
     privacy_request: PrivacyRequest,
     policy: Policy,
     graph: DatasetGraph,
     connection_configs: List[ConnectionConfig],
     identity: Dict[str, Any],
     access_request_data: Dict[str, List[Row]],
+    deadline: Optional[datetime] = None,
+    lease_lost: Optional[threading.Event] = None,
 ) -> Dict[str, int]:
     """Run an erasure request"""
     traversal: Traversal = Traversal(graph, identity)
-    with TaskResources(privacy_request, policy, connection_configs) as resources:
+    with TaskResources(
+        privacy_request, policy, connection_configs, deadline, lease_lost
+    ) as resources:
 
         def collect_tasks_fn(
             tn: TraversalNode, data: Dict[CollectionAddress, GraphTask]
@@ -578,14 +1057,37 @@ def run_erasure(  # pylint: disable = too-many-arguments
             The termination function just returns this tuple of ints."""
             return dependent_values
 
+        executor = get_executor()
+        pruned: Set[CollectionAddress] = set()
+        if config.execution.PRUNE_UNTARGETED_COLLECTIONS:
+            # Collections holding none of the data categories targeted for erasure have nothing to mask
+            targeted = policy_targets(policy, ActionType.erasure)
+            pruned = {k for k, t in env.items() if not targeted(t.traversal_node)}
         dsk: Dict[CollectionAddress, Any] = {
-            k: (t.erasure_request, access_request_data[str(k)]) for k, t in env.items()
+            k: (
+                t.erasure_request_async
+                if executor.runs_coroutines
+                else t.erasure_request,
+                access_request_data[str(k)],
+            )
+            for k, t in env.items()
+            if k not in pruned
         }
+        dsk.update({k: (lambda: 0,) for k in pruned})
+        # Collections masked by an earlier run of this request are not masked again
+        completed = resources.get_checkpoints(ActionType.erasure)
+        for k in env:
+            if str(k) in completed:
+                logger.info(f"Skipping completed erasure for {k}")
+                dsk[k] = (checkpointed_output(completed[str(k)]),)
         # terminator function waits for all keys
         dsk[TERMINATOR_ADDRESS] = (termination_fn, *env.keys())
-        v = dask.delayed(get(dsk, TERMINATOR_ADDRESS))
 
-        update_cts: Tuple[int, ...] = v.compute()
+        update_cts: Tuple[int, ...] = executor.get(
+            dsk, TERMINATOR_ADDRESS, *connection_limits(env, connection_configs)
+        )
+        # The data has now been masked, so results cached by the access request are stale
+        resources.clear_checkpoints()
         # we combine the output of the termination function with the input keys to provide
         # a map of {collection_name: records_updated}:
         erasure_update_map: Dict[str, int] = dict(
@@ -1,9 +1,20 @@
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, Optional, List
 
 from fidesops.schemas.shared_schemas import FidesOpsKey
 
-from fidesops.common_exceptions import ConnectorNotFoundException
+from fidesops.common_exceptions import (
+    ConnectorNotFoundException,
+    PrivacyRequestCanceled,
+    PrivacyRequestLeaseLost,
+    PrivacyRequestTimeout,
+)
+from fidesops.core.config import config
 from fidesops.db.session import get_db_session
 from fidesops.graph.config import (
     CollectionAddress,
@@ -24,7 +35,14 @@ from fidesops.service.connectors import (
     BigQueryConnector,
     SaaSConnector,
 )
-from fidesops.util.cache import get_cache
+from fidesops.task.filter_element_match import drop_placeholders
+from fidesops.util.cache import (
+    FidesopsRedis,
+    get_cache,
+    get_masking_progress_cache_key,
+)
+from fidesops.util.collection_util import Row
+from fidesops.util.tracing import SpanRecorder
 
 logger = logging.getLogger(__name__)
 
@@ -77,29 +95,161 @@ class Connections:
             connector.close()
 
 
-class TaskResources:
+class ExecutionLogWriter:
+    """Holds execution logs in memory and writes them to the application database in batches, so that a
+    privacy request does not open a transaction for every log it writes.
+
+    Logs are written once `batch_size` are waiting, once the oldest has waited `flush_seconds`, or when
+    flush is called. The wait is timed in the background, so logs are written on time even if no more follow.
+    """
+
+    def __init__(
+        self, batch_size: Optional[int] = None, flush_seconds: Optional[float] = None
+    ):
+        self.batch_size: int = max(
+            1, batch_size or config.execution.EXECUTION_LOG_BATCH_SIZE
+        )
+        self.flush_seconds: float = (
+            config.execution.EXECUTION_LOG_FLUSH_SECONDS
+            if flush_seconds is None
+            else flush_seconds
+        )
+        self.pending: List[Dict[str, Any]] = []
+        self.last_flushed = time.monotonic()
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def write(self, data: Dict[str, Any]) -> None:
+        """Queue a log to be written. Its timestamps are taken now, so that logs keep their order
+        when several are inserted in the same transaction."""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            self.pending.append({**data, "created_at": now, "updated_at": now})
+            due = (
+                len(self.pending) >= self.batch_size
+                or time.monotonic() - self.last_flushed >= self.flush_seconds
+            )
+            if not due and self._timer is None:
+                self._timer = threading.Timer(self.flush_seconds, self._timed_flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all queued logs in a single transaction. If the write fails, the logs stay queued."""
+        with self._lock:
+            rows, self.pending = self.pending, []
+            self.last_flushed = time.monotonic()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not rows:
+            return
+        try:
+            SessionLocal = get_db_session()
+            with SessionLocal() as db:
+                db.execute(ExecutionLog.__table__.insert(), rows)
+                db.commit()
+        except Exception:
+            with self._lock:
+                self.pending = rows + self.pending
+            raise
+
+    def _timed_flush(self) -> None:
+        try:
+            self.flush()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(
+                f"Unable to write execution logs, which remain queued: {exc}"
+            )
+
+
+class CacheWriter:
+    """Writes encoded objects to the cache on a background thread, so that tasks do not wait on
+    serializing their results and the round trip to redis.
+
+    Writes are made in the order they were queued. Objects must not be changed once queued, as they
+    may not have been encoded yet.
+    """
+
+    def __init__(self, cache: FidesopsRedis):
+        self.cache = cache
+        self.pending: List[Future] = []
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def write(self, objects: Dict[str, Any]) -> None:
+        """Queue objects to be written, keyed by their cache keys"""
+        self.submit(self.cache.set_encoded_objects, objects)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Queue a call that writes to the cache, to be made after those already queued"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="cache_writer"
+                )
+            self.pending = [f for f in self.pending if not f.done()]
+            self.pending.append(self._pool.submit(fn, *args))
+
+    def flush(self) -> None:
+        """Wait for all queued objects to be written, raising the first error any write hit"""
+        with self._lock:
+            pending, self.pending = self.pending, []
+        for future in pending:
+            future.result()
+
+    def close(self) -> None:
+        """Write out all queued objects and stop the background thread"""
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                if self._pool is not None:
+                    self._pool.shutdown()
+                    self._pool = None
+
+
+class TaskResources:  # pylint: disable=too-many-instance-attributes
     """Shared information and environment for all nodes of a given task.
     This includes
      - the privacy request
      - the policy
      - redis connection
      -  configurations to any outside resources the task will require to run
+     - the time by which the privacy request must finish, if any
+     - an event set if the worker running the privacy request loses its lease
+     - the timing spans recorded for the privacy request's trace
+     - the execution logs waiting to be written
+     - the results of the nodes that have run, which are written to redis in the background
     """
 
-    def __init__(
+    # Whether node results are written to redis as well as held in memory
+    persist_results = True
+
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         request: PrivacyRequest,
         policy: Policy,
         connection_configs: List[ConnectionConfig],
+        deadline: Optional[datetime] = None,
+        lease_lost: Optional[threading.Event] = None,
     ):
         self.request = request
         self.policy = policy
+        self.deadline = deadline
+        self.lease_lost = lease_lost
         self.cache = get_cache()
         # tbd populate connection configurations.
         self.connection_configs: Dict[str, ConnectionConfig] = {
             c.key: c for c in connection_configs
         }
         self.connections = Connections()
+        self.spans = SpanRecorder(request.id)
+        self.execution_logs = ExecutionLogWriter()
+        self.cache_writer = CacheWriter(self.cache)
+        self.placeholder_results: Dict[str, List[Row]] = {}
 
     def __enter__(self) -> "TaskResources":
         """Support 'with' usage for closing resources"""
@@ -109,23 +259,99 @@ class TaskResources:
         """Support 'with' usage for closing resources"""
         self.close()
 
-    def cache_results_with_placeholders(self, key: str, value: Any) -> None:
-        """Cache raw results from node. Object will be
-        stored in redis under 'PLACEHOLDER_RESULTS__PRIVACY_REQUEST_ID__TYPE__COLLECTION_ADDRESS"""
-        self.cache.set_encoded_object(
-            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}", value
+    def cache_results_with_placeholders(self, key: str, value: List[Row]) -> None:
+        """Cache the results of a node, with unmatched array elements replaced with placeholder text. They
+        are stored in redis as they are under 'PLACEHOLDER_RESULTS__PRIVACY_REQUEST_ID__TYPE__COLLECTION_ADDRESS',
+        for erasures, and with the placeholders removed under 'REQUEST_ID__TYPE__ADDRESS', for access requests.
+
+        Only the rows with placeholders are held in memory; the other form is derived from them when needed."""
+        self.placeholder_results[key] = value
+        if self.persist_results:
+            self.cache_writer.submit(self._write_results, key, value)
+
+    def _write_results(self, key: str, value: List[Row]) -> None:
+        self.cache.set_encoded_objects(
+            {
+                f"PLACEHOLDER_RESULTS__{self.request.id}__{key}": value,
+                f"{self.request.id}__{key}": [drop_placeholders(row) for row in value],
+            }
         )
 
     def cache_object(self, key: str, value: Any) -> None:
         """Store in cache. Object will be stored in redis under 'REQUEST_ID__TYPE__ADDRESS'"""
-        self.cache.set_encoded_object(f"{self.request.id}__{key}", value)
+        if self.persist_results:
+            self.cache_writer.write({f"{self.request.id}__{key}": value})
+
+    def cache_checkpoint(self, key: str, value: Any = None) -> None:
+        """Record that a node has completed, so it can be skipped if this request is re-run. Object will be
+        stored in redis under 'CHECKPOINT__REQUEST_ID__TYPE__ADDRESS'. It is written after the node's results."""
+        self.cache_writer.write({f"CHECKPOINT__{self.request.id}__{key}": value})
+
+    def cache_skipped_results(self, keys: List[str]) -> None:
+        """Cache an empty result for each of the given nodes, which were not queried because none of
+        their inputs returned data. They are not checkpointed, as an input may have been empty because
+        its node failed."""
+        objects: Dict[str, Any] = {}
+        for key in keys:
+            self.placeholder_results[key] = []
+            objects[f"PLACEHOLDER_RESULTS__{self.request.id}__{key}"] = []
+            objects[f"{self.request.id}__{key}"] = []
+        if self.persist_results:
+            self.cache_writer.write(objects)
+
+    def get_checkpoints(self, action_type: ActionType) -> Dict[str, Optional[Any]]:
+        """Retrieve the nodes that have already completed the given action, mapped to any value saved
+        with their checkpoint"""
+        self.cache_writer.flush()
+        value_dict = self.cache.get_encoded_objects_by_prefix(
+            f"CHECKPOINT__{self.request.id}__{action_type.value}_request__"
+        )
+        return {k.split("__")[-1]: v for k, v in value_dict.items()}
+
+    def clear_checkpoints(self) -> None:
+        """Forget which nodes have completed, and which rows have been masked, so that a later run of
+        this request starts from scratch"""
+        self.cache_writer.flush()
+        self.cache.delete_keys_by_prefix(f"EN_CHECKPOINT__{self.request.id}__")
+        self.cache.delete_keys_by_prefix(
+            get_masking_progress_cache_key(self.request.id)
+        )
 
     def get_all_cached_objects(self) -> Dict[str, Optional[Any]]:
-        """Retrieve the results of all steps (cache_object)"""
+        """Retrieve the results of all steps (cache_object) saved to redis, including those of
+        earlier runs of this request"""
+        self.cache_writer.flush()
         value_dict = self.cache.get_encoded_objects_by_prefix(self.request.id)
         # extract request id to return a map of address:value
         return {k.split("__")[-1]: v for k, v in value_dict.items()}
 
+    def get_cached_results_with_placeholders(self) -> Dict[str, Optional[Any]]:
+        """Retrieve the results saved to redis for erasures (cache_results_with_placeholders), including
+        those of earlier runs of this request"""
+        self.cache_writer.flush()
+        value_dict = self.cache.get_encoded_objects_by_prefix(
+            f"PLACEHOLDER_RESULTS__{self.request.id}"
+        )
+        return {k.split("__")[-1]: v for k, v in value_dict.items()}
+
+    def get_results(self, placeholders: bool = False) -> Dict[str, List[Row]]:
+        """Return the results of the nodes run with these resources, mapped to their addresses,
+        without reading them back from redis. With `placeholders`, return the results as cached
+        for erasures."""
+        return {
+            k.split("__")[-1]: v
+            if placeholders
+            else [drop_placeholders(row) for row in v]
+            for k, v in self.placeholder_results.items()
+        }
+
+    def pop_results(self, placeholders: bool = False) -> Dict[str, List[Row]]:
+        """Return the results of the nodes run with these resources, as get_results does, and stop
+        holding them, so that they are only kept for as long as the caller needs them."""
+        results = self.get_results(placeholders)
+        self.placeholder_results = {}
+        return results
+
     def write_execution_log(  # pylint: disable=too-many-arguments
         self,
         collection_address: CollectionAddress,
@@ -133,14 +359,10 @@ class TaskResources:
         action_type: ActionType,
         status: ExecutionLogStatus,
         message: str = None,
-    ) -> Any:
-        """Store in application db. Return the created or written-to id field value."""
-        SessionLocal = get_db_session()
-        db = SessionLocal()
-
-        ExecutionLog.create(
-            db=db,
-            data={
+    ) -> None:
+        """Queue a log to be stored in application db"""
+        self.execution_logs.write(
+            {
                 "dataset_name": collection_address.dataset,
                 "collection_name": collection_address.collection,
                 "fields_affected": fields_affected,
@@ -148,9 +370,24 @@ class TaskResources:
                 "status": status,
                 "privacy_request_id": self.request.id,
                 "message": message,
-            },
+            }
         )
-        db.close()
+
+    def raise_if_halted(self) -> None:
+        """Raise if the privacy request has been canceled, has run past its deadline, or is no longer
+        leased by the worker running it, so that no more of its collections are run"""
+        if self.lease_lost and self.lease_lost.is_set():
+            raise PrivacyRequestLeaseLost(
+                f"Lease on privacy request {self.request.id} was lost"
+            )
+        if self.deadline and datetime.utcnow() > self.deadline:
+            raise PrivacyRequestTimeout(
+                f"Privacy request {self.request.id} did not finish by its deadline of {self.deadline}"
+            )
+        if self.request.cancel_requested():
+            raise PrivacyRequestCanceled(
+                f"Privacy request {self.request.id} was canceled"
+            )
 
     def get_connector(self, key: FidesOpsKey) -> Any:
         """Create or return the client corresponding to the given ConnectionConfig key"""
@@ -159,6 +396,64 @@ class TaskResources:
         raise ConnectorNotFoundException(f"No available connector for {key}")
 
     def close(self) -> None:
-        """Close any held resources"""
+        """Close any held resources, writing out any execution logs and results still waiting"""
         logger.debug(f"Closing all task resources for {self.request.id}")
-        self.connections.close()
+        # Each step runs even if an earlier one fails, so that nothing waiting is lost
+        try:
+            self.connections.close()
+            self.spans.save(self.cache)
+        finally:
+            try:
+                self.execution_logs.flush()
+            finally:
+                self.cache_writer.close()
+
+
+class BatchTaskResources(TaskResources):
+    """TaskResources for a single run made on behalf of several privacy requests.
+
+    Results are only held in memory, as they are attributed to each privacy request once the
+    batch has run, while checkpoints are cached under an id of the batch's own. Execution logs
+    are written to every privacy request in the batch.
+    """
+
+    persist_results = False
+
+    def __init__(
+        self,
+        privacy_requests: List[PrivacyRequest],
+        policy: Policy,
+        connection_configs: List[ConnectionConfig],
+    ):
+        super().__init__(
+            PrivacyRequest(id=f"batch_{uuid.uuid4()}"), policy, connection_configs
+        )
+        self.privacy_requests = privacy_requests
+
+    def write_execution_log(  # pylint: disable=too-many-arguments
+        self,
+        collection_address: CollectionAddress,
+        fields_affected: Any,
+        action_type: ActionType,
+        status: ExecutionLogStatus,
+        message: str = None,
+    ) -> None:
+        """Queue the same log to be stored in application db for each privacy request in the batch."""
+        for privacy_request in self.privacy_requests:
+            self.execution_logs.write(
+                {
+                    "dataset_name": collection_address.dataset,
+                    "collection_name": collection_address.collection,
+                    "fields_affected": fields_affected,
+                    "action_type": action_type,
+                    "status": status,
+                    "privacy_request_id": privacy_request.id,
+                    "message": message,
+                }
+            )
+
+    def clear(self) -> None:
+        """Delete everything cached for the batch"""
+        self.cache_writer.flush()
+        for prefix in ["", "PLACEHOLDER_RESULTS__", "CHECKPOINT__"]:
+            self.cache.delete_keys_by_prefix(f"EN_{prefix}{self.request.id}__")
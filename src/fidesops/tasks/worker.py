@@ -0,0 +1,363 @@
+import json
+import logging
+import signal
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+from redis.client import Script
+from sqlalchemy.orm import Session
+
+from fidesops.core.config import config
+from fidesops.db.database import init_db
+from fidesops.db.session import get_db_session
+from fidesops.models.privacy_request import PrivacyRequest
+from fidesops.tasks.scheduled.scheduler import scheduler
+from fidesops.util.cache import FidesopsRedis, get_cache
+
+logger = logging.getLogger(__name__)
+
+PENDING_QUEUE = "PRIVACY_REQUEST_QUEUE__PENDING"
+LEASES = "PRIVACY_REQUEST_QUEUE__LEASES"
+
+# Lease expiry times are taken from the Redis server clock so that workers on different hosts agree.
+# Each lease is held on the job prefixed with a token unique to the claim, so that a worker whose lease
+# lapsed cannot extend or release the lease of a worker that has since claimed the same job.
+LEASE_TOKEN_LENGTH = 32
+
+CLAIM_SCRIPT = """
+redis.replicate_commands()
+local job = redis.call('rpop', KEYS[1])
+if job then
+    redis.call('zadd', KEYS[2], tonumber(redis.call('time')[1]) + tonumber(ARGV[1]), ARGV[2] .. job)
+end
+return job
+"""
+
+HEARTBEAT_SCRIPT = """
+redis.replicate_commands()
+if not redis.call('zscore', KEYS[1], ARGV[2]) then
+    return 0
+end
+redis.call('zadd', KEYS[1], tonumber(redis.call('time')[1]) + tonumber(ARGV[1]), ARGV[2])
+return 1
+"""
+
+REQUEUE_EXPIRED_SCRIPT = """
+redis.replicate_commands()
+local expired = redis.call('zrangebyscore', KEYS[2], '-inf', redis.call('time')[1])
+for _, lease in ipairs(expired) do
+    redis.call('zrem', KEYS[2], lease)
+    redis.call('rpush', KEYS[1], string.sub(lease, tonumber(ARGV[1]) + 1))
+end
+return #expired
+"""
+
+
+class QueuedPrivacyRequest(BaseModel):
+    """A privacy request waiting to be run, or being run, by a worker"""
+
+    job_id: str
+    privacy_request_id: str
+    from_webhook_id: Optional[str] = None
+    # Identifies the claim on this job by a worker, if it has been claimed
+    lease_token: Optional[str] = None
+
+    def serialize(self) -> str:
+        """The form in which this job is stored in Redis"""
+        return json.dumps(self.dict(exclude={"lease_token"}), sort_keys=True)
+
+    def lease(self) -> str:
+        """The form in which the lease on this job is stored in Redis"""
+        return f"{self.lease_token}{self.serialize()}"
+
+
+class PrivacyRequestQueue:
+    """
+    A durable queue of privacy requests, stored in Redis.
+
+    Pending requests are held in a list. Claiming a request atomically moves it onto a lease that
+    expires unless the claiming worker heartbeats it. Requests whose lease has expired (i.e. their
+    worker died) are moved to the front of the pending list to be picked up by another worker.
+    """
+
+    def __init__(self, cache: FidesopsRedis):
+        self.cache = cache
+        self._claim: Script = cache.register_script(CLAIM_SCRIPT)
+        self._heartbeat: Script = cache.register_script(HEARTBEAT_SCRIPT)
+        self._requeue_expired: Script = cache.register_script(REQUEUE_EXPIRED_SCRIPT)
+
+    def enqueue(
+        self, privacy_request_id: str, from_webhook_id: Optional[str] = None
+    ) -> QueuedPrivacyRequest:
+        """Add a privacy request to the back of the queue"""
+        job = QueuedPrivacyRequest(
+            job_id=str(uuid.uuid4()),
+            privacy_request_id=privacy_request_id,
+            from_webhook_id=from_webhook_id,
+        )
+        self.cache.lpush(PENDING_QUEUE, job.serialize())
+        return job
+
+    def claim(self, lease_seconds: int) -> Optional[QueuedPrivacyRequest]:
+        """Take the next privacy request off the queue, leasing it for lease_seconds"""
+        lease_token = uuid.uuid4().hex
+        job = self._claim(
+            keys=[PENDING_QUEUE, LEASES], args=[lease_seconds, lease_token]
+        )
+        if not job:
+            return None
+        return QueuedPrivacyRequest(**json.loads(job), lease_token=lease_token)
+
+    def heartbeat(self, job: QueuedPrivacyRequest, lease_seconds: int) -> bool:
+        """Extend the lease on a claimed job. Returns False if the lease had already been lost."""
+        return bool(self._heartbeat(keys=[LEASES], args=[lease_seconds, job.lease()]))
+
+    def complete(self, job: QueuedPrivacyRequest) -> None:
+        """Release the lease on a job that has finished running"""
+        self.cache.zrem(LEASES, job.lease())
+
+    def requeue_expired(self) -> int:
+        """Return jobs whose lease has expired to the front of the queue"""
+        return self._requeue_expired(
+            keys=[PENDING_QUEUE, LEASES], args=[LEASE_TOKEN_LENGTH]
+        )
+
+    def pending_count(self) -> int:
+        """The number of privacy requests waiting for a worker"""
+        return self.cache.llen(PENDING_QUEUE)
+
+
+def enqueue_privacy_request(
+    privacy_request_id: str, from_webhook_id: Optional[str] = None
+) -> QueuedPrivacyRequest:
+    """Queue a privacy request to be run by a `fidesops worker` process"""
+    logger.info(f"Queueing privacy request {privacy_request_id}")
+    return PrivacyRequestQueue(get_cache()).enqueue(privacy_request_id, from_webhook_id)
+
+
+class PrivacyRequestWorker:  # pylint: disable=too-many-instance-attributes
+    """
+    Runs privacy requests from the queue, up to `concurrency` at a time.
+
+    Every in-flight request is heartbeated so that its lease only lapses if this worker dies. If a
+    lease lapses anyway, e.g. while this worker could not reach Redis, the request may have been
+    claimed by another worker, so this worker stops running it.
+
+    With a batch_size above 1, a worker with free capacity claims several requests at once, starts
+    them, and fetches their access results together before running each of them.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        cache: FidesopsRedis,
+        concurrency: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        poll_interval: float = 1.0,
+        batch_size: Optional[int] = None,
+    ):
+        self.queue = PrivacyRequestQueue(cache)
+        self.cache = cache
+        self.concurrency: int = max(
+            1, concurrency or config.execution.WORKER_CONCURRENCY
+        )
+        self.lease_seconds: int = lease_seconds or config.execution.WORKER_LEASE_SECONDS
+        self.poll_interval = poll_interval
+        self.batch_size: int = max(1, batch_size or config.execution.WORKER_BATCH_SIZE)
+        self.in_flight: Dict[str, QueuedPrivacyRequest] = {}
+        # Set for an in-flight request once its lease has been lost
+        self.lease_lost: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    def stop(self) -> None:
+        """Stop claiming new privacy requests. Requests already running are allowed to finish."""
+        self._stopping.set()
+
+    def run(self) -> None:
+        """Claim and run privacy requests until stopped"""
+        heartbeat = threading.Thread(
+            target=self._heartbeat_loop, name="fidesops-worker-heartbeat", daemon=True
+        )
+        heartbeat.start()
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="fidesops-worker"
+        ) as pool:
+            while not self._stopping.is_set():
+                requeued = self.queue.requeue_expired()
+                if requeued:
+                    logger.warning(
+                        f"Requeued {requeued} privacy requests with expired leases"
+                    )
+                while not self._stopping.is_set() and self.run_next(pool):
+                    pass
+                self._stopping.wait(self.poll_interval)
+            logger.info(
+                f"Worker stopping; waiting for {len(self.in_flight)} in-flight privacy requests"
+            )
+
+    def run_next(self, pool: ThreadPoolExecutor) -> Optional[Future]:
+        """Claim privacy requests and submit them to the pool, if there is capacity and work waiting"""
+        with self._lock:
+            jobs: List[QueuedPrivacyRequest] = []
+            capacity = min(self.batch_size, self.concurrency - len(self.in_flight))
+            while len(jobs) < capacity:
+                job = self.queue.claim(self.lease_seconds)
+                if not job:
+                    break
+                self.in_flight[job.job_id] = job
+                self.lease_lost[job.job_id] = threading.Event()
+                jobs.append(job)
+        if not jobs:
+            return None
+        if len(jobs) == 1:
+            return pool.submit(self.process, jobs[0])
+        return pool.submit(self.process_batch, jobs, pool)
+
+    def process_batch(
+        self, jobs: List[QueuedPrivacyRequest], pool: ThreadPoolExecutor
+    ) -> None:
+        """Start several queued privacy requests, fetch the access results of those that are to run
+        together, then submit each of them to the pool to run on its own"""
+        # pylint: disable=import-outside-toplevel
+        from fidesops.service.privacy_request.request_runner_service import (
+            prefetch_access_results,
+        )
+
+        # Pre-execution webhooks may pause or halt a privacy request, or add to its identity data, so they
+        # are run before anything is fetched for it
+        started = [job for job in jobs if self.start(job)]
+        try:
+            prefetch_access_results([job.privacy_request_id for job in started])
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error(f"Failed to fetch access results for batch: {exc}")
+        for job in started:
+            try:
+                pool.submit(self.process, job, True)
+            except RuntimeError:
+                # The pool is shutting down, so the rest of the batch is run on this thread
+                self.process(job, True)
+
+    def start(self, job: QueuedPrivacyRequest) -> bool:
+        """Start a queued privacy request ahead of running it, as PrivacyRequestRunner.start does. The
+        job is released if the privacy request is not to be run."""
+        # pylint: disable=import-outside-toplevel
+        from fidesops.service.privacy_request.request_runner_service import (
+            PrivacyRequestRunner,
+        )
+
+        proceed = False
+        try:
+            SessionLocal = get_db_session()
+            with SessionLocal() as session:
+                privacy_request = self.get_privacy_request(session, job)
+                if privacy_request:
+                    proceed = PrivacyRequestRunner(
+                        cache=self.cache, privacy_request=privacy_request
+                    ).start(session, privacy_request, job.from_webhook_id)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error(
+                f"Privacy request {job.privacy_request_id} errored in worker: {exc}"
+            )
+        if not proceed:
+            self.release(job)
+        return proceed
+
+    def process(self, job: QueuedPrivacyRequest, started: bool = False) -> None:
+        """Run a single queued privacy request, releasing its lease when done"""
+        # pylint: disable=import-outside-toplevel
+        from fidesops.service.privacy_request.request_runner_service import (
+            PrivacyRequestRunner,
+        )
+
+        with self._lock:
+            lease_lost = self.lease_lost.setdefault(job.job_id, threading.Event())
+        try:
+            SessionLocal = get_db_session()
+            with SessionLocal() as session:
+                privacy_request = self.get_privacy_request(session, job)
+            if not privacy_request:
+                return
+            PrivacyRequestRunner(cache=self.cache, privacy_request=privacy_request).run(
+                job.privacy_request_id,
+                job.from_webhook_id,
+                lease_lost=lease_lost,
+                started=started,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            # The runner records failures on the privacy request itself, so the job is not retried
+            logger.error(
+                f"Privacy request {job.privacy_request_id} errored in worker: {exc}"
+            )
+        finally:
+            self.release(job)
+
+    @staticmethod
+    def get_privacy_request(
+        db: Session, job: QueuedPrivacyRequest
+    ) -> Optional[PrivacyRequest]:
+        """The privacy request of a job, if it still exists"""
+        privacy_request: Optional[PrivacyRequest] = PrivacyRequest.get(
+            db=db, id=job.privacy_request_id
+        )
+        if not privacy_request:
+            logger.warning(
+                f"Privacy request {job.privacy_request_id} no longer exists; dropping it from the queue"
+            )
+        return privacy_request
+
+    def release(self, job: QueuedPrivacyRequest) -> None:
+        """Free the worker's capacity held by a job and release its lease"""
+        with self._lock:
+            self.in_flight.pop(job.job_id, None)
+            self.lease_lost.pop(job.job_id, None)
+        self.queue.complete(job)
+
+    def heartbeat(self) -> None:
+        """Extend the leases of every in-flight privacy request, stopping those whose lease was lost"""
+        with self._lock:
+            jobs = [
+                (job, self.lease_lost[job.job_id])
+                for job in self.in_flight.values()
+                if not self.lease_lost[job.job_id].is_set()
+            ]
+        for job, lease_lost in jobs:
+            if not self.queue.heartbeat(job, self.lease_seconds):
+                logger.warning(
+                    f"Lease on privacy request {job.privacy_request_id} was lost; stopping it, as it may be run by another worker"
+                )
+                lease_lost.set()
+
+    def _heartbeat_loop(self) -> None:
+        interval = max(self.lease_seconds / 3, 1)
+        while True:
+            time.sleep(interval)
+            try:
+                self.heartbeat()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error(f"Failed to heartbeat in-flight privacy requests: {exc}")
+
+
+def start_worker(concurrency: Optional[int] = None) -> None:
+    """Run any pending DB migrations and start running privacy requests from the queue."""
+    logger.info("****************fidesops****************")
+    logger.info("Running any pending DB migrations...")
+    init_db(config.database.SQLALCHEMY_DATABASE_URI)
+    scheduler.start()
+
+    worker = PrivacyRequestWorker(get_cache(), concurrency=concurrency)
+
+    def _stop(signum: int, _: Any) -> None:
+        logger.info(f"Received signal {signum}, stopping worker...")
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    logger.info(
+        f"Starting worker, running up to {worker.concurrency} privacy requests at a time..."
+    )
+    worker.run()
@@ -1,4 +1,5 @@
 import asyncio
+import contextvars
 from asyncio import AbstractEventLoop
 from concurrent.futures import ThreadPoolExecutor
 from typing import TypeVar, Callable, Any, Awaitable, Optional
@@ -29,3 +30,12 @@ def wait_for(t: Awaitable[T]) -> Optional[T]:
     """Wait for the return of a callable. This is mostly intended
     to be used for testing async tasks."""
     return asyncio.get_event_loop().run_until_complete(t)
+
+
+async def to_thread(task: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable on the running event loop's default executor, so that
+    it does not block the loop. The callable sees the caller's context variables."""
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        None, lambda: context.run(task, *args, **kwargs)
+    )
@@ -66,6 +66,18 @@ class FidesopsRedis(Redis):
         get_objects_by_prefix or processed with decode_obj."""
         return self.set_with_autoexpire(f"EN_{key}", FidesopsRedis.encode_obj(obj))
 
+    def set_encoded_objects(self, objects: Dict[str, Any]) -> None:
+        """Set several objects in redis in an encoded form, as set_encoded_object does, in a
+        single round trip."""
+        with self.pipeline(transaction=False) as pipe:
+            for key, obj in objects.items():
+                pipe.set(
+                    f"EN_{key}",
+                    FidesopsRedis.encode_obj(obj),
+                    ex=config.redis.DEFAULT_TTL_SECONDS,
+                )
+            pipe.execute()
+
     def get_encoded_by_key(self, key: str) -> Optional[Any]:
         """Returns cached obj decoded from base64"""
         val = super().get(key)
@@ -130,6 +142,22 @@ def get_encryption_cache_key(privacy_request_id: str, encryption_attr: str) -> s
     return f"id-{privacy_request_id}-encryption-{encryption_attr}"
 
 
+def get_cancel_cache_key(privacy_request_id: str) -> str:
+    """Return the key that is set when this PrivacyRequest has been canceled"""
+    return f"id-{privacy_request_id}-canceled"
+
+
+def get_trace_cache_key(privacy_request_id: str) -> str:
+    """Return the key at which the timing spans of this PrivacyRequest's runs are saved"""
+    return f"id-{privacy_request_id}-trace"
+
+
+def get_masking_progress_cache_key(privacy_request_id: str, address: str = "") -> str:
+    """Return the key at which the progress of masking a collection for this PrivacyRequest is saved.
+    Without an address, this is the prefix of the keys of all of its collections."""
+    return f"id-{privacy_request_id}-masking-progress-{address}"
+
+
 def get_masking_secret_cache_key(
     privacy_request_id: str, masking_strategy: str, secret_type: SecretType
 ) -> str:
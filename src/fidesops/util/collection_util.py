@@ -1,5 +1,15 @@
 from functools import reduce
-from typing import List, Dict, TypeVar, Iterable, Callable, Any, Optional
+from typing import (
+    List,
+    Dict,
+    TypeVar,
+    Iterable,
+    Callable,
+    Any,
+    Optional,
+    Set,
+    Hashable,
+)
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -38,6 +48,46 @@ def append(d: Dict[T, List[U]], key: T, value: U) -> None:
             d[key] = value if isinstance(value, list) else [value]
 
 
+def unique_key(value: Any) -> Hashable:
+    """A key for a value under which only equal values of the same type collide. Unlike in a set,
+    1, 1.0 and True are told apart. Lists and dicts are keyed by their contents.
+
+    Raises a TypeError for values that are otherwise unhashable."""
+    if isinstance(value, dict):
+        return dict, tuple(sorted((k, unique_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(unique_key(v) for v in value)
+    hash(value)
+    return type(value), value
+
+
+def append_unique(
+    d: Dict[T, List[U]], seen: Dict[T, Set[Hashable]], key: T, values: List[U]
+) -> int:
+    """Append to values stored under a dictionary key, skipping values already stored there, as
+    told apart by unique_key. `seen` holds the unique keys of the values stored under each key.
+    Returns the number of values skipped.
+
+    append_unique({"A":[1]}, {"A":{(int, 1)}}, "A", [1, True, 2, 2]) sets dict to {"A":[1, True, 2]}
+    """
+    skipped = 0
+    for value in values:
+        stored = seen.setdefault(key, set())
+        try:
+            value_key = unique_key(value)
+            if value_key in stored:
+                skipped += 1
+                continue
+            stored.add(value_key)
+        except TypeError:
+            # unhashable values are compared against the stored list instead
+            if value in d.get(key, []):
+                skipped += 1
+                continue
+        d.setdefault(key, []).append(value)
+    return skipped
+
+
 def partition(_iterable: Iterable[T], extractor: Callable[[T], U]) -> Dict[U, List[T]]:
     """partition a collection by the output of an arbitrary extractor function"""
     out: Dict[U, List[T]] = {}
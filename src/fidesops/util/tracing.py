@@ -0,0 +1,135 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+from fidesops.core.config import config
+from fidesops.util.cache import FidesopsRedis, get_cache, get_trace_cache_key
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+# Span categories
+QUERY_GENERATION = "query_generation"
+CONNECTOR = "connector"
+POST_PROCESSING = "post_processing"
+CACHE = "cache"
+
+
+class SpanRecorder:
+    """Collects timing spans for the tasks of a privacy request run, as Chrome trace events.
+
+    Spans are held in memory and saved to the cache, alongside the spans of any earlier runs of
+    the same privacy request, when the run finishes.
+    """
+
+    def __init__(self, privacy_request_id: str):
+        self.privacy_request_id = privacy_request_id
+        self.spans: List[Dict[str, Any]] = []
+
+    def add(
+        self, name: str, category: str, start: float, duration: float, **args: Any
+    ) -> None:
+        """Record a span that started at `start` (seconds since the epoch) and ran for
+        `duration` seconds on the current thread"""
+        self.spans.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": int(start * 1_000_000),
+                "dur": int(duration * 1_000_000),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    def count(self, name: str, category: str, **values: int) -> None:
+        """Record the values of a counter at the current time"""
+        self.spans.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "C",
+                "ts": int(time.time() * 1_000_000),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": values,
+            }
+        )
+
+    def save(self, cache: Optional[FidesopsRedis] = None) -> None:
+        """Append the recorded spans to those saved for this privacy request"""
+        if not self.spans:
+            return
+        cache = cache or get_cache()
+        key = get_trace_cache_key(self.privacy_request_id)
+        cache.rpush(key, *[json.dumps(span) for span in self.spans])
+        cache.expire(key, config.redis.DEFAULT_TTL_SECONDS)
+        self.spans = []
+
+
+_current_recorder: ContextVar[Optional[SpanRecorder]] = ContextVar(
+    "span_recorder", default=None
+)
+
+
+@contextmanager
+def recording_spans(recorder: SpanRecorder) -> Iterator[None]:
+    """Record the spans opened within this block, on this thread or task, to `recorder`"""
+    token = _current_recorder.set(recorder)
+    try:
+        yield
+    finally:
+        _current_recorder.reset(token)
+
+
+@contextmanager
+def span(name: str, category: str, **args: Any) -> Iterator[None]:
+    """Time this block as a span, if spans are being recorded"""
+    recorder = _current_recorder.get()
+    if recorder is None:
+        yield
+        return
+    start = time.time()
+    counter = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add(name, category, start, time.perf_counter() - counter, **args)
+
+
+def count(name: str, category: str, **values: int) -> None:
+    """Record the values of a counter, if spans are being recorded"""
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        recorder.count(name, category, **values)
+
+
+def spanned_iterator(items: Iterable[T], name: str, category: str) -> Iterator[T]:
+    """Yield from `items`, timing each step of the underlying iterator as a span"""
+    iterator = iter(items)
+    while True:
+        with span(name, category):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def get_trace(privacy_request_id: str) -> Dict[str, Any]:
+    """Return the saved spans of a privacy request in Chrome trace format. The result can be
+    opened in chrome://tracing, Perfetto or speedscope."""
+    cache = get_cache()
+    spans = cache.lrange(get_trace_cache_key(privacy_request_id), 0, -1)
+    return {
+        "traceEvents": [json.loads(s) for s in spans],
+        "displayTimeUnit": "ms",
+        "otherData": {"privacy_request_id": privacy_request_id},
+    }
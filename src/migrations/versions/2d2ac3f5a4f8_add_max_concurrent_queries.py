@@ -0,0 +1,27 @@
+"""add max concurrent queries to connection config
+
+Revision ID: 2d2ac3f5a4f8
+Revises: 906d7198df28
+Create Date: 2022-03-21 14:02:11.392874
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2d2ac3f5a4f8"
+down_revision = "906d7198df28"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "connectionconfig",
+        sa.Column("max_concurrent_queries", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("connectionconfig", "max_concurrent_queries")
@@ -0,0 +1,38 @@
+"""add connection pool settings to connection config
+
+Revision ID: 5f1c2a3d9e07
+Revises: 8b2b6e2f1c4e
+Create Date: 2022-04-12 10:21:43.518270
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5f1c2a3d9e07"
+down_revision = "8b2b6e2f1c4e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "connectionconfig", sa.Column("pool_size", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "connectionconfig", sa.Column("max_overflow", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "connectionconfig", sa.Column("pool_recycle", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "connectionconfig", sa.Column("pool_pre_ping", sa.Boolean(), nullable=True)
+    )
+
+
+def downgrade():
+    op.drop_column("connectionconfig", "pool_pre_ping")
+    op.drop_column("connectionconfig", "pool_recycle")
+    op.drop_column("connectionconfig", "max_overflow")
+    op.drop_column("connectionconfig", "pool_size")
@@ -0,0 +1,34 @@
+"""privacy request canceled
+
+Revision ID: 8b2b6e2f1c4e
+Revises: 2d2ac3f5a4f8
+Create Date: 2022-04-04 14:12:07.381552
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8b2b6e2f1c4e"
+down_revision = "2d2ac3f5a4f8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("alter type privacyrequeststatus add value 'canceled'")
+
+
+def downgrade():
+    op.execute("delete from privacyrequest where status = 'canceled'")
+
+    op.execute("alter type privacyrequeststatus rename to privacyrequeststatus_old")
+    op.execute(
+        "create type privacyrequeststatus as enum('in_processing', 'complete', 'pending', 'error', 'paused', 'approved', 'denied')"
+    )
+    op.execute(
+        (
+            "alter table privacyrequest alter column status type privacyrequeststatus using "
+            "status::text::privacyrequeststatus"
+        )
+    )
+    op.execute("drop type privacyrequeststatus_old")
@@ -73,6 +73,72 @@ class TestPatchConnections:
         response_body = json.loads(response.text)
         assert "extra fields not permitted" == response_body["detail"][0]["msg"]
 
+    def test_patch_connections_max_concurrent_queries(
+        self, api_client: TestClient, db: Session, generate_auth_header, url
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[CONNECTION_CREATE_OR_UPDATE])
+        payload = [
+            {
+                "name": "My Main Postgres DB",
+                "key": "postgres_db_1",
+                "connection_type": "postgres",
+                "access": "write",
+                "max_concurrent_queries": 0,
+            }
+        ]
+        response = api_client.patch(url, headers=auth_header, json=payload)
+        assert 422 == response.status_code
+
+        payload[0]["max_concurrent_queries"] = 3
+        response = api_client.patch(url, headers=auth_header, json=payload)
+        assert 200 == response.status_code
+        assert json.loads(response.text)["succeeded"][0]["max_concurrent_queries"] == 3
+
+        postgres_resource = ConnectionConfig.get_by(
+            db, field="key", value="postgres_db_1"
+        )
+        assert postgres_resource.max_concurrent_queries == 3
+        postgres_resource.delete(db)
+
+    def test_patch_connections_pool_settings(
+        self, api_client: TestClient, db: Session, generate_auth_header, url
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[CONNECTION_CREATE_OR_UPDATE])
+        payload = [
+            {
+                "name": "My Main Postgres DB",
+                "key": "postgres_db_1",
+                "connection_type": "postgres",
+                "access": "write",
+                "pool_size": 0,
+            }
+        ]
+        response = api_client.patch(url, headers=auth_header, json=payload)
+        assert 422 == response.status_code
+
+        payload[0].update(
+            {
+                "pool_size": 2,
+                "max_overflow": 0,
+                "pool_recycle": 600,
+                "pool_pre_ping": True,
+            }
+        )
+        response = api_client.patch(url, headers=auth_header, json=payload)
+        assert 200 == response.status_code
+        assert json.loads(response.text)["succeeded"][0]["pool_size"] == 2
+
+        postgres_resource = ConnectionConfig.get_by(
+            db, field="key", value="postgres_db_1"
+        )
+        assert postgres_resource.pool_options() == {
+            "pool_size": 2,
+            "max_overflow": 0,
+            "pool_recycle": 600,
+            "pool_pre_ping": True,
+        }
+        postgres_resource.delete(db)
+
     def test_patch_http_connection(
         self, url, api_client, db: Session, generate_auth_header
     ):
@@ -363,12 +429,22 @@ class TestPatchConnections:
             "key": "postgres_db_1",
             "connection_type": "postgres",
             "access": "write",
+            "max_concurrent_queries": None,
+            "pool_size": None,
+            "max_overflow": None,
+            "pool_recycle": None,
+            "pool_pre_ping": None,
         }
         assert response_body["failed"][1]["data"] == {
             "name": "My Mongo DB",
             "key": None,
             "connection_type": "mongodb",
             "access": "read",
+            "max_concurrent_queries": None,
+            "pool_size": None,
+            "max_overflow": None,
+            "pool_recycle": None,
+            "pool_pre_ping": None,
         }
 
 
@@ -408,6 +484,11 @@ class TestGetConnections:
             "name",
             "last_test_timestamp",
             "last_test_succeeded",
+            "max_concurrent_queries",
+            "pool_size",
+            "max_overflow",
+            "pool_recycle",
+            "pool_pre_ping",
             "key",
             "created_at",
         }
@@ -466,6 +547,11 @@ class TestGetConnection:
             "name",
             "last_test_timestamp",
             "last_test_succeeded",
+            "max_concurrent_queries",
+            "pool_size",
+            "max_overflow",
+            "pool_recycle",
+            "pool_pre_ping",
             "key",
             "created_at",
         }
@@ -645,6 +731,26 @@ class TestPutConnectionConfigSecrets:
         assert connection_config.last_test_timestamp is None
         assert connection_config.last_test_succeeded is None
 
+    @mock.patch(
+        "fidesops.api.v1.endpoints.connection_endpoints.client_registry.invalidate"
+    )
+    def test_put_connection_config_secrets_invalidates_client(
+        self,
+        invalidate_mock: Mock,
+        url,
+        api_client: TestClient,
+        generate_auth_header,
+        connection_config,
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[CONNECTION_CREATE_OR_UPDATE])
+        resp = api_client.put(
+            url + "?verify=False",
+            headers=auth_header,
+            json={"host": "localhost", "port": "1234", "dbname": "my_test_db"},
+        )
+        assert resp.status_code == 200
+        invalidate_mock.assert_called_once_with(connection_config.id)
+
     def test_put_connection_config_redshift_secrets(
         self,
         api_client: TestClient,
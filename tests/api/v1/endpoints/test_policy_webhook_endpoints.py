@@ -34,6 +34,11 @@ def embedded_http_connection_config(connection_config: ConnectionConfig) -> Dict
         "updated_at": stringify_date(connection_config.updated_at),
         "last_test_timestamp": None,
         "last_test_succeeded": None,
+        "max_concurrent_queries": None,
+        "pool_size": None,
+        "max_overflow": None,
+        "pool_recycle": None,
+        "pool_pre_ping": None,
     }
 
 
@@ -24,6 +24,8 @@ from fidesops.api.v1.urn_registry import (
     DATASETS,
     PRIVACY_REQUEST_APPROVE,
     PRIVACY_REQUEST_DENY,
+    PRIVACY_REQUEST_CANCEL,
+    PRIVACY_REQUEST_TRACE,
 )
 from fidesops.api.v1.scope_registry import (
     STORAGE_CREATE_OR_UPDATE,
@@ -54,6 +56,7 @@ from fidesops.util.cache import (
     get_masking_secret_cache_key,
 )
 from fidesops.util.oauth_util import generate_jwe
+from fidesops.util.tracing import CONNECTOR, SpanRecorder
 
 page_size = Params().size
 
@@ -1120,6 +1123,37 @@ class TestRequestPreview:
         )
 
 
+    def test_request_preview_pruned_by_policy(
+        self,
+        postgres_example_test_dataset_config,
+        policy,
+        api_client: TestClient,
+        url,
+        generate_auth_header,
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        data = [postgres_example_test_dataset_config.fides_key]
+        response = api_client.put(
+            url, headers=auth_header, json=data, params={"policy_key": policy.key}
+        )
+        assert response.status_code == 200
+        pruned = {
+            response["collectionAddress"]["collection"]
+            for response in response.json()
+            if response["pruned"]
+        }
+        # these neither hold user.provided.identifiable data nor lead to a collection that does
+        assert pruned == {"login", "order_item", "product"}
+
+        response = api_client.put(url, headers=auth_header, json=data)
+        assert not any(response["pruned"] for response in response.json())
+
+        response = api_client.put(
+            url, headers=auth_header, json=data, params={"policy_key": "bad_key"}
+        )
+        assert response.status_code == 404
+
+
 class TestApprovePrivacyRequest:
     @pytest.fixture(scope="function")
     def url(self, db, privacy_request):
@@ -1343,6 +1377,108 @@ class TestDenyPrivacyRequest:
         assert not submit_mock.called  # Shouldn't run! Privacy request was denied
 
 
+class TestCancelPrivacyRequest:
+    @pytest.fixture(scope="function")
+    def url(self, db, privacy_request):
+        return V1_URL_PREFIX + PRIVACY_REQUEST_CANCEL
+
+    def test_cancel_privacy_request_not_authenticated(self, url, api_client):
+        response = api_client.patch(url)
+        assert response.status_code == 401
+
+    def test_cancel_privacy_request_bad_scopes(
+        self, url, api_client, generate_auth_header
+    ):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.patch(url, headers=auth_header)
+        assert response.status_code == 403
+
+    def test_cancel_completed_privacy_request(
+        self, db, url, api_client, generate_auth_header, privacy_request
+    ):
+        privacy_request.status = PrivacyRequestStatus.complete
+        privacy_request.save(db=db)
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_REVIEW])
+
+        body = {"request_ids": [privacy_request.id]}
+        response = api_client.patch(url, headers=auth_header, json=body)
+        assert response.status_code == 200
+
+        response_body = response.json()
+        assert response_body["succeeded"] == []
+        assert response_body["failed"][0]["message"] == "Cannot transition status"
+        assert not privacy_request.cancel_requested()
+
+    def test_cancel_privacy_request(
+        self, db, url, api_client, generate_auth_header, privacy_request
+    ):
+        privacy_request.status = PrivacyRequestStatus.in_processing
+        privacy_request.save(db=db)
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_REVIEW])
+
+        body = {"request_ids": [privacy_request.id]}
+        response = api_client.patch(url, headers=auth_header, json=body)
+        assert response.status_code == 200
+
+        response_body = response.json()
+        assert len(response_body["succeeded"]) == 1
+        assert response_body["failed"] == []
+        assert response_body["succeeded"][0]["status"] == "canceled"
+        assert response_body["succeeded"][0]["finished_processing_at"] is not None
+        # a run of the privacy request in progress is signalled to stop
+        assert privacy_request.cancel_requested()
+
+
+class TestGetRequestTrace:
+    @pytest.fixture(scope="function")
+    def url(self, db, privacy_request):
+        return V1_URL_PREFIX + PRIVACY_REQUEST_TRACE.format(
+            privacy_request_id=privacy_request.id
+        )
+
+    def test_get_trace_not_authenticated(self, url, api_client):
+        response = api_client.get(url)
+        assert response.status_code == 401
+
+    def test_get_trace_bad_scopes(self, url, api_client, generate_auth_header):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_REVIEW])
+        response = api_client.get(url, headers=auth_header)
+        assert response.status_code == 403
+
+    def test_get_trace_privacy_request_not_found(
+        self, api_client, generate_auth_header
+    ):
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.get(
+            V1_URL_PREFIX
+            + PRIVACY_REQUEST_TRACE.format(privacy_request_id="not_a_privacy_request"),
+            headers=auth_header,
+        )
+        assert response.status_code == 404
+
+    def test_get_trace(
+        self, cache, url, api_client, generate_auth_header, privacy_request
+    ):
+        recorder = SpanRecorder(privacy_request.id)
+        recorder.add("retrieve_data", CONNECTOR, 1650000000.5, 0.25, rows=3)
+        recorder.save(cache)
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+
+        response = api_client.get(url, headers=auth_header)
+        assert response.status_code == 200
+        assert "attachment" in response.headers["Content-Disposition"]
+
+        trace = response.json()
+        assert trace["otherData"] == {"privacy_request_id": privacy_request.id}
+        [event] = trace["traceEvents"]
+        assert event["name"] == "retrieve_data"
+        assert event["cat"] == CONNECTOR
+        assert event["ph"] == "X"
+        assert event["ts"] == 1650000000500000
+        assert event["dur"] == 250000
+        assert event["args"] == {"rows": 3}
+
+
 class TestResumePrivacyRequest:
     @pytest.fixture(scope="function")
     def url(self, db, privacy_request):
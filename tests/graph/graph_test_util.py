@@ -253,3 +253,19 @@ def generate_fully_connected_resources(size: int) -> List[Dataset]:
         for other_name in resource_names.difference({name}):
             connect(r, resources_dict[other_name])
     return list(resources_dict.values())
+
+
+def generate_linked_resources(size: int) -> List[Dataset]:
+    """Generate a chain of resources, each also linked to the resource half way back along the chain.
+    Used to benchmark the traversal of large graphs."""
+    resources = generate_graph_resources(size)
+    fields = {r.name: {f.name: f for f in r.collections[0].fields} for r in resources}
+    fields["dr_1"]["f1"].identity = "email"
+    for i in range(2, size + 1):
+        fields[f"dr_{i - 1}"]["f1"].references.append(
+            (FieldAddress(f"dr_{i}", f"ds_{i}", "f1"), None)
+        )
+        fields[f"dr_{i}"]["f2"].references.append(
+            (FieldAddress(f"dr_{i // 2}", f"ds_{i // 2}", "f2"), None)
+        )
+    return resources
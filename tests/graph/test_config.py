@@ -10,6 +10,7 @@ from fidesops.graph.data_type import (
     NoOpTypeConverter,
     ObjectTypeConverter,
 )
+from fidesops.task.consolidate_query_matches import consolidate_query_matches
 
 
 class TestCollectionAddress:
@@ -431,3 +432,34 @@ class TestFieldPath:
     def test_parse(self):
         assert FieldPath.parse("a") == FieldPath("a")
         assert FieldPath.parse("a.b.c.d.e") == FieldPath("a", "b", "c", "d", "e")
+
+    def test_compile_query_matcher(self):
+        """Compiled matchers consolidate the same values as consolidate_query_matches"""
+        input_data = {
+            "A": [
+                [{"B": 1, "C": 2, "D": [3]}, {}],
+                [{"B": 3, "C": {"E": 4}, "D": [5]}, {"B": 77, "C": 88, "D": [99]}],
+            ],
+            "B": 55,
+        }
+        for field_path in [
+            FieldPath("B"),
+            FieldPath("A", "D"),
+            FieldPath("A", "C", "E"),
+            FieldPath("A", "E", "X"),
+            FieldPath(),
+        ]:
+            matcher = compile_query_matcher(field_path)
+            assert matcher(input_data) == consolidate_query_matches(
+                input_data, field_path
+            )
+            # matchers can be reused across rows
+            assert matcher([input_data, input_data]) == consolidate_query_matches(
+                [input_data, input_data], field_path
+            )
+
+        assert compile_query_matcher(FieldPath("A", "C", "E"))(input_data) == [
+            2,
+            4,
+            88,
+        ]
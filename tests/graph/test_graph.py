@@ -1,8 +1,23 @@
+from collections import defaultdict
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+from pymongo.errors import AutoReconnect
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from fidesops.common_exceptions import (
+    ClientUnsuccessfulException,
+    ConnectionException,
+    PostProcessingException,
+    PrivacyRequestCanceled,
+    RetryTask,
+)
 from fidesops.core.config import config
 from fidesops.graph.config import *
 from fidesops.graph.traversal import *
 from fidesops.models.policy import ActionType
-from fidesops.task.graph_task import retry
+from fidesops.task.graph_task import is_transient_error, retry
 from tests.task.traversal_data import integration_db_graph
 
 t1 = Collection(
@@ -57,7 +72,6 @@ class TestNode:
 
 
 def test_retry_decorator():
-    input_data = {"test": "data"}
     graph: DatasetGraph = integration_db_graph("postgres_example")
     traversal = Traversal(graph, {"email": "X"})
     traversal_nodes: Dict[
@@ -69,11 +83,15 @@ def test_retry_decorator():
 
     config.execution.TASK_RETRY_COUNT = 5
     config.execution.TASK_RETRY_DELAY = 0.1
-    config.execution.TASK_RETRY_BACKOFF = 0.01
+    config.execution.TASK_RETRY_BACKOFF = 2
 
     class TestRetryDecorator:
-        def __init__(self):
+        def __init__(self, error: BaseException):
             self.traversal_node = payment_card_node
+            self.resources = Mock()
+            self.retry_attempts = defaultdict(int)
+            self.first_attempt_at = {}
+            self.error = error
             self.call_count = 0
             self.start_logged = 0
             self.retry_logged = 0
@@ -91,12 +109,107 @@ def test_retry_decorator():
         @retry(action_type=ActionType.access, default_return=[])
         def test_function(self):
             self.call_count += 1
-            input_data["nonexistent_value"]
+            raise self.error
 
-    test_obj = TestRetryDecorator()
-    test_obj.test_function()
+    test_obj = TestRetryDecorator(ConnectionException("Connection reset"))
+    for attempt in range(5):
+        # the executor is asked to run the task again later
+        with pytest.raises(RetryTask) as retry_task:
+            test_obj.test_function()
+        max_delay = 0.1 * 2 ** (attempt + 1)
+        assert max_delay / 2 <= retry_task.value.delay <= max_delay
+    # the retries have run out
+    assert test_obj.test_function() == []
     assert test_obj.call_count == 6  # called once, with 5 retries
     assert test_obj.end_called_with[0] == ActionType.access
-    assert isinstance(test_obj.end_called_with[1], KeyError)
+    assert isinstance(test_obj.end_called_with[1], ConnectionException)
     assert test_obj.start_logged == 1
     assert test_obj.retry_logged == 5
+
+    # permanent errors are not retried
+    test_obj = TestRetryDecorator(KeyError("nonexistent_value"))
+    assert test_obj.test_function() == []
+    assert test_obj.call_count == 1
+    assert isinstance(test_obj.end_called_with[1], KeyError)
+    assert test_obj.retry_logged == 0
+
+
+def test_retry_decorator_stops_at_node_deadline():
+    class TestTimedTask:
+        def __init__(self):
+            self.traversal_node = Mock()
+            self.resources = Mock()
+            self.retry_attempts = defaultdict(int)
+            self.first_attempt_at = {}
+            self.call_count = 0
+            self.end_called_with = ()
+
+        def log_end(self, action_type: ActionType, exc: Optional[str] = None):
+            self.end_called_with = (action_type, exc)
+
+        def log_start(self, _: ActionType):
+            pass
+
+        def log_retry(self, _: ActionType):
+            pass
+
+        @retry(action_type=ActionType.access, default_return=[])
+        def test_function(self):
+            self.call_count += 1
+            raise ConnectionException("Connection reset")
+
+    with mock.patch.multiple(
+        config.execution,
+        TASK_RETRY_COUNT=5,
+        TASK_RETRY_DELAY=0.1,
+        TASK_RETRY_BACKOFF=2,
+        TASK_TIMEOUT_SECONDS=1,
+    ):
+        test_obj = TestTimedTask()
+        with pytest.raises(RetryTask):
+            test_obj.test_function()
+
+        # a second later, a retry would start past the node's deadline
+        test_obj.first_attempt_at["test_function"] -= 1
+        assert test_obj.test_function() == []
+    assert test_obj.call_count == 2
+    assert isinstance(test_obj.end_called_with[1], ConnectionException)
+
+
+def test_retry_decorator_stops_when_halted():
+    class TestHaltedTask:
+        def __init__(self):
+            self.resources = Mock()
+            self.resources.raise_if_halted.side_effect = PrivacyRequestCanceled(
+                "canceled"
+            )
+            self.retry_attempts = defaultdict(int)
+            self.call_count = 0
+
+        @retry(action_type=ActionType.access, default_return=[])
+        def test_function(self):
+            self.call_count += 1
+
+    test_obj = TestHaltedTask()
+    with pytest.raises(PrivacyRequestCanceled):
+        test_obj.test_function()
+    assert test_obj.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "error, transient",
+    [
+        (ConnectionException("Operational Error connecting to 'saas'."), True),
+        (ClientUnsuccessfulException(status_code=429), True),
+        (ClientUnsuccessfulException(status_code=503), True),
+        (ClientUnsuccessfulException(status_code=404), False),
+        (OperationalError("select 1", {}, Exception("lock timeout")), True),
+        (ProgrammingError("select 1", {}, Exception("syntax error")), False),
+        (AutoReconnect("connection closed"), True),
+        (ConnectionResetError(), True),
+        (KeyError("email"), False),
+        (PostProcessingException("bad postprocessor"), False),
+    ],
+)
+def test_is_transient_error(error, transient):
+    assert is_transient_error(error) == transient
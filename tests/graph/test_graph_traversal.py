@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from fidesops.graph.graph import *
 from .graph_test_util import *
@@ -692,3 +694,115 @@ def test_different_seed_alters_traversal() -> None:
         len(Traversal(graph, {"ssn": "1", "email": 1, "user_id": 1}).root_node.children)
         == 4
     )
+
+
+def test_traversal_plans_are_cached() -> None:
+    clear_cached_plans()
+    t = generate_fully_connected_resources(4)
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    field(t, "dr_2", "ds_2", "f1").identity = "user_id"
+    graph = DatasetGraph(*t)
+
+    traversal = Traversal(graph, {"email": "1"})
+    # an identically shaped graph with different identity values reuses the plan
+    same_shape = Traversal(DatasetGraph(*t), {"email": "2"})
+    assert same_shape.plan is traversal.plan
+    assert same_shape.traversal_map()[1] == traversal.traversal_map()[1]
+    assert {
+        address: tn.debug() for address, tn in same_shape.traversal_node_dict.items()
+    } == {address: tn.debug() for address, tn in traversal.traversal_node_dict.items()}
+
+    # a different set of identity keys needs a different plan
+    other_keys = Traversal(graph, {"email": "1", "user_id": "1"})
+    assert other_keys.plan is not traversal.plan
+    assert len(other_keys.root_node.children) == 2
+
+
+def test_least_recently_used_plans_are_evicted() -> None:
+    clear_cached_plans()
+    t = generate_fully_connected_resources(3)
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    field(t, "dr_2", "ds_2", "f1").identity = "user_id"
+    field(t, "dr_3", "ds_3", "f1").identity = "ssn"
+    graph = DatasetGraph(*t)
+
+    with mock.patch("fidesops.graph.traversal.MAX_CACHED_PLANS", 2):
+        email = Traversal(graph, {"email": "1"}).plan
+        user_id = Traversal(graph, {"user_id": "1"}).plan
+        # using a plan keeps it cached
+        assert Traversal(graph, {"email": "2"}).plan is email
+        Traversal(graph, {"ssn": "1"})
+
+        assert Traversal(graph, {"email": "3"}).plan is email
+        assert Traversal(graph, {"user_id": "2"}).plan is not user_id
+    clear_cached_plans()
+
+
+def test_traversal_scales_linearly() -> None:
+    def edge_lookups(size: int) -> int:
+        graph = DatasetGraph(*generate_linked_resources(size))
+        clear_cached_plans()
+        with mock.patch.object(
+            FieldAddress,
+            "collection_address",
+            autospec=True,
+            side_effect=FieldAddress.collection_address,
+        ) as collection_address:
+            traversal = Traversal(graph, {"email": "1"})
+        assert len(traversal.plan.order) == size + 1
+        return collection_address.call_count
+
+    small = edge_lookups(100)
+    large = edge_lookups(1000)
+    # scanning every remaining edge for each node run would take around 100 times as many
+    assert large / small < 15
+
+
+def test_graph_fingerprint() -> None:
+    t = generate_graph_resources(3)
+    field(t, "dr_1", "ds_1", "f1").references.append(
+        (FieldAddress("dr_2", "ds_2", "f1"), "to")
+    )
+    field(t, "dr_2", "ds_2", "f1").references.append(
+        (FieldAddress("dr_3", "ds_3", "f1"), "to")
+    )
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    fingerprint = DatasetGraph(*t).fingerprint
+    assert DatasetGraph(*t).fingerprint == fingerprint
+
+    field(t, "dr_1", "ds_1", "f1").identity = "user_id"
+    assert DatasetGraph(*t).fingerprint != fingerprint
+
+
+def test_repeated_traversal_does_not_relink_nodes() -> None:
+    t = generate_fully_connected_resources(4)
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    traversal = Traversal(DatasetGraph(*t), {"email": "1"})
+
+    first = traversal.traversal_map()
+    assert traversal.traversal_map() == first
+
+
+def test_pruned_addresses() -> None:
+    t = generate_graph_resources(4)
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    for parent, child in [("1", "2"), ("1", "3"), ("2", "4")]:
+        field(t, f"dr_{parent}", f"ds_{parent}", "f1").references.append(
+            (FieldAddress(f"dr_{child}", f"ds_{child}", "f1"), "to")
+        )
+    traversal = Traversal(DatasetGraph(*t), {"email": "X"})
+
+    def targeting(*datasets: str):
+        return lambda tn: tn.address.dataset in datasets
+
+    # the nodes leading to a targeted node are kept along with it
+    assert traversal.pruned_addresses(targeting("dr_4")) == {
+        CollectionAddress("dr_3", "ds_3")
+    }
+    assert traversal.pruned_addresses(targeting("dr_1", "dr_3")) == {
+        CollectionAddress("dr_2", "ds_2"),
+        CollectionAddress("dr_4", "ds_4"),
+    }
+    assert traversal.pruned_addresses(targeting()) == set(
+        traversal.traversal_node_dict
+    )
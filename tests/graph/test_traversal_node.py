@@ -1,3 +1,5 @@
+import pytest
+
 from fidesops.graph.traversal import *
 from .test_graph_traversal import generate_node
 
@@ -111,4 +113,61 @@ class TestTraversalNode:
         tn = TraversalNode(generate_node("a", "b", "c", "c2"))
         assert not tn.is_root_node()
 
+    def test_plan(self) -> None:
+        parent = TraversalNode(generate_node("a", "b", "c", "id"))
+        tn = TraversalNode(generate_node("d", "e", "f", "g"))
+        child = TraversalNode(generate_node("h", "i", "j"))
+        tn.node.collection.fields[0].primary_key = True
+        tn.node.collection.fields[0].data_categories = ["user.provided"]
+        tn.node.collection.grouped_inputs = {"g"}
 
+        parent.add_child(
+            tn, Edge(FieldAddress("a", "b", "c"), FieldAddress("d", "e", "f"))
+        )
+        plan = tn.plan
+        # the plan is compiled once and reused
+        assert tn.plan is plan
+        assert plan.query_field_paths == {FieldPath("f")}
+        assert plan.query_fields == {
+            "f": (FieldPath("f"), tn.node.collection.fields[0])
+        }
+        assert plan.primary_key_field_paths == {
+            FieldPath("f"): tn.node.collection.fields[0]
+        }
+        assert plan.field_paths_by_category == {"user.provided": (FieldPath("f"),)}
+        assert plan.input_keys == (CollectionAddress("a", "b"),)
+        assert plan.output_keys == frozenset()
+        # plans are shared, so they cannot be modified
+        with pytest.raises(TypeError):
+            plan.field_dict[FieldPath("x")] = tn.node.collection.fields[0]
+
+        # linking a node changes the edges of both ends, so their plans are compiled again
+        parent.add_child(
+            tn, Edge(FieldAddress("a", "b", "id"), FieldAddress("d", "e", "g"))
+        )
+        tn.add_child(
+            child, Edge(FieldAddress("d", "e", "g"), FieldAddress("h", "i", "j"))
+        )
+        assert tn.plan is not plan
+        assert tn.plan.output_keys == {"g"}
+
+        def sorted_maps(field_path_maps):
+            return tuple({k: sorted(v) for k, v in m.items()} for m in field_path_maps)
+
+        assert sorted_maps(tn.plan.incoming_field_path_maps) == (
+            {
+                CollectionAddress("a", "b"): [
+                    (FieldPath("c"), FieldPath("f")),
+                    (FieldPath("id"), FieldPath("g")),
+                ]
+            },
+            {CollectionAddress("a", "b"): []},
+        )
+        assert tn.plan.grouped_incoming_field_path_maps == (
+            {CollectionAddress("a", "b"): ((FieldPath("c"), FieldPath("f")),)},
+            {CollectionAddress("a", "b"): ((FieldPath("id"), FieldPath("g")),)},
+        )
+        assert tn.typed_filtered_values({"f": [1, None], "g": [2], "x": [3]}) == {
+            "f": [1],
+            "g": [2],
+        }
@@ -4,10 +4,10 @@ from datetime import datetime
 from unittest import mock
 from unittest.mock import Mock
 
-import dask
 import pytest
 from bson import ObjectId
 
+from fidesops.core.config import config
 from fidesops.graph.config import (
     FieldAddress,
     ScalarField,
@@ -42,7 +42,6 @@ from ..task.traversal_data import (
     combined_mongo_postgresql_graph,
 )
 
-dask.config.set(scheduler="processes")
 empty_policy = Policy()
 
 
@@ -256,7 +255,10 @@ def test_combined_erasure_task(
 
 @pytest.mark.integration_mongodb
 @pytest.mark.integration
-def test_mongo_erasure_task(db, mongo_inserts, integration_mongodb_config):
+@pytest.mark.parametrize("executor_name", ["thread", "asyncio"])
+def test_mongo_erasure_task(
+    db, mongo_inserts, integration_mongodb_config, executor_name
+):
     policy = erasure_policy("A", "B")
     seed_email = mongo_inserts["customer"][0]["email"]
     privacy_request = PrivacyRequest(
@@ -278,14 +280,16 @@ def test_mongo_erasure_task(db, mongo_inserts, integration_mongodb_config):
         [integration_mongodb_config],
         {"email": seed_email},
     )
-    v = graph_task.run_erasure(
-        privacy_request,
-        policy,
-        graph,
-        [integration_mongodb_config],
-        {"email": seed_email},
-        get_cached_data_for_erasures(privacy_request.id),
-    )
+    # with the asyncio executor, each collection's rows are masked in a single bulk write
+    with mock.patch.object(config.execution, "TASK_EXECUTOR", executor_name):
+        v = graph_task.run_erasure(
+            privacy_request,
+            policy,
+            graph,
+            [integration_mongodb_config],
+            {"email": seed_email},
+            get_cached_data_for_erasures(privacy_request.id),
+        )
 
     assert v == {
         "mongo_test:customer": 1,
@@ -297,7 +301,7 @@ def test_mongo_erasure_task(db, mongo_inserts, integration_mongodb_config):
 
 @pytest.mark.integration_mongodb
 @pytest.mark.integration
-def test_dask_mongo_task(integration_mongodb_config: ConnectionConfig) -> None:
+def test_graph_executor_mongo_task(integration_mongodb_config: ConnectionConfig) -> None:
     privacy_request = PrivacyRequest(id=f"test_mongo_task_{random.randint(0,1000)}")
 
     v = graph_task.run_access_request(
@@ -1,18 +1,31 @@
 import copy
 import logging
 import random
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest import mock
 from unittest.mock import Mock
+from uuid import uuid4
 
-import dask
+import psycopg2.extras
 import pytest
+from sqlalchemy.exc import OperationalError
 
+from fidesops.common_exceptions import (
+    ConnectionException,
+    PrivacyRequestCanceled,
+    PrivacyRequestTimeout,
+)
 from fidesops.core.config import config
-from fidesops.graph.config import FieldAddress, Collection, ScalarField, Dataset
+from fidesops.graph.config import (
+    CollectionAddress,
+    FieldAddress,
+    Collection,
+    ScalarField,
+    Dataset,
+)
 from fidesops.graph.data_type import DataType, StringTypeConverter
 from fidesops.graph.graph import DatasetGraph, Edge, Node
-from fidesops.graph.traversal import TraversalNode
+from fidesops.graph.traversal import Traversal, TraversalNode
 from fidesops.models.connectionconfig import ConnectionConfig
 from fidesops.models.datasetconfig import convert_dataset_to_graph
 from fidesops.models.policy import Policy
@@ -20,8 +33,16 @@ from fidesops.models.policy import Rule, RuleTarget, ActionType
 from fidesops.models.privacy_request import ExecutionLog, PrivacyRequest
 from fidesops.schemas.dataset import FidesopsDataset
 from fidesops.service.connectors import get_connector
+from fidesops.service.connectors.sql_connector import SQLConnector
 from fidesops.task import graph_task
 from fidesops.task.filter_results import filter_data_categories
+from fidesops.task.task_resources import TaskResources
+from fidesops.util.cache import (
+    get_cache,
+    get_cancel_cache_key,
+    get_masking_progress_cache_key,
+)
+from fidesops.util.tracing import get_trace
 from fidesops.task.graph_task import (
     get_cached_data_for_erasures,
 )
@@ -33,7 +54,6 @@ from ..graph.graph_test_util import (
 )
 from ..task.traversal_data import integration_db_graph, integration_db_dataset
 
-dask.config.set(scheduler="processes")
 logger = logging.getLogger(__name__)
 sample_postgres_configuration_policy = erasure_policy(
     "system.operations",
@@ -258,6 +278,228 @@ def test_sql_erasure_task(db, postgres_inserts, integration_postgres_config):
     }
 
 
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+@pytest.mark.parametrize("reverse_on_retry", [False, True])
+def test_sql_masking_resumes_after_last_commit(
+    db, postgres_inserts, integration_postgres_config, reverse_on_retry
+):
+    seed_email = postgres_inserts["customer"][0]["email"]
+
+    policy = erasure_policy("A")
+    dataset = integration_db_dataset("postgres_example", "postgres_example")
+    field([dataset], "postgres_example", "address", "id").primary_key = True
+    field([dataset], "postgres_example", "address", "city").data_categories = ["A"]
+    graph = DatasetGraph(dataset)
+    privacy_request = PrivacyRequest(
+        id=f"test_sql_masking_resumes_{random.randint(0, 1000)}"
+    )
+    graph_task.run_access_request(
+        privacy_request,
+        policy,
+        graph,
+        [integration_postgres_config],
+        {"email": seed_email},
+    )
+    rows = get_cached_data_for_erasures(privacy_request.id)["postgres_example:address"]
+    assert len(rows) == 2
+
+    node = Traversal(graph, {"email": seed_email}).traversal_node_dict[
+        CollectionAddress("postgres_example", "address")
+    ]
+    connector = get_connector(integration_postgres_config)
+    mask_rows = connector.mask_rows
+    calls = []
+
+    def fail_second_commit(*args):
+        calls.append(args[-1])
+        if len(calls) == 2:
+            raise OperationalError("UPDATE", {}, "connection lost")
+        return mask_rows(*args)
+
+    config.execution.MASKING_COMMIT_SIZE = 1
+    try:
+        with mock.patch.object(connector, "mask_rows", side_effect=fail_second_commit):
+            with pytest.raises(OperationalError):
+                connector.mask_data(node, policy, privacy_request, rows)
+            # the first row was committed before the failure, so is not masked again,
+            # even if the rows are given in a different order
+            retry_rows = list(reversed(rows)) if reverse_on_retry else rows
+            assert connector.mask_data(node, policy, privacy_request, retry_rows) == 2
+    finally:
+        config.execution.MASKING_COMMIT_SIZE = 5000
+
+    assert calls == [[rows[0]], [rows[1]], [rows[1]]]
+    progress_key = get_masking_progress_cache_key(privacy_request.id, str(node.address))
+    assert get_cache().exists(progress_key, f"{progress_key}-updated") == 0
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+def test_sql_masking_batch_sent_in_one_round_trip(
+    db, postgres_inserts, integration_postgres_config
+):
+    seed_email = postgres_inserts["customer"][0]["email"]
+
+    policy = erasure_policy("A")
+    dataset = integration_db_dataset("postgres_example", "postgres_example")
+    field([dataset], "postgres_example", "address", "id").primary_key = True
+    field([dataset], "postgres_example", "address", "city").data_categories = ["A"]
+    graph = DatasetGraph(dataset)
+    privacy_request = PrivacyRequest(id=f"test_sql_masking_batch_{uuid4()}")
+    graph_task.run_access_request(
+        privacy_request,
+        policy,
+        graph,
+        [integration_postgres_config],
+        {"email": seed_email},
+    )
+    rows = get_cached_data_for_erasures(privacy_request.id)["postgres_example:address"]
+    assert len(rows) == 2
+
+    node = Traversal(graph, {"email": seed_email}).traversal_node_dict[
+        CollectionAddress("postgres_example", "address")
+    ]
+    connector = get_connector(integration_postgres_config)
+    # psycopg2 does not report the records updated by execute_batch, so each row counts as one
+    assert not connector.client().dialect.supports_sane_multi_rowcount
+    with mock.patch(
+        "psycopg2.extras.execute_batch", wraps=psycopg2.extras.execute_batch
+    ) as execute_batch:
+        assert connector.mask_data(node, policy, privacy_request, rows) == 2
+
+    assert execute_batch.call_count == 1
+    assert len(execute_batch.call_args.args[2]) == 2
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+def test_sql_retrieval_split_between_queries(
+    db, postgres_inserts, integration_postgres_config
+):
+    seed_email = postgres_inserts["customer"][0]["email"]
+    address_ids = [address["id"] for address in postgres_inserts["address"]]
+
+    dataset = integration_db_dataset("postgres_example", "postgres_example")
+    graph = DatasetGraph(dataset)
+    node = Traversal(graph, {"email": seed_email}).traversal_node_dict[
+        CollectionAddress("postgres_example", "address")
+    ]
+    privacy_request = PrivacyRequest(id=f"test_sql_retrieval_split_{uuid4()}")
+    connector = get_connector(integration_postgres_config)
+    expected = connector.retrieve_data(
+        node, Policy(), privacy_request, {"id": address_ids}
+    )
+    assert len(expected) == len(address_ids)
+
+    config.execution.MAX_IN_LIST_SIZE = 1
+    try:
+        with mock.patch.object(
+            connector, "execute_query", wraps=connector.execute_query
+        ) as execute_query:
+            rows = connector.retrieve_data(
+                node, Policy(), privacy_request, {"id": address_ids}
+            )
+    finally:
+        config.execution.MAX_IN_LIST_SIZE = 1000
+
+    assert execute_query.call_count == len(address_ids)
+    # The queries are run one after another on a single connection
+    assert len({call.args[0] for call in execute_query.call_args_list}) == 1
+    assert sorted(rows, key=lambda row: row["id"]) == sorted(
+        expected, key=lambda row: row["id"]
+    )
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+def test_sql_retrieval_streamed_in_chunks(
+    db, postgres_inserts, integration_postgres_config
+):
+    seed_email = postgres_inserts["customer"][0]["email"]
+    address_ids = [address["id"] for address in postgres_inserts["address"]]
+
+    dataset = integration_db_dataset("postgres_example", "postgres_example")
+    field([dataset], "postgres_example", "address", "id").primary_key = True
+    graph = DatasetGraph(dataset)
+    node = Traversal(graph, {"email": seed_email}).traversal_node_dict[
+        CollectionAddress("postgres_example", "address")
+    ]
+    privacy_request = PrivacyRequest(id=f"test_sql_retrieval_streamed_{uuid4()}")
+    connector = get_connector(integration_postgres_config)
+    expected = connector.retrieve_data(
+        node, Policy(), privacy_request, {"id": address_ids}
+    )
+
+    config.execution.SQL_STREAM_RESULTS = True
+    config.execution.MAX_IN_LIST_SIZE = 2
+    try:
+        with mock.patch.object(connector, "retrieve_data") as retrieve_data:
+            chunks = list(
+                connector.retrieve_data_chunks(
+                    node,
+                    Policy(),
+                    privacy_request,
+                    # the first address is queried twice, but only returned once
+                    {"id": address_ids + address_ids[:1]},
+                    chunk_size=1,
+                )
+            )
+    finally:
+        config.execution.SQL_STREAM_RESULTS = False
+        config.execution.MAX_IN_LIST_SIZE = 1000
+
+    assert not retrieve_data.called
+    assert [len(chunk) for chunk in chunks] == [1] * len(address_ids)
+    rows = [row for chunk in chunks for row in chunk]
+    assert sorted(rows, key=lambda row: row["id"]) == sorted(
+        expected, key=lambda row: row["id"]
+    )
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+def test_sql_erasure_task_pruned_by_policy(
+    db, postgres_inserts, integration_postgres_config
+):
+    seed_email = postgres_inserts["customer"][0]["email"]
+
+    policy = erasure_policy("A")
+    dataset = integration_db_dataset("postgres_example", "postgres_example")
+    field([dataset], "postgres_example", "customer", "name").data_categories = ["A"]
+    graph = DatasetGraph(dataset)
+    privacy_request = PrivacyRequest(
+        id=f"test_sql_erasure_task_pruned_{random.randint(0, 1000)}"
+    )
+    with mock.patch.object(config.execution, "PRUNE_UNTARGETED_COLLECTIONS", True):
+        access_request_data = graph_task.run_access_request(
+            privacy_request,
+            policy,
+            graph,
+            [integration_postgres_config],
+            {"email": seed_email},
+        )
+        v = graph_task.run_erasure(
+            privacy_request,
+            policy,
+            graph,
+            [integration_postgres_config],
+            {"email": seed_email},
+            get_cached_data_for_erasures(privacy_request.id),
+        )
+
+    # only the customer collection holds data the policy targets, and no other collection leads to it
+    assert list(access_request_data) == ["postgres_example:customer"]
+    assert v == {
+        "postgres_example:customer": 1,
+        "postgres_example:payment_card": 0,
+        "postgres_example:orders": 0,
+        "postgres_example:address": 0,
+    }
+    logs = db.query(ExecutionLog).filter_by(privacy_request_id=privacy_request.id)
+    assert {log.collection_name for log in logs} == {"customer"}
+
+
 @pytest.mark.integration_postgres
 @pytest.mark.integration
 def test_postgres_access_request_task(
@@ -949,8 +1191,8 @@ class TestRetryIntegration:
         graph = convert_dataset_to_graph(dataset, integration_postgres_config.key)
         dataset_graph = DatasetGraph(*[graph])
 
-        # Mock errors with retrieving data
-        mock_retrieve.side_effect = Exception("Insufficient data")
+        # Mock transient errors with retrieving data
+        mock_retrieve.side_effect = ConnectionException("Connection reset")
 
         # Call run_access_request with an email that isn't in the database
         access_request_results = graph_task.run_access_request(
@@ -965,52 +1207,41 @@ class TestRetryIntegration:
             privacy_request_id=privacy_request.id
         )
 
-        assert 33 == execution_logs.count()
+        assert 21 == execution_logs.count()
 
+        # Only the collections queried with the seed data run
+        cannot_reach = {"customer", "employee", "report", "service_request", "visit"}
         processing = execution_logs.filter_by(status="in_processing")
-        assert 11 == processing.count()
-        assert {
-            "employee",
-            "visit",
-            "customer",
-            "report",
-            "orders",
-            "payment_card",
-            "service_request",
-            "login",
-            "address",
-            "order_item",
-            "product",
-        } == set([pro.collection_name for pro in processing])
+        assert cannot_reach == set([pro.collection_name for pro in processing])
 
         errored = execution_logs.filter_by(status="error")
         retried = execution_logs.filter_by(status="retrying")
 
-        assert 11 == retried.count()
-        assert 11 == errored.count()
+        assert cannot_reach == set([ret.collection_name for ret in retried])
+        assert cannot_reach == set([err.collection_name for err in errored])
+        assert 5 == retried.count()
+        assert 5 == errored.count()
 
-        cannot_reach = {
-            "visit",
+        # The collections downstream of them are skipped, as no data reached them
+        skipped = {
             "payment_card",
-            "customer",
             "orders",
             "order_item",
             "address",
             "product",
-            "service_request",
             "login",
-            "employee",
-            "report",
         }
-
-        assert cannot_reach == set([ret.collection_name for ret in retried])
-        assert cannot_reach == set([err.collection_name for err in errored])
-
         complete = execution_logs.filter_by(status="complete")
-        assert 0 == complete.count()
+        assert skipped == set([com.collection_name for com in complete])
+        assert 6 == complete.count()
+        assert {"skipped: no data was found for any input"} == set(
+            com.message for com in complete
+        )
 
         # No results were accessible because all retrieve_data calls failed.
-        assert access_request_results == {}
+        assert access_request_results == {
+            f"postgres_example_test_dataset:{collection}": [] for collection in skipped
+        }
 
     @mock.patch("fidesops.service.connectors.sql_connector.SQLConnector.mask_data")
     def test_retry_erasure(
@@ -1031,8 +1262,8 @@ class TestRetryIntegration:
         graph = convert_dataset_to_graph(dataset, integration_postgres_config.key)
         dataset_graph = DatasetGraph(*[graph])
 
-        # Mock errors with masking data
-        mock_mask.side_effect = Exception("Insufficient data")
+        # Mock transient errors with masking data
+        mock_mask.side_effect = ConnectionException("Connection reset")
 
         # Call run_erasure with an email that isn't in the database
         erasure_results = graph_task.run_erasure(
@@ -1098,3 +1329,334 @@ class TestRetryIntegration:
             "postgres_example_test_dataset:order_item": 0,
             "postgres_example_test_dataset:product": 0,
         }
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+class TestCheckpoints:
+    def test_rerun_access_request_loads_completed_collections(
+        self, db, policy, integration_postgres_config
+    ) -> None:
+        privacy_request = PrivacyRequest(id=f"test_checkpoints_{str(uuid4())}")
+        graph = integration_db_graph("postgres_example")
+        identity = {"email": "customer-1@example.com"}
+
+        expected = graph_task.run_access_request(
+            PrivacyRequest(id=f"test_checkpoints_{str(uuid4())}"),
+            policy,
+            graph,
+            [integration_postgres_config],
+            identity,
+        )
+        # the first run fails once every collection has completed
+        with mock.patch.object(
+            TaskResources, "pop_results", side_effect=ValueError("interrupted")
+        ), pytest.raises(ValueError):
+            graph_task.run_access_request(
+                privacy_request, policy, graph, [integration_postgres_config], identity
+            )
+
+        with mock.patch(
+            "fidesops.service.connectors.sql_connector.SQLConnector.retrieve_data"
+        ) as mock_retrieve:
+            second_run = graph_task.run_access_request(
+                privacy_request, policy, graph, [integration_postgres_config], identity
+            )
+
+        assert not mock_retrieve.called
+        assert second_run == expected
+
+    def test_rerun_completed_access_request_queries_again(
+        self, db, policy, integration_postgres_config
+    ) -> None:
+        privacy_request = PrivacyRequest(id=f"test_checkpoints_{str(uuid4())}")
+        graph = integration_db_graph("postgres_example")
+        identity = {"email": "customer-1@example.com"}
+
+        first_run = graph_task.run_access_request(
+            privacy_request, policy, graph, [integration_postgres_config], identity
+        )
+
+        # the policy has no erasure rules, so the checkpoints were cleared once it completed
+        with mock.patch.object(
+            SQLConnector,
+            "retrieve_data",
+            autospec=True,
+            side_effect=SQLConnector.retrieve_data,
+        ) as mock_retrieve:
+            second_run = graph_task.run_access_request(
+                privacy_request, policy, graph, [integration_postgres_config], identity
+            )
+
+        assert mock_retrieve.called
+        assert second_run == first_run
+
+    @mock.patch("fidesops.service.connectors.sql_connector.SQLConnector.mask_data")
+    def test_rerun_erasure_skips_completed_collections(
+        self, mock_mask, db, integration_postgres_config
+    ) -> None:
+        privacy_request = PrivacyRequest(id=f"test_checkpoints_{str(uuid4())}")
+        policy = erasure_policy("A", "B")
+        mock_mask.return_value = 2
+        with TaskResources(
+            privacy_request, policy, [integration_postgres_config]
+        ) as resources:
+            resources.cache_checkpoint("erasure_request__postgres_example:customer", 5)
+
+        erasure = graph_task.run_erasure(
+            privacy_request,
+            policy,
+            integration_db_graph("postgres_example"),
+            [integration_postgres_config],
+            {"email": "customer-1@example.com"},
+            {
+                "postgres_example:customer": [{"id": 1}],
+                "postgres_example:address": [],
+                "postgres_example:orders": [],
+                "postgres_example:payment_card": [],
+            },
+        )
+
+        # customer was masked by an earlier run, so returns its recorded count
+        assert erasure["postgres_example:customer"] == 5
+        assert erasure["postgres_example:orders"] == 2
+        assert mock_mask.call_count == 3
+
+        # once the erasure completes, checkpoints are cleared
+        assert resources.get_checkpoints(ActionType.erasure) == {}
+
+
+@pytest.mark.integration
+class TestBatchAccessRequest:
+    def test_batch_results_match_individual_runs(
+        self, db, policy, integration_postgres_config
+    ) -> None:
+        graph = integration_db_graph("postgres_example")
+        identities = {
+            f"test_batch_{str(uuid4())}": {"email": email}
+            for email in [
+                "customer-1@example.com",
+                "customer-2@example.com",
+                "jane@example.com",
+                "nobody@example.com",
+            ]
+        }
+        privacy_requests = [PrivacyRequest(id=id) for id in identities]
+        expected = {
+            privacy_request.id: graph_task.run_access_request(
+                PrivacyRequest(id=f"test_batch_{str(uuid4())}"),
+                policy,
+                graph,
+                [integration_postgres_config],
+                identities[privacy_request.id],
+            )
+            for privacy_request in privacy_requests
+        }
+
+        def sort_rows(results):
+            return {k: sorted(v, key=repr) for k, v in results.items()}
+
+        with mock.patch.object(
+            SQLConnector,
+            "retrieve_data",
+            autospec=True,
+            side_effect=SQLConnector.retrieve_data,
+        ) as mock_retrieve:
+            results = graph_task.run_batch_access_request(
+                privacy_requests,
+                policy,
+                graph,
+                [integration_postgres_config],
+                identities,
+            )
+
+        # one query per collection for the whole batch
+        assert mock_retrieve.call_count == len(graph.nodes)
+        for privacy_request in privacy_requests:
+            assert sort_rows(results[privacy_request.id]) == sort_rows(
+                expected[privacy_request.id]
+            )
+        assert results[privacy_requests[3].id]["postgres_example:customer"] == []
+
+        # each request's own run is served from the results of the batch
+        with mock.patch.object(SQLConnector, "retrieve_data") as mock_retrieve:
+            for privacy_request in privacy_requests:
+                assert sort_rows(
+                    graph_task.run_access_request(
+                        privacy_request,
+                        policy,
+                        graph,
+                        [integration_postgres_config],
+                        identities[privacy_request.id],
+                    )
+                ) == sort_rows(expected[privacy_request.id])
+        assert not mock_retrieve.called
+
+        logs = ExecutionLog.filter(
+            db=db, conditions=(ExecutionLog.privacy_request_id == privacy_requests[0].id)
+        ).all()
+        assert len(logs) == 2 * len(graph.nodes)
+
+
+@pytest.mark.integration
+def test_access_request_with_asyncio_executor(
+    db, policy, integration_postgres_config
+) -> None:
+    graph = integration_db_graph("postgres_example")
+    identity = {"email": "customer-1@example.com"}
+
+    def run(executor_name):
+        with mock.patch.object(config.execution, "TASK_EXECUTOR", executor_name):
+            return graph_task.run_access_request(
+                PrivacyRequest(id=f"test_asyncio_{str(uuid4())}"),
+                policy,
+                graph,
+                [integration_postgres_config],
+                identity,
+            )
+
+    def sort_rows(results):
+        return {k: sorted(v, key=repr) for k, v in results.items()}
+
+    expected = sort_rows(run("thread"))
+    assert sort_rows(run("asyncio")) == expected
+    assert len(run("asyncio")["postgres_example:customer"]) == 1
+
+    # results are streamed under the asyncio executor as well
+    with mock.patch.object(
+        config.execution, "SQL_STREAM_RESULTS", True
+    ), mock.patch.object(SQLConnector, "retrieve_data") as mock_retrieve:
+        assert sort_rows(run("asyncio")) == expected
+    assert not mock_retrieve.called
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("executor_name", ["thread", "asyncio"])
+def test_access_request_records_trace(
+    db, policy, integration_postgres_config, executor_name
+) -> None:
+    privacy_request = PrivacyRequest(id=f"test_trace_{str(uuid4())}")
+    graph = integration_db_graph("postgres_example")
+    with mock.patch.object(config.execution, "TASK_EXECUTOR", executor_name):
+        graph_task.run_access_request(
+            privacy_request,
+            policy,
+            graph,
+            [integration_postgres_config],
+            {"email": "customer-1@example.com"},
+        )
+
+    events = get_trace(privacy_request.id)["traceEvents"]
+    node_spans = {e["name"]: e for e in events if e["cat"] == "access"}
+    assert set(node_spans) == {str(node.address) for node in graph.nodes.values()}
+    assert {e["cat"] for e in events} == {
+        "access",
+        "query_generation",
+        "connector",
+        "post_processing",
+        "cache",
+    }
+
+    # the stages of each node are timed within the node's own span
+    customer = node_spans["postgres_example:customer"]
+    stages = [
+        e
+        for e in events
+        if e["cat"] != "access"
+        and customer["ts"] <= e["ts"] <= customer["ts"] + customer["dur"]
+    ]
+    assert {e["name"] for e in stages} >= {
+        "generate_query",
+        "retrieve_data",
+        "access_results_post_processing",
+        "cache_results",
+        "cache_checkpoint",
+    }
+
+
+@pytest.mark.integration
+class TestHaltedAccessRequest:
+    def test_canceled_request_stops(
+        self, db, policy, integration_postgres_config
+    ) -> None:
+        privacy_request = PrivacyRequest(id=f"test_cancel_{str(uuid4())}")
+        get_cache().set_with_autoexpire(
+            get_cancel_cache_key(privacy_request.id), "true"
+        )
+        with mock.patch.object(SQLConnector, "retrieve_data") as mock_retrieve:
+            with pytest.raises(PrivacyRequestCanceled):
+                graph_task.run_access_request(
+                    privacy_request,
+                    policy,
+                    integration_db_graph("postgres_example"),
+                    [integration_postgres_config],
+                    {"email": "customer-1@example.com"},
+                )
+        assert not mock_retrieve.called
+
+    def test_request_past_deadline_stops(
+        self, db, policy, integration_postgres_config
+    ) -> None:
+        with mock.patch.object(SQLConnector, "retrieve_data") as mock_retrieve:
+            with pytest.raises(PrivacyRequestTimeout):
+                graph_task.run_access_request(
+                    PrivacyRequest(id=f"test_deadline_{str(uuid4())}"),
+                    policy,
+                    integration_db_graph("postgres_example"),
+                    [integration_postgres_config],
+                    {"email": "customer-1@example.com"},
+                    deadline=datetime.utcnow() - timedelta(seconds=1),
+                )
+        assert not mock_retrieve.called
+
+    def test_statement_timeout(self, integration_postgres_config) -> None:
+        with mock.patch.object(config.execution, "QUERY_TIMEOUT_SECONDS", 1):
+            connector = get_connector(integration_postgres_config)
+            with pytest.raises(OperationalError):
+                with connector.client().connect() as connection:
+                    connection.execute("select pg_sleep(5)")
+        connector.close()
+
+
+@pytest.mark.integration_mssql
+@pytest.mark.integration
+def test_mssql_query_timeout(connection_config_mssql) -> None:
+    with mock.patch.object(config.execution, "QUERY_TIMEOUT_SECONDS", 1):
+        connector = get_connector(connection_config_mssql)
+        with pytest.raises(OperationalError):
+            with connector.client().connect() as connection:
+                connection.execute("WAITFOR DELAY '00:00:05'")
+    connector.close()
+
+
+@pytest.mark.integration
+def test_access_request_skips_collections_no_data_reaches(
+    db, policy, integration_postgres_config
+) -> None:
+    privacy_request = PrivacyRequest(id=f"test_skipped_{str(uuid4())}")
+    graph = integration_db_graph("postgres_example")
+    with mock.patch(
+        "fidesops.service.connectors.sql_connector.SQLConnector.retrieve_data_chunks",
+        autospec=True,
+        side_effect=SQLConnector.retrieve_data_chunks,
+    ) as retrieve:
+        results = graph_task.run_access_request(
+            privacy_request,
+            policy,
+            graph,
+            [integration_postgres_config],
+            {"email": "customer-not-in-the-database@example.com"},
+        )
+
+    # every collection still has a result, but only those read with the seed were queried
+    assert set(results) == {str(node.address) for node in graph.nodes.values()}
+    assert all(rows == [] for rows in results.values())
+    queried = [call.args[1].address.collection for call in retrieve.call_args_list]
+    assert queried == ["customer"]
+
+    logs = db.query(ExecutionLog).filter_by(privacy_request_id=privacy_request.id)
+    skipped = logs.filter_by(message="skipped: no data was found for any input")
+    assert {log.collection_name for log in skipped} == {
+        node.address.collection for node in graph.nodes.values()
+    } - {"customer"}
+    assert logs.count() == 2 + skipped.count()
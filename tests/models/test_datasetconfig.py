@@ -1,3 +1,5 @@
+from unittest import mock
+
 from sqlalchemy.orm import Session
 
 from fidesops.schemas.dataset import FidesopsDataset
@@ -5,6 +7,8 @@ from fidesops.models.datasetconfig import (
     convert_dataset_to_graph,
     DatasetConfig,
     FieldAddress,
+    get_dataset_graph,
+    invalidate_dataset_graph_cache,
 )
 from ..graph.graph_test_util import field
 
@@ -47,6 +51,44 @@ def test_get_graph(dataset_config: DatasetConfig) -> None:
     assert graph.collections[0].fields[0].identity == "email"
 
 
+def test_get_dataset_graph(dataset_config: DatasetConfig, db: Session) -> None:
+    invalidate_dataset_graph_cache()
+    graph = get_dataset_graph(db)
+    assert graph is get_dataset_graph(db)
+    assert graph is get_dataset_graph(db, [dataset_config])
+    assert [str(address) for address in graph.nodes] == [
+        "postgres_example_subscriptions_dataset:subscriptions"
+    ]
+
+    # saving the dataset config changes its updated_at, so the graph is rebuilt
+    dataset_config.dataset["description"] = "Updated description"
+    dataset_config.save(db=db)
+    updated = get_dataset_graph(db)
+    assert updated is not graph
+    assert updated is get_dataset_graph(db)
+
+    invalidate_dataset_graph_cache()
+    assert get_dataset_graph(db) is not updated
+
+
+def test_get_dataset_graph_evicts_least_recently_used(
+    dataset_config: DatasetConfig, db: Session
+) -> None:
+    invalidate_dataset_graph_cache()
+    with mock.patch("fidesops.models.datasetconfig.MAX_CACHED_DATASET_GRAPHS", 2):
+        graph = get_dataset_graph(db)
+        empty = get_dataset_graph(db, [])
+        assert get_dataset_graph(db) is graph
+
+        # a third graph evicts the least recently used one
+        dataset_config.dataset["description"] = "Updated description"
+        dataset_config.save(db=db)
+        updated = get_dataset_graph(db)
+        assert updated is not graph
+        assert get_dataset_graph(db, []) is not empty
+    invalidate_dataset_graph_cache()
+
+
 def test_convert_dataset_to_graph_no_collections(example_datasets):
     dataset_json = example_datasets[0].copy()
     dataset_json["collections"] = []
@@ -0,0 +1,124 @@
+from typing import List
+from unittest import mock
+
+from fidesops.models.connectionconfig import (
+    AccessLevel,
+    ConnectionConfig,
+    ConnectionType,
+)
+from fidesops.service.connectors import get_connector
+from fidesops.service.connectors.client_registry import ClientRegistry
+
+
+def make_config(**kwargs) -> ConnectionConfig:
+    return ConnectionConfig(
+        key="postgres_db",
+        connection_type=ConnectionType.postgres,
+        access=AccessLevel.write,
+        secrets={"host": "localhost"},
+        **kwargs,
+    )
+
+
+class TestClientRegistry:
+    def test_clients_shared_until_config_changes(self) -> None:
+        registry = ClientRegistry()
+        disposed: List[object] = []
+        config = make_config(id="cfg_1")
+
+        first = registry.get(config, object, disposed.append)
+        assert registry.get(config, object, disposed.append) is first
+        # a new config object for the same row shares the client
+        assert registry.get(make_config(id="cfg_1"), object, disposed.append) is first
+        for _ in range(3):
+            registry.release(first)
+        assert disposed == []
+
+        config.secrets = {"host": "elsewhere"}
+        second = registry.get(config, object, disposed.append)
+        assert second is not first
+        assert disposed == [first]
+        registry.release(second)
+
+        config.pool_size = 10
+        third = registry.get(config, object, disposed.append)
+        assert third is not second
+        assert disposed == [first, second]
+
+    def test_invalidate(self) -> None:
+        registry = ClientRegistry()
+        disposed: List[object] = []
+        config = make_config(id="cfg_1")
+        other = make_config(id="cfg_2")
+
+        first = registry.get(config, object, disposed.append)
+        other_client = registry.get(other, object, disposed.append)
+        registry.release(first)
+        registry.invalidate(config.id)
+        registry.invalidate("not_registered")
+        assert disposed == [first]
+        assert registry.get(config, object, disposed.append) is not first
+        assert registry.get(other, object, disposed.append) is other_client
+
+        # clients still in use are disposed of once released
+        registry.clear()
+        assert len(disposed) == 1
+        registry.release(other_client)
+        assert len(disposed) == 1
+        registry.release(other_client)
+        assert disposed[1] is other_client
+
+    def test_replaced_clients_disposed_once_released(self) -> None:
+        registry = ClientRegistry()
+        disposed: List[object] = []
+        config = make_config(id="cfg_1")
+
+        first = registry.get(config, object, disposed.append)
+        assert registry.get(config, object, disposed.append) is first
+        registry.release(first)
+
+        # the replaced client is still in use, so is left open
+        config.secrets = {"host": "elsewhere"}
+        second = registry.get(config, object, disposed.append)
+        assert disposed == []
+        registry.release(first)
+        assert disposed == [first]
+
+        registry.release(second)
+        registry.invalidate(config.id)
+        assert disposed == [first, second]
+
+    def test_unsaved_configs_not_shared(self) -> None:
+        registry = ClientRegistry()
+        config = make_config()
+        dispose = mock.Mock()
+        client = registry.get(config, object, dispose)
+        assert client is not registry.get(config, object, mock.Mock())
+
+        # a client that is not shared is disposed of as soon as it is released
+        registry.release(client)
+        dispose.assert_called_once_with(client)
+
+
+def test_sql_connectors_share_engines() -> None:
+    config = make_config(id="cfg_shared", pool_size=2, pool_pre_ping=True)
+    first = get_connector(config)
+    second = get_connector(config)
+    with mock.patch(
+        "fidesops.service.connectors.base_connector.client_registry",
+        ClientRegistry(),
+    ) as registry:
+        engine = first.client()
+        assert second.client() is engine
+        assert engine.pool.size() == 2
+        assert engine.pool._pre_ping
+
+        # closing a connector leaves the shared engine open, and an invalidated engine is
+        # disposed of once the last connector using it is closed
+        with mock.patch.object(engine, "dispose") as dispose:
+            first.close()
+            assert not dispose.called
+            registry.invalidate(config.id)
+            assert not dispose.called
+            second.close()
+            assert dispose.called
@@ -1,5 +1,6 @@
 import json
 from typing import Dict, Any, Set, Optional
+from unittest import mock
 
 import pytest
 
@@ -20,13 +21,19 @@ from fidesops.schemas.masking.masking_secrets import MaskingSecretCache, SecretT
 from fidesops.schemas.saas.saas_config import SaaSConfig, ParamValue
 from fidesops.schemas.saas.shared_schemas import SaaSRequestParams, HTTPMethod
 from fidesops.service.connectors.saas_query_config import SaaSQueryConfig
-from fidesops.service.connectors.query_config import SQLQueryConfig, MongoQueryConfig
+from fidesops.core.config import config as fides_config
+from fidesops.service.connectors.query_config import (
+    MicrosoftSQLServerQueryConfig,
+    MongoQueryConfig,
+    SQLQueryConfig,
+)
 
 from fidesops.service.masking.strategy.masking_strategy_hash import (
     HashMaskingStrategy,
     HASH,
 )
 from fidesops.util.data_category import DataCategory
+from fidesops.util.tracing import SpanRecorder, recording_spans
 
 from ...task.traversal_data import (
     integration_db_graph,
@@ -137,6 +144,15 @@ class TestSQLQueryConfig:
         assert payment_card_node.typed_filtered_values({"id": [1, 2]}) == {
             "id": ["1", "2"]
         }
+        # values that are equal once cast are only queried once, and counted as duplicates
+        recorder = SpanRecorder("test_privacy_request")
+        with recording_spans(recorder):
+            assert payment_card_node.typed_filtered_values({"id": [1, "1", "2"]}) == {
+                "id": ["1", "2"]
+            }
+        assert [(span["name"], span["args"]) for span in recorder.spans] == [
+            ("duplicate_inputs", {"cast": 1})
+        ]
 
     def test_generated_sql_query(self):
         """Test that the generated query depends on the input set"""
@@ -184,6 +200,71 @@ class TestSQLQueryConfig:
             == "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE customer_id = :customer_id"
         )
 
+    def test_generate_queries_splits_input_values(self):
+        query_config = SQLQueryConfig(payment_card_node)
+        input_data = {"id": ["A", "B", "C"], "customer_id": ["V"]}
+        assert [str(q) for q in query_config.generate_queries(input_data)] == [
+            str(query_config.generate_query(input_data))
+        ]
+        assert query_config.generate_queries({"id": []}) == []
+
+        fides_config.execution.MAX_IN_LIST_SIZE = 2
+        try:
+            queries = query_config.generate_queries(input_data)
+        finally:
+            fides_config.execution.MAX_IN_LIST_SIZE = 1000
+        assert [str(q) for q in queries] == [
+            "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE id IN :id",
+            "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE id = :id OR customer_id = :customer_id",
+        ]
+        assert sorted(queries[0]._bindparams["id"].value) == ["A", "B"]
+        assert queries[1]._bindparams["id"].value == ("C",)
+
+    def test_in_list_size_capped_by_dialect(self):
+        assert SQLQueryConfig(payment_card_node).in_list_size() == 1000
+        assert MicrosoftSQLServerQueryConfig(payment_card_node).in_list_size() == 1000
+
+        fides_config.execution.MAX_IN_LIST_SIZE = 5000
+        try:
+            assert SQLQueryConfig(payment_card_node).in_list_size() == 5000
+            assert (
+                MicrosoftSQLServerQueryConfig(payment_card_node).in_list_size() == 2000
+            )
+        finally:
+            fides_config.execution.MAX_IN_LIST_SIZE = 1000
+
+    def test_deduplicate_rows(self):
+        rows = [
+            {"id": 1, "name": "A"},
+            {"id": 2, "name": "B"},
+            {"id": 1, "name": "A"},
+        ]
+        assert SQLQueryConfig(payment_card_node).deduplicate_rows(rows) == rows[:2]
+
+        # rows seen in earlier chunks are dropped too
+        seen = set()
+        query_config = SQLQueryConfig(payment_card_node)
+        assert query_config.deduplicate_rows(rows[:1], seen) == rows[:1]
+        assert query_config.deduplicate_rows(rows[1:], seen) == [rows[1]]
+
+        # without a primary key, rows are compared by all their values
+        address_node = traversal_nodes[CollectionAddress("postgres_example", "address")]
+        rows = [
+            {"city": "X", "tags": ["a"]},
+            {"city": "X", "tags": ["a"]},
+            {"city": "Y"},
+        ]
+        with mock.patch.object(
+            SQLQueryConfig,
+            "primary_key_field_paths",
+            new_callable=mock.PropertyMock,
+            return_value={},
+        ):
+            assert SQLQueryConfig(address_node).deduplicate_rows(rows) == [
+                rows[0],
+                rows[2],
+            ]
+
     def test_update_rule_target_fields(
         self, erasure_policy, example_datasets, connection_config
     ):
@@ -364,6 +445,35 @@ class TestSQLQueryConfig:
             text_clause._bindparams["email"].value == "*****"
         )  # String rewrite masking strategy
 
+    def test_generate_update_batches(
+        self, erasure_policy, example_datasets, connection_config
+    ):
+        dataset = FidesopsDataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+        config = SQLQueryConfig(customer_node)
+        rows = [{"name": f"Customer {i}", "id": i} for i in range(1, 6)]
+        # rows without a primary key cannot be updated
+        rows.append({"name": "Unknown customer"})
+
+        batches = list(
+            config.generate_update_batches(rows, erasure_policy, privacy_request, 2)
+        )
+        # all rows share one statement, run with the parameters of two rows at a time
+        assert [stmt.text for stmt, _ in batches] == [
+            "UPDATE customer SET name = :name WHERE id = :id"
+        ] * 3
+        assert [params for _, params in batches] == [
+            [{"name": None, "id": 1}, {"name": None, "id": 2}],
+            [{"name": None, "id": 3}, {"name": None, "id": 4}],
+            [{"name": None, "id": 5}],
+        ]
+
 
 class TestMongoQueryConfig:
     @pytest.fixture(scope="function")
@@ -735,7 +845,7 @@ class TestSaaSQueryConfig:
         assert prepared_request.path == "/3.0/lists/abc/members/123"
         assert prepared_request.query_params == {}
         assert prepared_request.json_body == {
-                "merge_fields": {"FNAME": "MASKED", "LNAME": "MASKED"},
+            "merge_fields": {"FNAME": "MASKED", "LNAME": "MASKED"},
         }
 
     def test_generate_update_stmt_custom_http_method(
@@ -771,7 +881,7 @@ class TestSaaSQueryConfig:
         assert prepared_request.path == "/3.0/lists/abc/members/123"
         assert prepared_request.query_params == {}
         assert prepared_request.json_body == {
-                "merge_fields": {"FNAME": "MASKED", "LNAME": "MASKED"},
+            "merge_fields": {"FNAME": "MASKED", "LNAME": "MASKED"},
         }
 
     def test_generate_update_stmt_with_request_body(
@@ -829,7 +939,7 @@ class TestSaaSQueryConfig:
                     "merge_fields": {"FNAME": "MASKED", "LNAME": "MASKED"},
                     "list_id": "abc",
                 }
-            }
+            },
         )
 
         # update with connector_param reference
@@ -1,4 +1,5 @@
 import pytest
+import threading
 import time
 from typing import Any, Dict, List, Set
 from unittest import mock
@@ -14,9 +15,13 @@ from sqlalchemy import (
 from sqlalchemy.orm import Session
 from pydantic import ValidationError
 
-from fidesops.common_exceptions import PrivacyRequestPaused, ClientUnsuccessfulException
+from fidesops.common_exceptions import (
+    PrivacyRequestPaused,
+    PrivacyRequestCanceled,
+    ClientUnsuccessfulException,
+)
 from fidesops.core.config import config
-from fidesops.models.policy import PolicyPreWebhook, ActionType
+from fidesops.models.policy import PolicyPostWebhook, PolicyPreWebhook, ActionType
 from fidesops.models.privacy_request import PrivacyRequestStatus
 from fidesops.schemas.external_https import SecondPartyResponseFormat
 from fidesops.db.session import get_db_session
@@ -37,6 +42,7 @@ from fidesops.service.masking.strategy.masking_strategy_factory import get_strat
 from fidesops.service.masking.strategy.masking_strategy_hmac import HmacMaskingStrategy
 from fidesops.service.privacy_request.request_runner_service import PrivacyRequestRunner
 from fidesops.util.async_util import wait_for
+from fidesops.util.collection_util import FIDESOPS_DO_NOT_MASK_INDEX
 from fidesops.util.data_category import DataCategory
 
 
@@ -76,6 +82,134 @@ def test_start_processing_doesnt_overwrite_started_processing_at(
     assert privacy_request.started_processing_at == before
 
 
+@mock.patch(
+    "fidesops.service.privacy_request.request_runner_service.run_access_request"
+)
+def test_canceled_privacy_request_is_not_run(
+    run_access_request_mock: Mock,
+    db: Session,
+    privacy_request: PrivacyRequest,
+    privacy_request_runner: PrivacyRequestRunner,
+) -> None:
+    privacy_request.cancel_processing(db)
+    wait_for(privacy_request_runner.submit())
+
+    assert not run_access_request_mock.called
+    db.refresh(privacy_request)
+    assert privacy_request.status == PrivacyRequestStatus.canceled
+
+
+@mock.patch(
+    "fidesops.service.privacy_request.request_runner_service.run_access_request"
+)
+def test_privacy_request_canceled_while_running(
+    run_access_request_mock: Mock,
+    db: Session,
+    privacy_request: PrivacyRequest,
+    privacy_request_runner: PrivacyRequestRunner,
+) -> None:
+    def cancel(**_: Any) -> None:
+        privacy_request.cancel_processing(db)
+        raise PrivacyRequestCanceled(
+            f"Privacy request {privacy_request.id} was canceled"
+        )
+
+    run_access_request_mock.side_effect = cancel
+    wait_for(privacy_request_runner.submit())
+
+    db.refresh(privacy_request)
+    # the canceled status is not overwritten when the run stops
+    assert privacy_request.status == PrivacyRequestStatus.canceled
+
+
+@mock.patch(
+    "fidesops.service.privacy_request.request_runner_service.run_access_request"
+)
+def test_privacy_request_canceled_while_finishing(
+    run_access_request_mock: Mock,
+    db: Session,
+    privacy_request: PrivacyRequest,
+    privacy_request_runner: PrivacyRequestRunner,
+) -> None:
+    run_access_request_mock.return_value = {}
+    run_webhooks = PrivacyRequestRunner.run_webhooks_and_report_status
+
+    def cancel_after_post_webhooks(*args: Any, **kwargs: Any) -> bool:
+        proceed = run_webhooks(*args, **kwargs)
+        if kwargs["webhook_cls"] == PolicyPostWebhook:
+            # canceled after the run last checked for a cancel, but before it finished
+            privacy_request.cancel_processing(db)
+        return proceed
+
+    with mock.patch.object(
+        PrivacyRequestRunner,
+        "run_webhooks_and_report_status",
+        side_effect=cancel_after_post_webhooks,
+    ):
+        privacy_request_runner.run(privacy_request.id)
+
+    db.refresh(privacy_request)
+    assert privacy_request.status == PrivacyRequestStatus.canceled
+
+
+@mock.patch("fidesops.service.privacy_request.request_runner_service.run_erasure")
+@mock.patch(
+    "fidesops.service.privacy_request.request_runner_service.run_access_request"
+)
+def test_erasure_given_access_results_from_memory(
+    run_access_request_mock: Mock,
+    run_erasure_mock: Mock,
+    db: Session,
+    privacy_request: PrivacyRequest,
+    erasure_policy,
+    privacy_request_runner: PrivacyRequestRunner,
+) -> None:
+    privacy_request.policy_id = erasure_policy.id
+    privacy_request.save(db)
+    results_with_placeholders = {
+        "postgres_example:customer": [
+            {"id": 1, "emails": [FIDESOPS_DO_NOT_MASK_INDEX, "customer-1@example.com"]}
+        ]
+    }
+    run_access_request_mock.return_value = results_with_placeholders
+
+    privacy_request_runner.run(privacy_request.id)
+
+    assert run_access_request_mock.call_args.kwargs["placeholders"]
+    # the erasure is handed the results the access request returned, rather than reading them from redis
+    assert (
+        run_erasure_mock.call_args.kwargs["access_request_data"]
+        is results_with_placeholders
+    )
+
+
+@mock.patch("fidesops.service.privacy_request.request_runner_service.upload")
+@mock.patch(
+    "fidesops.service.privacy_request.request_runner_service.run_access_request"
+)
+def test_privacy_request_stopped_when_lease_lost(
+    run_access_request_mock: Mock,
+    upload_mock: Mock,
+    db: Session,
+    privacy_request: PrivacyRequest,
+    privacy_request_runner: PrivacyRequestRunner,
+) -> None:
+    lease_lost = threading.Event()
+
+    def lose_lease(**kwargs: Any) -> Dict[str, List[Any]]:
+        assert kwargs["lease_lost"] is lease_lost
+        lease_lost.set()
+        return {}
+
+    run_access_request_mock.side_effect = lose_lease
+    privacy_request_runner.run(privacy_request.id, lease_lost=lease_lost)
+
+    # the worker now running the privacy request owns its uploads and status
+    assert not upload_mock.called
+    db.refresh(privacy_request)
+    assert privacy_request.status == PrivacyRequestStatus.in_processing
+
+
 def get_privacy_request_results(
     db,
     policy,
@@ -5,6 +5,7 @@ import pytest
 from fidesops.graph.config import FieldPath
 from fidesops.task.filter_element_match import (
     _expand_array_paths_to_preserve,
+    drop_placeholders,
     filter_element_match,
     _remove_paths_from_row,
 )
@@ -263,6 +264,36 @@ class TestFilterElementMatchReplaceIndices:
         }
 
 
+class TestDropPlaceholders:
+    def test_matches_deleting_elements(self, sample_data):
+        incoming_paths = {
+            FieldPath(
+                "F",
+            ): ["a"],
+            FieldPath("snacks"): ["pizza"],
+            FieldPath("thread", "comment"): ["com_0002"],
+        }
+        with_placeholders = filter_element_match(
+            copy.deepcopy(sample_data), incoming_paths, delete_elements=False
+        )
+        expected = filter_element_match(copy.deepcopy(sample_data), incoming_paths)
+
+        assert drop_placeholders(with_placeholders) == expected
+
+    def test_shares_unchanged_data(self):
+        row = {
+            "A": [FIDESOPS_DO_NOT_MASK_INDEX, {"B": 1}],
+            "C": {"D": [1, 2]},
+        }
+        dropped = drop_placeholders(row)
+
+        assert dropped == {"A": [{"B": 1}], "C": {"D": [1, 2]}}
+        assert row["A"] == [FIDESOPS_DO_NOT_MASK_INDEX, {"B": 1}]
+        assert dropped["A"][0] is row["A"][1]
+        assert dropped["C"] is row["C"]
+        assert drop_placeholders(row["C"]) is row["C"]
+
+
 class TestRemovePathsFromRowDeleteElements:
     """Test sub-method remove_paths_from_row. Non-matching targeted array elements are removed."""
 
@@ -0,0 +1,274 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from fidesops.common_exceptions import (
+    NoSuchExecutorException,
+    RetryTask,
+    TraversalError,
+)
+from fidesops.core.config import config
+from fidesops.task.graph_executor import (
+    AsyncioGraphExecutor,
+    SerialGraphExecutor,
+    ThreadPoolGraphExecutor,
+    get_executor,
+)
+
+
+def add(*values: int) -> int:
+    return sum(values)
+
+
+def fail(*_: int) -> int:
+    raise ValueError("task failed")
+
+
+diamond_graph = {
+    "a": (lambda: 1,),
+    "b": (add, "a", 10),
+    "c": (add, "a", 100),
+    "d": (add, "b", "c"),
+}
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        SerialGraphExecutor(),
+        ThreadPoolGraphExecutor(max_workers=2),
+        AsyncioGraphExecutor(max_workers=2),
+    ],
+)
+def test_dependency_outputs_are_passed_to_dependents(executor) -> None:
+    assert executor.get(diamond_graph, "d") == 112
+    assert executor.get(diamond_graph, "b") == 11
+
+
+def test_only_required_tasks_run() -> None:
+    calls: List[str] = []
+
+    def record(name: str) -> str:
+        calls.append(name)
+        return name
+
+    graph = {"a": (record, "a-run"), "b": (record, "b-run"), "c": (lambda x: x, "a")}
+    assert SerialGraphExecutor().get(graph, "c") == "a-run"
+    assert calls == ["a-run"]
+
+
+def test_non_key_arguments_passed_through() -> None:
+    rows = [{"id": 1}, {"id": 2}]
+    graph = {"a": (lambda r, n: r[:n], rows, 1), "b": (lambda x: x, "a")}
+    assert SerialGraphExecutor().get(graph, "b") == [{"id": 1}]
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_thread_executor_bounds_parallelism(max_workers) -> None:
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def slow() -> int:
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.05)
+        with lock:
+            running["now"] -= 1
+        return 1
+
+    graph = {f"task_{i}": (slow,) for i in range(8)}
+    graph["end"] = (add, *graph.keys())
+
+    assert ThreadPoolGraphExecutor(max_workers=max_workers).get(graph, "end") == 8
+    assert running["peak"] == max_workers
+
+
+def test_resource_limits() -> None:
+    lock = threading.Lock()
+    running = {"postgres": 0, "mongo": 0}
+    peak = {"postgres": 0, "mongo": 0}
+
+    def query(resource: str) -> int:
+        with lock:
+            running[resource] += 1
+            peak[resource] = max(peak[resource], running[resource])
+        time.sleep(0.05)
+        with lock:
+            running[resource] -= 1
+        return 1
+
+    graph = {f"postgres_{i}": (query, "postgres") for i in range(6)}
+    graph.update({f"mongo_{i}": (query, "mongo") for i in range(3)})
+    graph["end"] = (add, *graph.keys())
+    task_resources = {key: key.split("_")[0] for key in graph if key != "end"}
+
+    assert (
+        ThreadPoolGraphExecutor(max_workers=4).get(
+            graph, "end", task_resources, {"postgres": 1}
+        )
+        == 9
+    )
+    assert peak["postgres"] == 1
+    # the saturated postgres connection does not hold back the mongo tasks
+    assert peak["mongo"] == 3
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        SerialGraphExecutor(),
+        ThreadPoolGraphExecutor(max_workers=2),
+        AsyncioGraphExecutor(max_workers=2),
+    ],
+)
+def test_task_exceptions_are_raised(executor) -> None:
+    graph = {"a": (add, 1), "b": (fail, "a"), "c": (add, "b")}
+    with pytest.raises(ValueError):
+        executor.get(graph, "c")
+
+
+def test_asyncio_executor_runs_coroutines() -> None:
+    running = {"now": 0, "peak": 0}
+    loop_threads = set()
+
+    async def wait(value: int) -> int:
+        loop_threads.add(threading.get_ident())
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.05)
+        running["now"] -= 1
+        return value
+
+    graph = {f"task_{i}": (wait, i) for i in range(8)}
+    # plain callables are mixed in, and run on threads rather than the loop
+    graph["total"] = (add, *graph.keys())
+    graph["end"] = (wait, "total")
+
+    assert AsyncioGraphExecutor(max_workers=4).get(graph, "end") == 28
+    assert running["peak"] == 4
+    assert len(loop_threads) == 1
+
+
+def test_asyncio_executor_runs_more_coroutines_than_threads() -> None:
+    running = {"now": 0, "peak": 0}
+
+    async def wait(value: int) -> int:
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.05)
+        running["now"] -= 1
+        return value
+
+    graph = {f"task_{i}": (wait, i) for i in range(50)}
+    graph["total"] = (add, *graph.keys())
+
+    executor = AsyncioGraphExecutor(max_threads=2)
+    assert executor.max_workers == config.execution.TASK_MAX_COROUTINES
+    assert executor.get(graph, "total") == sum(range(50))
+    # every coroutine was in flight at once, though only two threads were available
+    assert running["peak"] == 50
+
+
+def test_asyncio_executor_cancels_on_failure() -> None:
+    finished: List[str] = []
+
+    async def slow() -> int:
+        await asyncio.sleep(1)
+        finished.append("slow")
+        return 1
+
+    async def failing() -> int:
+        raise ValueError("task failed")
+
+    graph = {"a": (slow,), "b": (failing,), "c": (add, "a", "b")}
+    with pytest.raises(ValueError):
+        AsyncioGraphExecutor(max_workers=2).get(graph, "c")
+    assert finished == []
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        SerialGraphExecutor(),
+        ThreadPoolGraphExecutor(max_workers=1),
+        AsyncioGraphExecutor(max_workers=1),
+    ],
+)
+def test_retried_tasks_do_not_block_others(executor) -> None:
+    calls: List[str] = []
+
+    def flaky(value: int) -> int:
+        calls.append("flaky")
+        if calls.count("flaky") < 3:
+            raise RetryTask(0.05)
+        return value
+
+    def record(value: int) -> int:
+        calls.append("other")
+        return value
+
+    graph = {
+        "a": (lambda: 1,),
+        "flaky": (flaky, "a"),
+        "other": (record, "a"),
+        "end": (add, "flaky", "other"),
+    }
+    assert executor.get(graph, "end") == 2
+    # the other task ran while the flaky task waited to be retried, with one worker
+    assert calls == ["flaky", "other", "flaky", "flaky"]
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        SerialGraphExecutor(),
+        ThreadPoolGraphExecutor(max_workers=2),
+        AsyncioGraphExecutor(max_workers=2),
+    ],
+)
+def test_tasks_without_input_data_are_skipped(executor) -> None:
+    calls: List[str] = []
+    skipped: List[List[str]] = []
+
+    def query(name: str, *inputs: List[int]) -> List[int]:
+        calls.append(name)
+        return [value for rows in inputs for value in rows]
+
+    graph = {
+        "root": (lambda: [1],),
+        "empty": (query, "query empty"),
+        "child": (query, "query child", "empty"),
+        "grandchild": (query, "query grandchild", "child"),
+        "mixed": (query, "query mixed", "empty", "root"),
+        "end": (lambda *outputs: list(outputs), "grandchild", "mixed"),
+    }
+    assert executor.get(graph, "end", on_skipped=skipped.append) == [[], [1]]
+    assert sorted(calls) == ["query empty", "query mixed"]
+    # the subtree is skipped in one go
+    assert skipped == [["child", "grandchild"]]
+
+    # without a callback, every task runs
+    calls.clear()
+    assert executor.get(graph, "end") == [[], [1]]
+    assert len(calls) == 4
+
+
+def test_unsatisfiable_graph() -> None:
+    graph = {"a": (add, "b"), "b": (add, "a")}
+    with pytest.raises(TraversalError):
+        SerialGraphExecutor().get(graph, "a")
+
+
+def test_get_executor() -> None:
+    assert isinstance(get_executor("serial"), SerialGraphExecutor)
+    assert get_executor("thread", 3).max_workers == 3
+    assert get_executor("asyncio").runs_coroutines
+    assert not get_executor("thread").runs_coroutines
+    assert SerialGraphExecutor(5).max_workers == 1
+
+    with pytest.raises(NoSuchExecutorException):
+        get_executor("process")
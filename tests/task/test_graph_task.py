@@ -1,6 +1,10 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
 import pytest
 
-import dask
 from bson import ObjectId
 
 from fidesops.graph.config import (
@@ -11,12 +15,15 @@ from fidesops.graph.graph import DatasetGraph
 from fidesops.graph.traversal import Traversal
 from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
 from fidesops.models.policy import Policy, ActionType, RuleTarget, Rule
+from fidesops.service.connectors import PostgreSQLConnector
 from fidesops.task.graph_task import (
     collect_queries,
     TaskResources,
     EMPTY_REQUEST,
     build_affected_field_logs,
 )
+from fidesops.util.collection_util import FIDESOPS_DO_NOT_MASK_INDEX
+from fidesops.util.tracing import SpanRecorder, recording_spans
 from .traversal_data import (
     sample_traversal,
     combined_mongo_postgresql_graph,
@@ -29,7 +36,6 @@ from ..graph.graph_test_util import (
     erasure_policy,
 )
 
-dask.config.set(scheduler="processes")
 
 connection_configs = [
     ConnectionConfig(key="mysql", connection_type=ConnectionType.postgres),
@@ -250,13 +256,15 @@ class TestPreProcessInputData:
 
     def test_pre_process_input_data_group_dependent_fields(self):
         """Test processing inputs where several reference fields and an identity field have
-         been marked as dependent.
+        been marked as dependent.
         """
         traversal_with_grouped_inputs = traversal_paired_dependency()
         n = traversal_with_grouped_inputs.traversal_node_dict[
             CollectionAddress("mysql", "User")
         ]
-        task = MockSqlTask(n, TaskResources(EMPTY_REQUEST, Policy(), connection_configs))
+        task = MockSqlTask(
+            n, TaskResources(EMPTY_REQUEST, Policy(), connection_configs)
+        )
 
         project_output = [
             {
@@ -281,7 +289,7 @@ class TestPreProcessInputData:
         assert task.pre_process_input_data(identity_output, project_output) == {
             "email": ["email@gmail.com"],
             "project": ["abcde", "fghij", "klmno"],
-            "organization": ["12345", "54321", "54321"],
+            "organization": ["12345", "54321"],
             "fidesops_grouped_inputs": [],
         }
 
@@ -309,6 +317,44 @@ class TestPreProcessInputData:
             ]
         }
 
+    def test_consolidate_input_data(self):
+        """Both views of the input are built in one pass, with duplicate values dropped"""
+        n = traversal_paired_dependency().traversal_node_dict[
+            CollectionAddress("mysql", "User")
+        ]
+        task = MockSqlTask(
+            n, TaskResources(EMPTY_REQUEST, Policy(), connection_configs)
+        )
+        identity_output = [{"email": "email@gmail.com"}, {"email": "email@gmail.com"}]
+        project_output = [
+            {"organization_id": "12345", "project_id": "abcde"},
+            {"organization_id": "12345", "project_id": "abcde"},
+            {"organization_id": "54321", "project_id": "fghij"},
+        ]
+
+        recorder = SpanRecorder(EMPTY_REQUEST.id)
+        with recording_spans(recorder):
+            grouped, ungrouped = task.consolidate_input_data(
+                identity_output, project_output
+            )
+        assert ungrouped == {
+            "email": ["email@gmail.com"],
+            "project": ["abcde", "fghij"],
+            "organization": ["12345", "54321"],
+            "fidesops_grouped_inputs": [],
+        }
+        assert [group["project"] for group in grouped["fidesops_grouped_inputs"]] == [
+            ["abcde"],
+            ["fghij"],
+        ]
+        # the repeated group would have been looked up twice
+        assert [(span["name"], span["args"]) for span in recorder.spans] == [
+            ("duplicate_inputs", {"skipped": 1})
+        ]
+        assert grouped == task.pre_process_input_data(
+            identity_output, project_output, group_dependent_fields=True
+        )
+
 
 class TestPostProcessInputData:
     def test_post_process_input_data_filter_match(
@@ -382,6 +428,147 @@ class TestPostProcessInputData:
         }
 
 
+class TestChunkedAccessResults:
+    def test_default_retrieve_data_chunks(self, combined_traversal_node_dict):
+        node = combined_traversal_node_dict[
+            CollectionAddress("postgres_example", "customer")
+        ]
+        connector = PostgreSQLConnector(ConnectionConfig())
+        with mock.patch.object(
+            connector, "retrieve_data", return_value=[{"id": 1}, {"id": 2}, {"id": 3}]
+        ):
+            chunks = list(
+                connector.retrieve_data_chunks(
+                    node, Policy(), EMPTY_REQUEST, {}, chunk_size=2
+                )
+            )
+        assert chunks == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+
+    def test_access_request_processes_chunks(
+        self, combined_traversal_node_dict, make_graph_task
+    ):
+        node = combined_traversal_node_dict[CollectionAddress("mongo_test", "flights")]
+        task = make_graph_task(node)
+        chunks = [
+            [
+                {
+                    "id": 1,
+                    "pilots": ["1", "2"],
+                    "plane": 10,
+                    "passenger_information": {"passenger_ids": ["A111-11111", "X"]},
+                }
+            ],
+            [
+                {
+                    "id": 2,
+                    "pilots": ["3"],
+                    "passenger_information": {"passenger_ids": ["Y", "A111-11111"]},
+                }
+            ],
+        ]
+        customer_details = [{"travel_identifiers": ["A111-11111"]}]
+        rows = [row for chunk in chunks for row in chunk]
+        with mock.patch.object(
+            task.connector, "retrieve_data_chunks", return_value=iter(chunks)
+        ), mock.patch.object(task.resources, "write_execution_log"), mock.patch.object(
+            task.resources, "cache_results_with_placeholders"
+        ) as cache_placeholders:
+            output = task.access_request(
+                *[
+                    customer_details
+                    if key == CollectionAddress("mongo_test", "customer_details")
+                    else []
+                    for key in task.input_keys
+                ]
+            )
+
+        # the rows retrieved are filtered in place and cached without being copied
+        placeholders = cache_placeholders.call_args[0][1]
+        assert len(placeholders) == 2
+        assert all(cached is row for cached, row in zip(placeholders, rows))
+        assert [row["passenger_information"] for row in placeholders] == [
+            {"passenger_ids": ["A111-11111", FIDESOPS_DO_NOT_MASK_INDEX]},
+            {"passenger_ids": [FIDESOPS_DO_NOT_MASK_INDEX, "A111-11111"]},
+        ]
+
+        # only the fields that children read are handed on to them
+        assert task.output_keys == {"pilots", "plane"}
+        assert output == [{"pilots": ["1", "2"], "plane": 10}, {"pilots": ["3"]}]
+
+
+class TestAsyncAccessRequest:
+    def test_blocking_work_is_kept_off_the_event_loop(
+        self, combined_traversal_node_dict, make_graph_task
+    ):
+        node = combined_traversal_node_dict[CollectionAddress("mongo_test", "flights")]
+        task = make_graph_task(node)
+        blocking_calls = []
+
+        def record_thread(*_, **__):
+            blocking_calls.append(threading.current_thread())
+
+        def retrieve_data_chunks(*_):
+            record_thread()
+            yield [{"id": 1}]
+
+        async def run():
+            return threading.current_thread(), await task.access_request_async(
+                *[[] for _ in task.input_keys]
+            )
+
+        with mock.patch.object(
+            task.connector, "retrieve_data_chunks", side_effect=retrieve_data_chunks
+        ), mock.patch.object(
+            task.resources, "raise_if_halted", side_effect=record_thread
+        ), mock.patch.object(
+            task.resources, "write_execution_log", side_effect=record_thread
+        ), mock.patch.object(
+            task.resources, "cache_results_with_placeholders", side_effect=record_thread
+        ), mock.patch.object(
+            task.resources, "cache_checkpoint", side_effect=record_thread
+        ):
+            loop_thread, output = asyncio.run(run())
+
+        assert output == [{}]
+        # halt check, start and end logs, streamed rows, cached results and checkpoint
+        assert len(blocking_calls) == 6
+        assert loop_thread not in blocking_calls
+
+    def test_streamed_retrieval_is_timed(
+        self, combined_traversal_node_dict, make_graph_task
+    ):
+        node = combined_traversal_node_dict[CollectionAddress("mongo_test", "flights")]
+        task = make_graph_task(node)
+
+        def retrieve_data_chunks(*_):
+            time.sleep(0.05)
+            yield [{"id": 1}]
+
+        async def run():
+            await task.access_request_async(*[[] for _ in task.input_keys])
+            return threading.get_ident()
+
+        with mock.patch.object(
+            task.connector, "retrieve_data_chunks", side_effect=retrieve_data_chunks
+        ), mock.patch.object(task.resources, "raise_if_halted"), mock.patch.object(
+            task.resources, "write_execution_log"
+        ), mock.patch.object(
+            task.resources, "cache_results_with_placeholders"
+        ), mock.patch.object(
+            task.resources, "cache_checkpoint"
+        ):
+            loop_thread = asyncio.run(run())
+
+        # retrieval is timed as the rows are read off the loop, not as the loop starts it
+        retrieval = [
+            span
+            for span in task.resources.spans.spans
+            if span["name"] == "retrieve_data"
+        ]
+        assert all(span["tid"] != loop_thread for span in retrieval)
+        assert sum(span["dur"] for span in retrieval) >= 50_000
+
+
 def test_sql_dry_run_queries() -> None:
     traversal = sample_traversal()
     env = collect_queries(
@@ -0,0 +1,264 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from fidesops.graph.config import CollectionAddress
+from fidesops.models.policy import ActionType
+from fidesops.models.privacy_request import ExecutionLog, ExecutionLogStatus
+from fidesops.service.connectors.sql_connector import SQLConnector
+from fidesops.task.task_resources import (
+    BatchTaskResources,
+    CacheWriter,
+    ExecutionLogWriter,
+    TaskResources,
+)
+from fidesops.util.cache import get_masking_progress_cache_key
+from fidesops.util.collection_util import FIDESOPS_DO_NOT_MASK_INDEX
+
+
+def get_logs(db, privacy_request):
+    db.expire_all()
+    return (
+        ExecutionLog.query(db=db)
+        .filter(ExecutionLog.privacy_request_id == privacy_request.id)
+        .order_by(ExecutionLog.created_at.asc())
+        .all()
+    )
+
+
+def write_logs(resources: TaskResources, count: int) -> None:
+    for i in range(count):
+        resources.write_execution_log(
+            CollectionAddress("postgres_example", f"collection_{i}"),
+            [],
+            ActionType.access,
+            ExecutionLogStatus.in_processing,
+        )
+
+
+class TestExecutionLogWriter:
+    def test_logs_written_in_batches(self, db, policy, privacy_request) -> None:
+        resources = TaskResources(privacy_request, policy, [])
+        resources.execution_logs = ExecutionLogWriter(batch_size=3, flush_seconds=60)
+
+        with mock.patch.object(
+            resources.execution_logs, "flush", wraps=resources.execution_logs.flush
+        ) as flush:
+            write_logs(resources, 2)
+            assert get_logs(db, privacy_request) == []
+
+            write_logs(resources, 2)
+            assert len(get_logs(db, privacy_request)) == 3
+            assert flush.call_count == 1
+
+            resources.close()
+            assert flush.call_count == 2
+
+        logs = get_logs(db, privacy_request)
+        # logs keep the order they were written in, although batches share a transaction
+        assert [log.collection_name for log in logs] == [
+            "collection_0",
+            "collection_1",
+            "collection_0",
+            "collection_1",
+        ]
+        assert all(log.id.startswith("exe_") for log in logs)
+        assert logs[0].created_at < logs[1].created_at
+        assert logs[0].action_type == ActionType.access
+        assert logs[0].status == ExecutionLogStatus.in_processing
+
+    def test_logs_written_after_flush_seconds(
+        self, db, policy, privacy_request
+    ) -> None:
+        resources = TaskResources(privacy_request, policy, [])
+        resources.execution_logs = ExecutionLogWriter(batch_size=100, flush_seconds=0)
+
+        write_logs(resources, 1)
+        assert len(get_logs(db, privacy_request)) == 1
+
+    def test_logs_written_after_flush_seconds_without_another_write(
+        self, db, policy, privacy_request
+    ) -> None:
+        resources = TaskResources(privacy_request, policy, [])
+        resources.execution_logs = ExecutionLogWriter(batch_size=100, flush_seconds=0.2)
+
+        write_logs(resources, 1)
+        assert get_logs(db, privacy_request) == []
+
+        deadline = time.monotonic() + 5
+        while not get_logs(db, privacy_request) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert len(get_logs(db, privacy_request)) == 1
+        assert resources.execution_logs.pending == []
+
+    def test_logs_stay_queued_when_write_fails(
+        self, db, policy, privacy_request
+    ) -> None:
+        resources = TaskResources(privacy_request, policy, [])
+        resources.execution_logs = ExecutionLogWriter(batch_size=100, flush_seconds=60)
+        write_logs(resources, 1)
+
+        with mock.patch(
+            "fidesops.task.task_resources.get_db_session",
+            side_effect=ConnectionError("down"),
+        ):
+            with pytest.raises(ConnectionError):
+                resources.execution_logs.flush()
+
+        resources.close()
+        assert len(get_logs(db, privacy_request)) == 1
+
+    def test_logs_written_when_resources_closed_on_error(
+        self, db, policy, privacy_request
+    ) -> None:
+        try:
+            with TaskResources(privacy_request, policy, []) as resources:
+                resources.execution_logs = ExecutionLogWriter(
+                    batch_size=100, flush_seconds=60
+                )
+                write_logs(resources, 2)
+                raise ValueError("node failed")
+        except ValueError:
+            pass
+
+        assert len(get_logs(db, privacy_request)) == 2
+
+
+class TestCacheWriter:
+    def test_writes_in_background_in_order(self, cache) -> None:
+        writer = CacheWriter(cache)
+        release = threading.Event()
+        written = []
+
+        def set_encoded_objects(objects):
+            release.wait(5)
+            written.append(objects)
+
+        with mock.patch.object(cache, "set_encoded_objects", set_encoded_objects):
+            writer.write({"a": 1})
+            writer.write({"b": 2})
+            # the writes have not blocked the caller
+            assert written == []
+            release.set()
+            writer.close()
+
+        assert written == [{"a": 1}, {"b": 2}]
+        assert writer.pending == []
+
+    def test_flush_raises_write_errors(self, cache) -> None:
+        writer = CacheWriter(cache)
+        with mock.patch.object(
+            cache, "set_encoded_objects", side_effect=ConnectionError("down")
+        ):
+            writer.write({"a": 1})
+            with pytest.raises(ConnectionError):
+                writer.close()
+
+
+class TestResults:
+    def test_results_held_in_memory_and_cached(
+        self, cache, policy, privacy_request
+    ) -> None:
+        with TaskResources(privacy_request, policy, []) as resources:
+            resources.cache_results_with_placeholders(
+                "access_request__a:b",
+                [{"id": 1, "emails": [FIDESOPS_DO_NOT_MASK_INDEX, "a@example.com"]}],
+            )
+            resources.cache_skipped_results(["access_request__a:c"])
+            resources.cache_checkpoint("access_request__a:b")
+
+            with mock.patch.object(cache, "get_values") as get_values:
+                assert resources.get_results() == {
+                    "a:b": [{"id": 1, "emails": ["a@example.com"]}],
+                    "a:c": [],
+                }
+                assert resources.get_results(placeholders=True) == {
+                    "a:b": [
+                        {
+                            "id": 1,
+                            "emails": [FIDESOPS_DO_NOT_MASK_INDEX, "a@example.com"],
+                        }
+                    ],
+                    "a:c": [],
+                }
+                assert not get_values.called
+
+            # results were written before the checkpoint that refers to them
+            assert resources.get_checkpoints(ActionType.access) == {"a:b": None}
+            assert resources.get_all_cached_objects() == {
+                "a:b": [{"id": 1, "emails": ["a@example.com"]}],
+                "a:c": [],
+            }
+            assert resources.get_cached_results_with_placeholders() == {
+                "a:b": [
+                    {"id": 1, "emails": [FIDESOPS_DO_NOT_MASK_INDEX, "a@example.com"]}
+                ],
+                "a:c": [],
+            }
+
+        resources.clear_checkpoints()
+        cache.delete_keys_by_prefix(f"EN_{privacy_request.id}__")
+        cache.delete_keys_by_prefix(f"EN_PLACEHOLDER_RESULTS__{privacy_request.id}__")
+
+    def test_results_dropped_once_popped(self, cache, policy, privacy_request) -> None:
+        with TaskResources(privacy_request, policy, []) as resources:
+            resources.persist_results = False
+            resources.cache_results_with_placeholders(
+                "access_request__a:b",
+                [{"id": 1, "emails": [FIDESOPS_DO_NOT_MASK_INDEX, "a@example.com"]}],
+            )
+
+            assert resources.pop_results(placeholders=True) == {
+                "a:b": [
+                    {"id": 1, "emails": [FIDESOPS_DO_NOT_MASK_INDEX, "a@example.com"]}
+                ]
+            }
+            assert resources.placeholder_results == {}
+            assert resources.get_results() == {}
+
+    def test_results_written_when_log_flush_fails(
+        self, cache, policy, privacy_request
+    ) -> None:
+        resources = TaskResources(privacy_request, policy, [])
+        resources.execution_logs = ExecutionLogWriter(batch_size=100, flush_seconds=60)
+        resources.cache_object("access_request__a:b", [{"id": 1}])
+        write_logs(resources, 1)
+        with mock.patch(
+            "fidesops.task.task_resources.get_db_session",
+            side_effect=ConnectionError("down"),
+        ):
+            with pytest.raises(ConnectionError):
+                resources.close()
+
+        # the cache writer was still closed, after writing out what was queued
+        assert resources.cache_writer.pending == []
+        assert resources.get_all_cached_objects() == {"a:b": [{"id": 1}]}
+        cache.delete_keys_by_prefix(f"EN_{privacy_request.id}__")
+
+    def test_clear_checkpoints_clears_masking_progress(
+        self, cache, policy, privacy_request
+    ) -> None:
+        progress_key = get_masking_progress_cache_key(privacy_request.id, "a:b")
+        SQLConnector.save_masking_progress(cache, progress_key, ["[1]"], 1)
+        assert SQLConnector.get_masking_progress(cache, progress_key) == ({"[1]"}, 1)
+
+        with TaskResources(privacy_request, policy, []) as resources:
+            resources.cache_checkpoint("erasure_request__a:b")
+            resources.clear_checkpoints()
+
+            assert resources.get_checkpoints(ActionType.erasure) == {}
+            assert SQLConnector.get_masking_progress(cache, progress_key) == (set(), 0)
+
+    def test_batch_results_not_cached(self, cache, policy, privacy_request) -> None:
+        with BatchTaskResources([privacy_request], policy, []) as resources:
+            resources.cache_results_with_placeholders(
+                "access_request__a:b", [{"id": 1}]
+            )
+            resources.cache_checkpoint("access_request__a:b")
+
+            assert resources.get_results() == {"a:b": [{"id": 1}]}
+            assert resources.get_all_cached_objects() == {}
+            assert resources.get_checkpoints(ActionType.access) == {"a:b": None}
+            resources.clear()
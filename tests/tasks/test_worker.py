@@ -0,0 +1,230 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from fidesops.core.config import config
+from fidesops.service.privacy_request.request_runner_service import (
+    PrivacyRequestRunner,
+)
+from fidesops.tasks.worker import (
+    LEASES,
+    PENDING_QUEUE,
+    PrivacyRequestQueue,
+    PrivacyRequestWorker,
+)
+
+
+@pytest.fixture(scope="function")
+def queue(cache) -> PrivacyRequestQueue:
+    cache.delete(PENDING_QUEUE, LEASES)
+    yield PrivacyRequestQueue(cache)
+    cache.delete(PENDING_QUEUE, LEASES)
+
+
+class TestPrivacyRequestQueue:
+    def test_claim_in_order(self, queue) -> None:
+        first = queue.enqueue("pri_1")
+        second = queue.enqueue("pri_2", "webhook_1")
+        assert queue.pending_count() == 2
+
+        assert queue.claim(lease_seconds=60).job_id == first.job_id
+        claimed = queue.claim(lease_seconds=60)
+        assert claimed.job_id == second.job_id
+        assert claimed.from_webhook_id == "webhook_1"
+        assert queue.claim(lease_seconds=60) is None
+        assert queue.cache.zcard(LEASES) == 2
+
+    def test_heartbeat_and_complete(self, queue) -> None:
+        job = queue.enqueue("pri_1")
+        claimed = queue.claim(lease_seconds=60)
+        assert queue.heartbeat(claimed, lease_seconds=60)
+
+        queue.complete(claimed)
+        assert queue.cache.zcard(LEASES) == 0
+        # the lease is gone, so it cannot be extended
+        assert not queue.heartbeat(job, lease_seconds=60)
+
+    def test_requeue_expired(self, queue) -> None:
+        expiring = queue.enqueue("pri_1")
+        queue.enqueue("pri_2")
+        lapsed = queue.claim(lease_seconds=-1)
+        held = queue.claim(lease_seconds=60)
+        waiting = queue.enqueue("pri_3")
+
+        assert queue.requeue_expired() == 1
+        assert queue.pending_count() == 2
+        # expired jobs go to the front of the queue
+        reclaimed = queue.claim(lease_seconds=60)
+        assert reclaimed.job_id == expiring.job_id
+        assert queue.claim(lease_seconds=60).job_id == waiting.job_id
+        # the lapsed claim cannot extend or release the new one
+        assert not queue.heartbeat(lapsed, lease_seconds=60)
+        queue.complete(lapsed)
+        assert queue.heartbeat(reclaimed, lease_seconds=60)
+        assert queue.requeue_expired() == 0
+        assert queue.heartbeat(held, lease_seconds=60)
+
+
+class TestPrivacyRequestWorker:
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.run"
+    )
+    def test_run_next(self, run_mock, cache, queue, privacy_request) -> None:
+        queue.enqueue(privacy_request.id, "webhook_1")
+        worker = PrivacyRequestWorker(cache, concurrency=1, lease_seconds=60)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = worker.run_next(pool)
+            assert future is not None
+            future.result()
+
+        run_mock.assert_called_once_with(
+            privacy_request.id, "webhook_1", lease_lost=mock.ANY, started=False
+        )
+        assert worker.in_flight == {}
+        assert queue.pending_count() == 0
+        assert cache.zcard(LEASES) == 0
+
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.run"
+    )
+    def test_run_next_at_capacity(self, run_mock, cache, queue) -> None:
+        queue.enqueue("pri_1")
+        worker = PrivacyRequestWorker(cache, concurrency=1, lease_seconds=60)
+        worker.in_flight["running"] = queue.enqueue("pri_2")
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert worker.run_next(pool) is None
+
+        assert queue.pending_count() == 2
+        assert not run_mock.called
+
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.run"
+    )
+    def test_run_until_stopped(self, run_mock, cache, queue, privacy_request) -> None:
+        worker = PrivacyRequestWorker(
+            cache, concurrency=2, lease_seconds=60, poll_interval=0.01
+        )
+        run_mock.side_effect = lambda *_, **__: worker.stop()
+        queue.enqueue(privacy_request.id)
+
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        run_mock.assert_called_once_with(
+            privacy_request.id, None, lease_lost=mock.ANY, started=False
+        )
+        assert queue.pending_count() == 0
+        assert cache.zcard(LEASES) == 0
+
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.prefetch_access_results"
+    )
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.run"
+    )
+    def test_run_next_batch(
+        self, run_mock, prefetch_mock, cache, queue, privacy_request
+    ) -> None:
+        for _ in range(3):
+            queue.enqueue(privacy_request.id)
+        worker = PrivacyRequestWorker(
+            cache, concurrency=2, lease_seconds=60, batch_size=5
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            worker.run_next(pool).result()
+
+        # the batch is limited by the worker's free concurrency
+        prefetch_mock.assert_called_once_with([privacy_request.id] * 2)
+        # each request is run on its own, without running its pre-execution webhooks again
+        assert run_mock.call_count == 2
+        run_mock.assert_called_with(
+            privacy_request.id, None, lease_lost=mock.ANY, started=True
+        )
+        assert worker.in_flight == {}
+        assert queue.pending_count() == 1
+
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.run_webhooks_and_report_status",
+        return_value=False,
+    )
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.prefetch_access_results"
+    )
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.run"
+    )
+    def test_batch_requests_halted_by_webhooks_are_not_run(
+        self, run_mock, prefetch_mock, webhooks_mock, cache, queue, privacy_request
+    ) -> None:
+        for _ in range(2):
+            queue.enqueue(privacy_request.id)
+        worker = PrivacyRequestWorker(
+            cache, concurrency=2, lease_seconds=60, batch_size=2
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            worker.run_next(pool).result()
+
+        assert webhooks_mock.call_count == 2
+        prefetch_mock.assert_called_once_with([])
+        assert not run_mock.called
+        assert worker.in_flight == {}
+        assert cache.zcard(LEASES) == 0
+
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.run"
+    )
+    def test_request_stopped_when_lease_lost(
+        self, run_mock, cache, queue, privacy_request
+    ) -> None:
+        queue.enqueue(privacy_request.id)
+        worker = PrivacyRequestWorker(cache, concurrency=1, lease_seconds=60)
+
+        def lose_lease(*_, lease_lost, started) -> None:
+            # the lease lapses, and the request is claimed by another worker
+            for job in cache.zrange(LEASES, 0, -1):
+                cache.zadd(LEASES, {job: 0})
+            assert queue.requeue_expired() == 1
+            assert (
+                queue.claim(lease_seconds=60).privacy_request_id == privacy_request.id
+            )
+
+            worker.heartbeat()
+            assert lease_lost.is_set()
+
+        run_mock.side_effect = lose_lease
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            worker.run_next(pool).result()
+
+        assert run_mock.called
+        assert worker.in_flight == {}
+        assert worker.lease_lost == {}
+        # the other worker's lease is left in place
+        assert cache.zcard(LEASES) == 1
+
+    def test_missing_privacy_request_is_dropped(self, cache, queue) -> None:
+        job = queue.enqueue("not_a_privacy_request")
+        worker = PrivacyRequestWorker(cache, concurrency=1, lease_seconds=60)
+        worker.process(queue.claim(lease_seconds=60))
+
+        assert cache.zcard(LEASES) == 0
+        assert not queue.heartbeat(job, lease_seconds=60)
+
+
+def test_submit_enqueues_when_workers_enabled(cache, queue, privacy_request) -> None:
+    config.execution.WORKER_ENABLED = True
+    try:
+        assert PrivacyRequestRunner(cache, privacy_request).submit() is None
+    finally:
+        config.execution.WORKER_ENABLED = False
+
+    job = queue.claim(lease_seconds=60)
+    assert job.privacy_request_id == privacy_request.id
+    assert job.from_webhook_id is None
@@ -70,3 +70,17 @@ def test_scan(cache: FidesopsRedis) -> List:
     cache.delete_keys_by_prefix(f"EN_{prefix}")
     keys = cache.get_keys_by_prefix(f"EN_{prefix}")
     assert len(keys) == 0
+
+
+def test_set_encoded_objects(cache: FidesopsRedis) -> None:
+    prefix = f"redis_key_{random.random()}_"
+    test_data = {f"{prefix}{i}": CacheTestObject(i) for i in range(10)}
+    test_data[f"{prefix}empty"] = []
+
+    cache.set_encoded_objects(test_data)
+    assert cache.get_encoded_objects_by_prefix(prefix) == {
+        f"EN_{k}": v for k, v in test_data.items()
+    }
+    assert cache.ttl(f"EN_{prefix}0") > 0
+
+    cache.delete_keys_by_prefix(f"EN_{prefix}")
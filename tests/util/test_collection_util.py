@@ -2,7 +2,9 @@ from typing import Dict, List
 
 from fidesops.util.collection_util import (
     append,
+    append_unique,
     partition,
+    unique_key,
     filter_nonempty_values,
     merge_dicts,
 )
@@ -34,6 +36,30 @@ def test_append() -> None:  # d: Dict[T, List[U]], key: T, val: U) -> None:
     assert append_result("A", 1, {"B": [2]}) == {"A": [1], "B": [2]}
 
 
+def test_append_unique() -> None:
+    d: Dict[str, List] = {}
+    seen: Dict[str, set] = {}
+    append_unique(d, seen, "A", [1, 2, 1])
+    append_unique(d, seen, "A", [3, 2])
+    append_unique(d, seen, "B", [])
+    assert d == {"A": [1, 2, 3]}
+
+    # unhashable values are deduplicated too
+    assert append_unique(d, seen, "C", [{"x": 1}, {"x": 1}, {"x": 2}]) == 1
+    assert d["C"] == [{"x": 1}, {"x": 2}]
+
+    # values that are equal but of different types are kept apart
+    assert append_unique(d, seen, "D", [1, True, 1.0, "1", 1]) == 1
+    assert d["D"] == [1, True, 1.0, "1"]
+
+
+def test_unique_key() -> None:
+    assert unique_key(1) != unique_key(True)
+    assert unique_key([1, 2]) != unique_key((1, 2))
+    assert unique_key({"a": [1], "b": 2}) == unique_key({"b": 2, "a": [1]})
+    assert unique_key({"a": [1]}) != unique_key({"a": [True]})
+
+
 def test_partition() -> None:
     assert partition(["Aa", "Ab", "Ac", "Dc", "Dcc", "E", "Ef"], lambda x: x[0]) == {
         "A": ["Aa", "Ab", "Ac"],